@@ -1,17 +1,45 @@
 # app.py (Streamlit version)
 import streamlit as st
 from components.questionnaire import QuestionnaireManager
-from components.career_matcher import CareerMatcher
-from components.results_display import ResultsDisplay
+from components.catalog_manager import CatalogManager
 from utils.data_processor import DataProcessor
 from utils.recommendation_engine import RecommendationEngine
+from utils.result_cache import ResultCache
+from config.settings import Config
+
+
+@st.cache_resource
+def get_result_cache():
+    # Shared across reruns and sessions so duplicate answer sets skip the pipeline
+    return ResultCache(persist_path=Config.RESULT_CACHE_PATH)
+
+
+@st.cache_resource
+def get_catalog_manager():
+    # One catalog per process, hot-reloaded when its source files change
+    manager = CatalogManager()
+    cache = get_result_cache()
+    def on_swap(old_snapshot, new_snapshot):
+        # Results computed against the old catalog version can never be hit again
+        if new_snapshot.version != old_snapshot.version:
+            cache.clear()
+
+    manager.add_listener(on_swap)
+    # Streamlit runs this script off the main thread, where signal handlers cannot be
+    # installed; catalog reloads come from watching the source files instead
+    manager.start_watching()
+    return manager
 
 # Initialize components
 questionnaire_manager = QuestionnaireManager()
-career_matcher = CareerMatcher()
-results_display = ResultsDisplay()
+catalog_manager = get_catalog_manager()
 data_processor = DataProcessor()
 recommendation_engine = RecommendationEngine()
+result_cache = get_result_cache()
+# Selection order of multiple-select answers does not change results, so it is left out of cache keys
+unordered_answer_keys = [
+    str(question['id']) for question in questionnaire_manager.questions if question['type'] == 'multiple_select'
+]
 
 # Session state to manage progress
 if 'current_question' not in st.session_state:
@@ -65,9 +93,21 @@ if st.session_state.assessment_started:
         st.write("Assessment Complete! Processing your results...")
         
         processed_data = data_processor.process_answers(st.session_state.answers)
-        personality_profile = career_matcher.analyze_personality(processed_data)
-        career_matches = recommendation_engine.get_recommendations(personality_profile, processed_data)
-        formatted_results = results_display.format_results(personality_profile, career_matches)
+        # Pin one catalog snapshot for the whole pipeline, even if a reload swaps it meanwhile
+        catalog_snapshot = catalog_manager.snapshot
+        career_matcher = catalog_snapshot.career_matcher
+        results_display = catalog_snapshot.results_display
+
+        def run_pipeline():
+            personality_profile = career_matcher.analyze_personality(processed_data)
+            career_matches = recommendation_engine.get_recommendations(personality_profile, processed_data)
+            formatted_results = results_display.format_results(personality_profile, career_matches)
+            return personality_profile, career_matches, formatted_results
+
+        cache_key = result_cache.make_key(processed_data, catalog_snapshot.version, unordered_answer_keys)
+        personality_profile, career_matches, formatted_results = result_cache.get_or_compute(
+            cache_key, run_pipeline
+        )
 
         # Display Results
         st.write("### Your Personality Profile")
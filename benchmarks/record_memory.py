@@ -0,0 +1,76 @@
+# benchmarks/record_memory.py
+"""Memory and access-time comparison of dict vs slotted record representations
+
+Run from the repository root:  python -m benchmarks.record_memory
+(or python benchmarks/record_memory.py)
+"""
+import copy
+import os
+import sys
+import timeit
+import tracemalloc
+
+if __package__ in (None, ''):
+    # Run as a script: make the repository root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.career_database import CareerDatabase
+from data.records import Career
+
+CATALOG_COPIES = 1000
+
+
+def measure(build):
+    """Bytes allocated by build() and still alive afterwards"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    value = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, value
+
+
+def main():
+    raw_careers = CareerDatabase()._initialize_careers()
+    freeze_questions, raw_questions = _raw_questions()
+
+    dict_bytes, _ = measure(lambda: [copy.deepcopy(raw_careers) for _ in range(CATALOG_COPIES)])
+    record_bytes, _ = measure(lambda: [
+        {career_id: Career.from_dict(career) for career_id, career in copy.deepcopy(raw_careers).items()}
+        for _ in range(CATALOG_COPIES)
+    ])
+    _report(f"{len(raw_careers)} careers x {CATALOG_COPIES}", dict_bytes, record_bytes)
+
+    if raw_questions:
+        dict_bytes, _ = measure(lambda: [copy.deepcopy(raw_questions) for _ in range(CATALOG_COPIES)])
+        record_bytes, _ = measure(lambda: [
+            freeze_questions(copy.deepcopy(raw_questions))
+            for _ in range(CATALOG_COPIES)
+        ])
+        _report(f"{len(raw_questions)} questions x {CATALOG_COPIES}", dict_bytes, record_bytes)
+
+    career_dict = raw_careers['software_engineer']
+    career_record = Career.from_dict(career_dict)
+    print("access (1M reads):")
+    print(f"  dict['skills_required']   {timeit.timeit(lambda: career_dict['skills_required'], number=1000000):.3f}s")
+    print(f"  record['skills_required'] {timeit.timeit(lambda: career_record['skills_required'], number=1000000):.3f}s")
+    print(f"  record.skills_required    {timeit.timeit(lambda: career_record.skills_required, number=1000000):.3f}s")
+    print(f"  dict.get('aliases')       {timeit.timeit(lambda: career_dict.get('aliases'), number=1000000):.3f}s")
+    print(f"  record.get('aliases')     {timeit.timeit(lambda: career_record.get('aliases'), number=1000000):.3f}s")
+    print(f"  record.aliases (unset)    {timeit.timeit(lambda: career_record.aliases, number=1000000):.3f}s")
+
+
+def _raw_questions():
+    # QuestionnaireManager builds and freezes its question list without needing an instance
+    from components.questionnaire import QuestionnaireManager
+    manager = QuestionnaireManager.__new__(QuestionnaireManager)
+    return manager._freeze_questions, manager._initialize_questions()
+
+
+def _report(label, dict_bytes, record_bytes):
+    saving = 1 - record_bytes / dict_bytes if dict_bytes else 0.0
+    print(f"{label}: dicts {dict_bytes / 1024:.0f} KiB, records {record_bytes / 1024:.0f} KiB ({saving:.0%} smaller)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+# components/career_index.py
+import numpy as np
+from sklearn.neighbors import NearestNeighbors
+
+
+class CareerTraitIndex:
+    """Nearest-neighbour index over career trait vectors for candidate retrieval
+
+    Careers are embedded as their required trait levels scaled by trait importance,
+    so the Manhattan distance to a user's scaled trait vector tracks how much the
+    personality match penalizes each career. A BallTree answers "closest careers to
+    this personality" in sub-linear time. Retrieval only sees personality, so
+    CareerMatcher adds every unretrieved career whose score bound still reaches
+    the k-th best retrieved score before scoring; the oversampling keeps that
+    completion small.
+    """
+
+    def __init__(self, matching_engine, oversample=5, min_candidates=50, leaf_size=40):
+        self.matching_engine = matching_engine
+        self.oversample = oversample
+        self.min_candidates = min_candidates
+        self.scale = np.array([
+            matching_engine.trait_importance.get(trait, 1.0) for trait in matching_engine.traits
+        ])
+
+        has_profile = matching_engine.has_trait_profile
+        self.indexed_rows = np.flatnonzero(has_profile)
+        # Careers without trait data match every personality equally; always keep them
+        self.unindexed_rows = np.flatnonzero(~has_profile)
+
+        # Traits missing from a profile do not count in the match; embed them at the midpoint
+        levels = np.where(
+            matching_engine.trait_weights > 0, matching_engine.required_levels, 0.5
+        )[self.indexed_rows]
+
+        self.neighbors = None
+        if len(self.indexed_rows):
+            self.neighbors = NearestNeighbors(
+                algorithm='ball_tree', metric='manhattan', leaf_size=leaf_size
+            ).fit(levels * self.scale)
+
+    def query(self, user_personality, top_k):
+        """Catalog row indices of candidate careers for a top_k request, nearest first"""
+        wanted = max(top_k * self.oversample, self.min_candidates)
+        rows = self.unindexed_rows
+        if self.neighbors is not None:
+            n_neighbors = min(wanted, len(self.indexed_rows))
+            user_vector = self.matching_engine.encode_personality(user_personality) * self.scale
+            _, positions = self.neighbors.kneighbors(user_vector[np.newaxis, :], n_neighbors=n_neighbors)
+            rows = np.concatenate([self.indexed_rows[positions[0]], rows])
+        return rows
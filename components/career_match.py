@@ -0,0 +1,63 @@
+# components/career_match.py
+from collections.abc import Mapping
+
+
+class CareerMatch(Mapping):
+    """Read-only, dict-like match record whose detail fields are computed on first access
+
+    Eager fields (such as match_score) are stored directly. Lazy fields are
+    given as zero-argument loaders, evaluated the first time the key is read and
+    memoized on the record, so careers that are never displayed never pay for them.
+    Keys iterate in the given keys order, or eager fields first. Records may be
+    read from several threads: concurrent first reads of a field may each run
+    its loader, but all of them return the value stored first.
+    """
+
+    __slots__ = ('_keys', '_values', '_loaders')
+
+    def __init__(self, values, loaders=None, keys=None):
+        loaders = dict(loaders or {})
+        self._keys = tuple(keys) if keys is not None else (
+            tuple(values) + tuple(key for key in loaders if key not in values)
+        )
+        self._values = dict(values)
+        self._loaders = loaders
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        loader = self._loaders.get(key)
+        if loader is None:
+            # Either another thread just loaded the field, or it is unknown (KeyError, like a dict)
+            return self._values[key]
+        # Store the value before dropping the loader, so a reader always finds one of them
+        value = self._values.setdefault(key, loader())
+        self._loaders.pop(key, None)
+        return value
+
+    def __contains__(self, key):
+        return key in self._values or key in self._loaders
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def is_loaded(self, key):
+        """Whether a field has been computed yet"""
+        return key in self._values
+
+    def __repr__(self):
+        fields = ', '.join(
+            f"{key!r}: {self._values[key]!r}" if key in self._values else f"{key!r}: <lazy>"
+            for key in self._keys
+        )
+        return f"CareerMatch({{{fields}}})"
+
+    def __reduce__(self):
+        # Loaders are bound to the matcher; pickle a fully evaluated record instead
+        return (CareerMatch, (dict(self),))
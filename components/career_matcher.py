@@ -1,16 +1,23 @@
 from data.career_database import CareerDatabase
 from data.personality_traits import PersonalityTraits
 from data.skills_mapping import SkillsMapping
+from components.matching_engine import MatchingEngine
+from components.skill_index import SkillIndex, CareerSkillMatrix
+from components.match_bitsets import MatchBitsets
+from components.career_match import CareerMatch
+from components.career_index import CareerTraitIndex
+import heapq
 import math
+import numpy as np
 import statistics
 
 
 class CareerMatcher:
     """Matches user profiles with suitable careers using advanced algorithms"""
 
-    def __init__(self):
-        self.career_db = CareerDatabase()
-        self.personality_traits = PersonalityTraits()
+    def __init__(self, use_trait_index=False, career_db=None, personality_traits=None):
+        self.career_db = career_db or CareerDatabase()
+        self.personality_traits = personality_traits or PersonalityTraits()
         self.skills_mapping = SkillsMapping()
         self.matching_weights = {
             'personality': 0.35,
@@ -19,6 +26,82 @@ class CareerMatcher:
             'values': 0.15,
             'work_style': 0.05
         }
+        self.min_match_score = 0.25  # Only report careers with reasonable matches
+        self.skill_relations = self._initialize_skill_relations()
+        self.skill_index = SkillIndex(
+            [skill for career_info in self.career_db.get_all_careers().values()
+             for skill in career_info.skills_required],
+            self.skills_mapping.get_all_skill_names(),
+            self.skill_relations
+        )
+        self.match_bitsets = MatchBitsets(
+            self._initialize_interest_categories(),
+            self._initialize_value_weights(),
+            self._initialize_value_relations(),
+            self._initialize_style_factors()
+        )
+        self.matching_engine = MatchingEngine(
+            self.career_db, self.personality_traits, self.match_bitsets
+        )
+        self.skill_matrix = CareerSkillMatrix(self.skill_index, [
+            self.skill_index.required_ids(career_info.skills_required)
+            for career_info in map(self.career_db.get_career, self.matching_engine.career_ids)
+        ])
+        # User-independent bonus terms, compiled once per catalog
+        self.career_bonuses = self._compile_career_bonuses()
+        self.bonus_columns = self._compile_bonus_columns()
+        # Optional nearest-neighbour retrieval for top-k requests on large catalogs
+        self.trait_index = CareerTraitIndex(self.matching_engine) if use_trait_index else None
+
+    def _initialize_skill_relations(self):
+        """Initialize skill families used to relate differently named skills"""
+        return {
+            'python': ['programming', 'coding', 'software development'],
+            'javascript': ['web development', 'frontend', 'programming'],
+            'communication': ['presentation', 'writing', 'interpersonal'],
+            'leadership': ['management', 'team lead', 'supervision'],
+            'analytics': ['analysis', 'data analysis', 'statistics'],
+            'design': ['creative', 'visual design', 'ui/ux'],
+            'problem solving': ['critical thinking', 'analytical', 'troubleshooting']
+        }
+
+    def _initialize_interest_categories(self):
+        """Initialize interest categories used to credit related interests"""
+        return {
+            'technology': ['programming', 'computers', 'software', 'digital'],
+            'creative': ['art', 'design', 'writing', 'music', 'innovation'],
+            'people': ['helping', 'teaching', 'healthcare', 'social'],
+            'business': ['finance', 'marketing', 'sales', 'entrepreneurship'],
+            'science': ['research', 'analysis', 'experiments', 'data']
+        }
+
+    def _initialize_value_weights(self):
+        """Initialize relative importance of career values"""
+        return {
+            'helping_others': 1.2,
+            'stability': 1.1,
+            'growth': 1.1,
+            'creativity': 1.0,
+            'innovation': 1.0,
+            'flexibility': 0.9,
+            'achievement': 1.0,
+            'collaboration': 0.9
+        }
+
+    def _initialize_value_relations(self):
+        """Initialize user values that partially satisfy a career value"""
+        return {
+            'helping_others': ['service', 'impact', 'social_good'],
+            'stability': ['security', 'predictability', 'steady_income'],
+            'growth': ['advancement', 'learning', 'development'],
+            'creativity': ['innovation', 'artistic', 'original'],
+            'flexibility': ['work_life_balance', 'autonomy', 'freedom']
+        }
+
+    def _initialize_style_factors(self):
+        """Initialize work style factors compared between careers and users"""
+        return ['independent', 'collaborative', 'structured', 'flexible',
+                'detail_oriented', 'big_picture', 'fast_paced', 'methodical']
 
     def analyze_personality(self, processed_data):
         """Analyze user personality from processed data"""
@@ -28,63 +111,242 @@ class CareerMatcher:
         personality_profile = self.personality_traits.get_personality_profile(personality_scores)
         return personality_profile
 
-    def calculate_career_matches(self, personality_profile, processed_data):
-        """Calculate comprehensive match scores for all careers"""
-        career_matches = {}
-        all_careers = self.career_db.get_all_careers()
+    def calculate_career_matches(self, personality_profile, processed_data, top_k=None):
+        """Calculate comprehensive match scores for all careers
 
+        With top_k set, only the k best careers are returned (best first). Careers
+        whose score upper bound cannot reach the current k-th best are never
+        fully scored, and details are only built for the selected careers. When
+        the trait index is enabled, only careers it retrieves, plus those whose
+        bound could still beat the retrieved k-th best, are considered.
+        """
         # Extract data components
         skill_scores = processed_data.get('skills', {})
         interests = processed_data.get('interests', [])
         values = processed_data.get('values', [])
         work_style = processed_data.get('work_style', {})
 
-        for career_id, career_info in all_careers.items():
+        skill_matches = self.skill_index.best_matches(skill_scores)
+        user_bitsets = self.match_bitsets.encode_user(interests, values, work_style)
+
+        if top_k is not None:
+            candidates = np.arange(len(self.matching_engine.career_ids))
+            if self.trait_index is not None:
+                candidates = self._trait_index_candidates(
+                    top_k, personality_profile['scores'], skill_matches, user_bitsets, skill_scores
+                )
+            return self._calculate_top_career_matches(
+                top_k, candidates, self.career_db.get_all_careers(), skill_matches, user_bitsets,
+                personality_profile, skill_scores, interests, values, work_style
+            )
+
+        # The whole catalog is scored in array operations (the top-k bounds are the exact
+        # scores), so career records are only read for the matches that get displayed
+        personality_matches = self.matching_engine.personality_matches(personality_profile['scores'])
+        skills_matches = self.skill_matrix.skills_matches(skill_matches)
+        match_scores = self._calculate_match_upper_bounds(
+            np.arange(len(self.matching_engine.career_ids)), personality_matches, skills_matches,
+            user_bitsets, skill_scores
+        )
+
+        career_matches = {}
+        for career_id, match_score in zip(self.matching_engine.career_ids, match_scores.tolist()):
+            if match_score > self.min_match_score:
+                career_matches[career_id] = self._build_match_entry(
+                    career_id, match_score, personality_profile,
+                    skill_scores, interests, values, work_style
+                )
+
+        return career_matches
+
+    def _calculate_top_career_matches(self, top_k, candidates, all_careers, skill_matches,
+                                      user_bitsets, personality_profile, skill_scores,
+                                      interests, values, work_style):
+        """Select the top_k of the candidate careers, fully scoring only those that can still make the cut"""
+        career_ids = self.matching_engine.career_ids
+        personality_matches = self.matching_engine.personality_matches(
+            personality_profile['scores'], candidates
+        )
+        skills_matches = self.skill_matrix.skills_matches(skill_matches, candidates)
+        upper_bounds = self._calculate_match_upper_bounds(
+            candidates, personality_matches, skills_matches, user_bitsets, skill_scores
+        )
+
+        # Min-heap of (score, -index): the root is the current k-th best, and among
+        # equal scores the later catalog entry is evicted first, as a stable sort would
+        best = []
+        for position in np.argsort(-upper_bounds, kind='stable'):
+            bound = upper_bounds[position]
+            if bound <= self.min_match_score or top_k <= 0:
+                break
+            if len(best) == top_k and bound < best[0][0]:
+                break
+
+            index = candidates[position]
+            if len(best) == top_k and (bound, -int(index)) < best[0]:
+                continue  # Even scoring its bound it would lose the tie to the current k-th best
+            career_id = career_ids[index]
             match_score = self._calculate_individual_match(
-                career_id, career_info, personality_profile,
-                skill_scores, interests, values, work_style
+                career_id, all_careers[career_id], personality_profile,
+                skill_scores, interests, values, work_style,
+                personality_match=float(personality_matches[position]),
+                skills_match=float(skills_matches[position]),
+                user_bitsets=user_bitsets
             )
+            if match_score <= self.min_match_score:
+                continue
+
+            entry = (match_score, -int(index))
+            if len(best) < top_k:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
 
-            if match_score > 0.25:  # Only include careers with reasonable matches
-                career_matches[career_id] = {
-                    'career_info': career_info,
-                    'match_score': match_score,
-                    'match_breakdown': self._get_detailed_match_breakdown(
-                        career_info, personality_profile, skill_scores,
-                        interests, values, work_style
-                    ),
-                    'confidence_level': self._calculate_confidence_level(
-                        match_score, career_info
-                    ),
-                    'growth_potential': self._calculate_growth_potential(
-                        career_info, skill_scores
-                    )
-                }
+        career_matches = {}
+        for match_score, negative_index in sorted(best, reverse=True):
+            career_id = career_ids[-negative_index]
+            career_matches[career_id] = self._build_match_entry(
+                career_id, match_score, personality_profile,
+                skill_scores, interests, values, work_style
+            )
 
         return career_matches
 
+    def _trait_index_candidates(self, top_k, user_personality, skill_matches, user_bitsets, skill_scores):
+        """Catalog rows to consider for top_k: the trait index's retrieval, completed so the result is exact
+
+        The index retrieves by personality alone, so a career that wins on
+        skills, interests or values may not be retrieved. Every other career
+        whose optimistic bound reaches the k-th best retrieved score is added.
+        """
+        retrieved = self.trait_index.query(user_personality, top_k)
+        if top_k <= 0:
+            return retrieved
+
+        personality_matches = self.matching_engine.personality_matches(user_personality)
+        skills_matches = self.skill_matrix.skills_matches(skill_matches)
+        retrieved_scores = self._calculate_match_upper_bounds(
+            retrieved, personality_matches[retrieved], skills_matches[retrieved], user_bitsets, skill_scores
+        )
+        above_threshold = np.sort(retrieved_scores[retrieved_scores > self.min_match_score])
+        kth_score = above_threshold[-top_k] if len(above_threshold) >= top_k else self.min_match_score
+
+        others = np.setdiff1d(np.arange(len(self.matching_engine.career_ids)), retrieved)
+        optimistic_bounds = self._calculate_optimistic_bounds(
+            others, personality_matches[others], skills_matches[others], user_bitsets, skill_scores
+        )
+        return np.concatenate([retrieved, others[optimistic_bounds >= kth_score]])
+
+    def _build_match_entry(self, career_id, match_score, personality_profile,
+                           skill_scores, interests, values, work_style):
+        """Assemble the reported match record for one career
+
+        The career record is read from the catalog, and the breakdown,
+        confidence and growth fields computed, only when first accessed, so
+        a compiled catalog decodes only the careers that are displayed.
+        """
+        def career_info():
+            return self.career_db.get_career(career_id)
+
+        return CareerMatch(
+            {'match_score': match_score},
+            {
+                'career_info': career_info,
+                'match_breakdown': lambda: self._get_detailed_match_breakdown(
+                    career_id, career_info(), personality_profile,
+                    skill_scores, interests, values, work_style
+                ),
+                'confidence_level': lambda: self._calculate_confidence_level(match_score, career_info()),
+                'growth_potential': lambda: self._calculate_growth_potential(career_info(), skill_scores)
+            },
+            keys=('career_info', 'match_score', 'match_breakdown', 'confidence_level', 'growth_potential')
+        )
+
+    def calculate_batch_matches(self, personality_profiles, processed_profiles, top_k=10, rows=None):
+        """Score N respondents against every career in one call
+
+        Returns the career id order, an N x C matrix of match scores identical to
+        what calculate_career_matches computes per respondent, and each row's
+        top_k (career_id, score) pairs above the match threshold. With rows set,
+        only those catalog rows are scored (one shard of the catalog).
+        """
+        if len(personality_profiles) != len(processed_profiles):
+            raise ValueError("personality_profiles and processed_profiles must have the same length")
+
+        engine = self.matching_engine
+        career_rows = np.arange(len(engine.career_ids)) if rows is None else np.asarray(rows, dtype=np.intp)
+        career_ids = [engine.career_ids[row] for row in career_rows]
+
+        user_matrix = np.array(
+            [engine.encode_personality(profile['scores']) for profile in personality_profiles]
+        ).reshape(len(personality_profiles), len(engine.traits))
+        personality_matrix = engine.personality_match_matrix(user_matrix, rows)
+
+        # Each respondent's scores come from array operations; no career record is read
+        scores = np.zeros((len(processed_profiles), len(career_ids)))
+        for row, processed_data in enumerate(processed_profiles):
+            skill_scores = processed_data.get('skills', {})
+            skills_matches = self.skill_matrix.skills_matches(
+                self.skill_index.best_matches(skill_scores), rows
+            )
+            user_bitsets = self.match_bitsets.encode_user(
+                processed_data.get('interests', []), processed_data.get('values', []),
+                processed_data.get('work_style', {})
+            )
+            scores[row] = self._calculate_match_upper_bounds(
+                career_rows, personality_matrix[row], skills_matches, user_bitsets, skill_scores
+            )
+
+        top_matches = [
+            [(career_ids[column], float(scores[row, column]))
+             for column in engine.top_k_indices(scores[row], top_k, self.min_match_score)]
+            for row in range(len(processed_profiles))
+        ]
+
+        return {
+            'career_ids': list(career_ids),
+            'scores': scores,
+            'top_matches': top_matches
+        }
+
     # ---------- Core Match Calculations ----------
 
     def _calculate_individual_match(self, career_id, career_info, personality_profile,
-                                    skill_scores, interests, values, work_style):
+                                    skill_scores, interests, values, work_style,
+                                    personality_match=None, skill_matches=None,
+                                    user_bitsets=None, skills_match=None):
         """Calculate comprehensive match score for individual career"""
 
         # Component scores
-        personality_match = self._calculate_personality_match(
-            career_id, personality_profile['scores']
-        )
-        skills_match = self._calculate_skills_match(
-            career_info.get('skills_required', []), skill_scores
-        )
-        interests_match = self._calculate_interests_match(
-            career_info.get('interests', []), interests
-        )
-        values_match = self._calculate_values_match(
-            career_info.get('values', []), values
-        )
-        work_style_match = self._calculate_work_style_match(
-            career_info.get('work_style', []), work_style
-        )
+        if personality_match is None:
+            personality_match = self._calculate_personality_match(
+                career_id, personality_profile['scores']
+            )
+        if skills_match is None:
+            skills_match = self._calculate_skills_match(
+                career_info.skills_required, skill_scores, skill_matches
+            )
+
+        if user_bitsets is None:
+            interests_match = self._calculate_interests_match(
+                career_info.interests, interests
+            )
+            values_match = self._calculate_values_match(
+                career_info.values, values
+            )
+            work_style_match = self._calculate_work_style_match(
+                career_info.work_style, work_style
+            )
+        else:
+            # Fast path: catalog careers are pre-encoded, the user once per request
+            career_bitsets = self.matching_engine.career_bitsets[
+                self.matching_engine.career_index[career_id]
+            ]
+            interests_match = self.match_bitsets.interests_match(career_bitsets[0], user_bitsets[0])
+            values_match = self.match_bitsets.values_match(career_bitsets[1], user_bitsets[1])
+            work_style_match = self.match_bitsets.work_style_match(
+                career_bitsets[2], career_bitsets[3], user_bitsets[2], user_bitsets[3]
+            )
 
         # Calculate weighted total with dynamic weight adjustment
         weights = self._adjust_weights_dynamically(
@@ -101,196 +363,56 @@ class CareerMatcher:
         )
 
         # Apply career-specific bonuses
-        total_match = self._apply_career_bonuses(total_match, career_info, skill_scores)
+        total_match = self._apply_career_bonuses(total_match, career_info, skill_scores, career_id)
 
         return min(1.0, max(0.0, total_match))
 
     def _calculate_personality_match(self, career_id, user_personality):
         """Calculate personality compatibility score with advanced matching"""
-        career_traits = self.personality_traits.career_trait_mappings.get(career_id, {})
-
-        if not career_traits:
-            return 0.5  # Neutral match if no data
-
-        total_match = 0
-        trait_importance = {
-            'conscientiousness': 1.2,
-            'openness': 1.1,
-            'extraversion': 1.0,
-            'agreeableness': 1.0,
-            'neuroticism': 0.9
-        }
-
-        total_weight = 0
-        for trait, required_level in career_traits.items():
-            user_level = user_personality.get(trait, 0.5)
+        engine = self.matching_engine
+        if career_id in engine.career_index:
+            # Score only this career's row of the compiled matrix, not the whole catalog
+            return float(engine.personality_matches(user_personality, [engine.career_index[career_id]])[0])
 
-            # Calculate match with tolerance
-            difference = abs(user_level - required_level)
-            if difference <= 0.1:
-                trait_match = 1.0
-            elif difference <= 0.2:
-                trait_match = 0.8
-            elif difference <= 0.4:
-                trait_match = 0.6
-            else:
-                trait_match = max(0.2, 1 - difference)
-
-            weight = trait_importance.get(trait, 1.0)
-            total_match += trait_match * weight
-            total_weight += weight
-
-        return total_match / total_weight if total_weight > 0 else 0.5
+        career_traits = self.personality_traits.career_trait_mappings.get(career_id, {})
+        return engine.score_trait_profile(career_traits, user_personality)
 
-    def _calculate_skills_match(self, required_skills, user_skills):
+    def _calculate_skills_match(self, required_skills, user_skills, skill_matches=None):
         """Calculate skills compatibility with skill level weighting"""
-        if not required_skills:
-            return 0.5
-
-        total_match = 0
-        matched_skills = 0
-
-        for required_skill in required_skills:
-            best_match = 0
-            skill_lower = required_skill.lower()
-
-            for user_skill, proficiency in user_skills.items():
-                if self._skills_are_related(skill_lower, user_skill.lower()):
-                    match_strength = self._calculate_skill_similarity(skill_lower, user_skill.lower())
-                    weighted_match = match_strength * proficiency
-                    best_match = max(best_match, weighted_match)
-
-            total_match += best_match
-            if best_match > 0.3:
-                matched_skills += 1
-
-        base_score = total_match / len(required_skills)
-        coverage_bonus = matched_skills / len(required_skills) * 0.2
-
-        return min(1.0, base_score + coverage_bonus)
+        if skill_matches is None:
+            skill_matches = self.skill_index.best_matches(user_skills)
+        return self.skill_index.skills_match(
+            self.skill_index.required_ids(required_skills), skill_matches
+        )
 
     def _skills_are_related(self, skill1, skill2):
         """Check if two skills are related"""
-        if skill1 == skill2 or skill1 in skill2 or skill2 in skill1:
-            return True
-
-        skill_relations = {
-            'python': ['programming', 'coding', 'software development'],
-            'javascript': ['web development', 'frontend', 'programming'],
-            'communication': ['presentation', 'writing', 'interpersonal'],
-            'leadership': ['management', 'team lead', 'supervision'],
-            'analytics': ['analysis', 'data analysis', 'statistics'],
-            'design': ['creative', 'visual design', 'ui/ux'],
-            'problem solving': ['critical thinking', 'analytical', 'troubleshooting']
-        }
-
-        for base_skill, related in skill_relations.items():
-            if base_skill in skill1 and any(rel in skill2 for rel in related):
-                return True
-            if base_skill in skill2 and any(rel in skill1 for rel in related):
-                return True
-
-        return False
+        return self.skill_index.similarity(skill1, skill2) > 0
 
     def _calculate_skill_similarity(self, skill1, skill2):
-        if skill1 == skill2:
-            return 1.0
-        elif skill1 in skill2 or skill2 in skill1:
-            return 0.8
-        else:
-            return 0.6
+        return self.skill_index.similarity(skill1, skill2) or 0.6
 
     def _calculate_interests_match(self, career_interests, user_interests):
-        if not career_interests or not user_interests:
-            return 0.5
-
-        career_set = set(career_interests)
-        user_set = set(user_interests)
-
-        direct_matches = len(career_set & user_set)
-
-        related_matches = 0
-        interest_categories = {
-            'technology': ['programming', 'computers', 'software', 'digital'],
-            'creative': ['art', 'design', 'writing', 'music', 'innovation'],
-            'people': ['helping', 'teaching', 'healthcare', 'social'],
-            'business': ['finance', 'marketing', 'sales', 'entrepreneurship'],
-            'science': ['research', 'analysis', 'experiments', 'data']
-        }
-
-        for category, keywords in interest_categories.items():
-            career_in_category = any(keyword in ' '.join(career_interests) for keyword in keywords)
-            user_in_category = any(keyword in ' '.join(user_interests) for keyword in keywords)
-            if career_in_category and user_in_category:
-                related_matches += 0.5
-
-        total_matches = direct_matches + related_matches
-        max_possible = len(career_interests)
-
-        return min(1.0, total_matches / max_possible) if max_possible > 0 else 0.5
+        return self.match_bitsets.interests_match(
+            self.match_bitsets.encode_interests(career_interests),
+            self.match_bitsets.encode_user_interests(user_interests)
+        )
 
     def _calculate_values_match(self, career_values, user_values):
-        if not career_values or not user_values:
-            return 0.5
-
-        value_weights = {
-            'helping_others': 1.2,
-            'stability': 1.1,
-            'growth': 1.1,
-            'creativity': 1.0,
-            'innovation': 1.0,
-            'flexibility': 0.9,
-            'achievement': 1.0,
-            'collaboration': 0.9
-        }
-
-        total_match = 0
-        total_weight = 0
-
-        for career_value in career_values:
-            weight = value_weights.get(career_value, 1.0)
-            if career_value in user_values:
-                total_match += 1.0 * weight
-            else:
-                related_match = self._find_related_values(career_value, user_values)
-                total_match += related_match * weight
-            total_weight += weight
-
-        return total_match / total_weight if total_weight > 0 else 0.5
+        return self.match_bitsets.values_match(
+            self.match_bitsets.encode_career_values(career_values),
+            self.match_bitsets.encode_user_values(user_values)
+        )
 
     def _find_related_values(self, target_value, user_values):
-        value_relations = {
-            'helping_others': ['service', 'impact', 'social_good'],
-            'stability': ['security', 'predictability', 'steady_income'],
-            'growth': ['advancement', 'learning', 'development'],
-            'creativity': ['innovation', 'artistic', 'original'],
-            'flexibility': ['work_life_balance', 'autonomy', 'freedom']
-        }
-        related_values = value_relations.get(target_value, [])
-        for user_value in user_values:
-            if user_value in related_values:
-                return 0.7
-        return 0.0
+        related_mask = self.match_bitsets.related_value_mask(target_value)
+        return 0.7 if related_mask & self.match_bitsets.encode_user_values(user_values) else 0.0
 
     def _calculate_work_style_match(self, career_work_style, user_work_style):
-        if not career_work_style or not user_work_style:
-            return 0.5
-
-        match_score = 0
-        total_factors = 0
-
-        style_factors = ['independent', 'collaborative', 'structured', 'flexible',
-                         'detail_oriented', 'big_picture', 'fast_paced', 'methodical']
-
-        for factor in style_factors:
-            if factor in career_work_style and factor in user_work_style:
-                career_level = user_work_style.get(factor, 0.5)
-                user_level = user_work_style.get(factor, 0.5)
-                factor_match = 1 - abs(career_level - user_level)
-                match_score += factor_match
-                total_factors += 1
-
-        return match_score / total_factors if total_factors > 0 else 0.5
+        return self.match_bitsets.work_style_match(
+            self.match_bitsets.encode_work_style(career_work_style), bool(career_work_style),
+            self.match_bitsets.encode_work_style(user_work_style), bool(user_work_style)
+        )
 
     # ---------- Weighting, Bonuses, Confidence ----------
 
@@ -314,44 +436,202 @@ class CareerMatcher:
 
         return base_weights
 
-    def _apply_career_bonuses(self, base_score, career_info, skill_scores):
-        bonus = 0
-        growth_outlook = career_info.get('growth_outlook', '').lower()
+    def _apply_career_bonuses(self, base_score, career_info, skill_scores, career_id=None):
+        static_bonuses = self.career_bonuses.get(career_id)
+        if static_bonuses is None:
+            static_bonuses = self._compute_static_bonuses(career_info)
+
+        bonus = static_bonuses['growth_bonus']
+        for skill_key in static_bonuses['high_demand_skill_keys']:
+            if skill_key in skill_scores:
+                bonus += 0.02
+        bonus += static_bonuses['salary_bonus']
+
+        return base_score + bonus
+
+    def _compile_career_bonuses(self):
+        """Precompute the bonus terms that depend only on the career"""
+        return {
+            career_id: self._compute_static_bonuses(career_info)
+            for career_id, career_info in self.career_db.get_all_careers().items()
+        }
+
+    def _compile_bonus_columns(self):
+        """The compiled bonuses as arrays in catalog row order, for bounding many careers at once"""
+        bonuses = [self.career_bonuses[career_id] for career_id in self.matching_engine.career_ids]
+        skill_keys = sorted({key for bonus in bonuses for key in bonus['high_demand_skill_keys']})
+        high_demand = np.zeros((len(bonuses), len(skill_keys)), dtype=bool)
+        for row, bonus in enumerate(bonuses):
+            for key in bonus['high_demand_skill_keys']:
+                high_demand[row, skill_keys.index(key)] = True
+        return {
+            'growth_bonus': np.array([bonus['growth_bonus'] for bonus in bonuses], dtype=float),
+            'salary_bonus': np.array([bonus['salary_bonus'] for bonus in bonuses], dtype=float),
+            'high_demand_skill_keys': skill_keys,
+            'high_demand': high_demand
+        }
+
+    def _compute_static_bonuses(self, career_info):
+        """Growth and salary bonuses plus the high-demand skill keys of one career"""
+        growth_bonus = 0
+        growth_outlook = career_info.growth_outlook.lower()
         if 'excellent' in growth_outlook:
-            bonus += 0.05
+            growth_bonus = 0.05
         elif 'good' in growth_outlook:
-            bonus += 0.02
+            growth_bonus = 0.02
 
-        high_demand_skills = ['python', 'machine learning', 'data analysis',
-                              'digital marketing', 'project management']
-        required_skills = [s.lower() for s in career_info.get('skills_required', [])]
-        for skill in high_demand_skills:
-            if any(skill in req for req in required_skills):
-                if skill.replace(' ', '_') in skill_scores:
-                    bonus += 0.02
-
-        salary_range = career_info.get('salary_range', {})
+        salary_bonus = 0
+        salary_range = career_info.salary_range
         if salary_range:
             senior_max = salary_range.get('senior', (0, 0))[1]
             if senior_max > 150000:
-                bonus += 0.03
+                salary_bonus = 0.03
 
-        return base_score + bonus
+        return {
+            'growth_bonus': growth_bonus,
+            'salary_bonus': salary_bonus,
+            'high_demand_skill_keys': self._get_high_demand_skill_keys(career_info)
+        }
+
+    def _get_high_demand_skill_keys(self, career_info):
+        """Skill score keys that earn this career's high-demand bonus when the user has them"""
+        high_demand_skills = ['python', 'machine learning', 'data analysis',
+                              'digital marketing', 'project management']
+        required_skills = [s.lower() for s in career_info.skills_required]
+        return [skill.replace(' ', '_') for skill in high_demand_skills
+                if any(skill in req for req in required_skills)]
+
+    def _calculate_match_upper_bounds(self, candidates, personality_matches, skills_matches,
+                                      user_bitsets, skill_scores):
+        """Upper bounds on _calculate_individual_match for the candidate catalog rows, in one pass
+
+        Every component is the exact one: personality and skills come in as
+        arrays, interests, values and work style are the cheap bitset terms,
+        and the dynamic weighting is looked up from the same thresholds. The
+        weighted sum and bonuses are taken in the same order as the full score,
+        so each bound is the career's score and only the top_k careers (plus
+        any tied with the k-th) get scored in full.
+        """
+        career_bitsets = self.matching_engine.career_bitsets
+        match_bitsets = self.match_bitsets
+        other_matches = np.array([
+            (match_bitsets.interests_match(career_bitsets[index][0], user_bitsets[0]),
+             match_bitsets.values_match(career_bitsets[index][1], user_bitsets[1]),
+             match_bitsets.work_style_match(career_bitsets[index][2], career_bitsets[index][3],
+                                            user_bitsets[2], user_bitsets[3]))
+            for index in candidates
+        ]).reshape(len(candidates), 3)
+        weights = self._dynamic_weight_rows(personality_matches, skills_matches)
+
+        total_match = (
+            personality_matches * weights[:, 0] +
+            skills_matches * weights[:, 1] +
+            other_matches[:, 0] * weights[:, 2] +
+            other_matches[:, 1] * weights[:, 3] +
+            other_matches[:, 2] * weights[:, 4]
+        )
+        return np.clip(total_match + self._career_bonus_array(candidates, skill_scores), 0.0, 1.0)
+
+    def _calculate_optimistic_bounds(self, rows, personality_matches, skills_matches, user_bitsets, skill_scores):
+        """Upper bounds on _calculate_individual_match for catalog rows, without any per-career call
+
+        Interests, values and work style are bounded from the compiled bitset
+        columns; a small slack covers the different summation order.
+        """
+        other_bounds = self.match_bitsets.match_bounds(
+            self.matching_engine.career_bound_columns, *user_bitsets, rows
+        )
+        weights = self._dynamic_weight_rows(personality_matches, skills_matches)
+        total_match = (
+            personality_matches * weights[:, 0] +
+            skills_matches * weights[:, 1] +
+            other_bounds[:, 0] * weights[:, 2] +
+            other_bounds[:, 1] * weights[:, 3] +
+            other_bounds[:, 2] * weights[:, 4]
+        )
+        return np.clip(total_match + self._career_bonus_array(rows, skill_scores) + 1e-9, 0.0, 1.0)
+
+    def _dynamic_weight_rows(self, personality_matches, skills_matches):
+        """Per-row component weights in matching_weights order, as _adjust_weights_dynamically gives them"""
+        # The weighting only depends on which of the two 0.8 thresholds are crossed
+        weight_table = np.array([
+            [weights[component] for component in ('personality', 'skills', 'interests', 'values', 'work_style')]
+            for weights in (self._adjust_weights_dynamically(personality, skills, 1.0, 1.0, 1.0)
+                            for personality in (0.0, 1.0) for skills in (0.0, 1.0))
+        ])
+        return weight_table[2 * (personality_matches > 0.8) + (skills_matches > 0.8)]
+
+    def _career_bonus_array(self, rows, skill_scores):
+        """Bonus of each catalog row for these skill scores, added up in _apply_career_bonuses' order"""
+        columns = self.bonus_columns
+        present = [column for column, key in enumerate(columns['high_demand_skill_keys']) if key in skill_scores]
+        demand_counts = columns['high_demand'][rows][:, present].sum(axis=1)
+        bonus = columns['growth_bonus'][rows]
+        for count in range(1, int(demand_counts.max(initial=0)) + 1):
+            bonus = bonus + np.where(demand_counts >= count, 0.02, 0.0)
+        return bonus + columns['salary_bonus'][rows]
+
+    def _get_detailed_match_breakdown(self, career_id, career_info, personality_profile,
+                                      skill_scores, interests, values, work_style):
+        """Per-component match scores behind a career's overall score"""
+        return {
+            'personality': self._calculate_personality_match(
+                career_id, personality_profile['scores']
+            ),
+            'skills': self._calculate_skills_match(
+                career_info.skills_required, skill_scores
+            ),
+            'interests': self._calculate_interests_match(
+                career_info.interests, interests
+            ),
+            'values': self._calculate_values_match(
+                career_info.values, values
+            ),
+            'work_style': self._calculate_work_style_match(
+                career_info.work_style, work_style
+            )
+        }
+
+    def _calculate_confidence_level(self, match_score, career_info):
+        """Describe how much to trust a match, given its score and how complete the career data is"""
+        profile_fields = ['skills_required', 'interests', 'values', 'work_style']
+        completeness = sum(1 for field in profile_fields if getattr(career_info, field)) / len(profile_fields)
+
+        if match_score >= 0.75 and completeness >= 0.75:
+            return 'High'
+        elif match_score >= 0.5 and completeness >= 0.5:
+            return 'Medium'
+        return 'Low'
+
+    def _calculate_growth_potential(self, career_info, skill_scores):
+        """Estimate room to grow in a career from its outlook and the user's current skill fit"""
+        growth_outlook = career_info.growth_outlook.lower()
+        if 'excellent' in growth_outlook:
+            outlook = 1.0
+        elif 'good' in growth_outlook:
+            outlook = 0.7
+        else:
+            outlook = 0.4
+
+        skills_match = self._calculate_skills_match(
+            career_info.skills_required, skill_scores
+        )
+        return round(outlook * (0.5 + 0.5 * skills_match), 2)
 
     # ---------- Public APIs ----------
 
     def get_top_matches(self, career_matches, limit=10):
-        sorted_matches = sorted(
+        top_matches = heapq.nlargest(
+            limit,
             career_matches.items(),
-            key=lambda x: x[1]['match_score'],
-            reverse=True
+            key=lambda x: x[1]['match_score']
         )
-        return dict(sorted_matches[:limit])
+        return dict(top_matches)
 
     def get_matches_by_category(self, career_matches):
         categories = {}
         for career_id, match_data in career_matches.items():
-            category = match_data['career_info']['category']
+            category = self.career_db.get_career_category(career_id)
             if category not in categories:
                 categories[category] = []
             categories[category].append((career_id, match_data))
@@ -384,7 +664,7 @@ class CareerMatcher:
 
         if top_matches:
             top_career = list(top_matches.values())[0]
-            category = top_career['career_info']['category'].lower()
+            category = top_career['career_info'].category.lower()
 
             if 'technology' in category:
                 resources['specialized_platforms'] = [
@@ -0,0 +1,169 @@
+# components/catalog_manager.py
+import os
+import signal
+import threading
+import time
+
+from components.career_matcher import CareerMatcher
+from components.results_display import ResultsDisplay
+from config.settings import Config
+from data.career_database import CareerDatabase
+from data.catalog_loader import sqlite_path_from_url
+from data.personality_traits import PersonalityTraits
+
+
+class CatalogSnapshot:
+    """One immutable generation of the catalog and everything compiled from it"""
+
+    __slots__ = ('generation', 'version', 'career_matcher', 'results_display', 'source_stamps', 'loaded_at')
+
+    def __init__(self, generation, career_matcher, results_display, source_stamps):
+        self.generation = generation
+        self.version = career_matcher.matching_engine.catalog_version
+        self.career_matcher = career_matcher
+        self.results_display = results_display
+        self.source_stamps = source_stamps
+        self.loaded_at = time.time()
+
+
+class CatalogManager:
+    """Owns the current catalog snapshot and swaps in rebuilt snapshots at runtime
+
+    A reload builds a complete new CareerMatcher (catalog, trait mappings and
+    every compiled index) off to the side, then replaces the snapshot reference
+    in one assignment. Requests take the snapshot once and use it to the end,
+    so in-flight work finishes on the version it started with. Reloads run on
+    file change (polling the catalog and trait mapping sources), on a call to
+    reload, or on a signal when the entry point owns the main thread. Listeners
+    are told about every swap, e.g. to drop caches keyed on the old catalog
+    version. Snapshots hold no open files or connections (SQLite catalogs are
+    read in full and closed at load), so an old snapshot is released, compiled
+    catalog memory map included, once the last request using it lets go.
+    """
+
+    def __init__(self, catalog_source=None, trait_mappings_source=None, snapshot_path=None,
+                 use_trait_index=False):
+        self.catalog_source = catalog_source if catalog_source is not None else Config.CAREER_CATALOG_SOURCE
+        self.trait_mappings_source = (
+            trait_mappings_source if trait_mappings_source is not None
+            else Config.CAREER_TRAIT_MAPPINGS_SOURCE
+        )
+        self.snapshot_path = snapshot_path if snapshot_path is not None else Config.CAREER_CATALOG_SNAPSHOT
+        self.use_trait_index = use_trait_index
+
+        self._listeners = []
+        self._reload_lock = threading.Lock()
+        self._watcher = None
+        self._stop_watching = threading.Event()
+        self.last_error = None
+        self._snapshot = self._build_snapshot(generation=1)
+
+    # ---------- Snapshot access ----------
+
+    @property
+    def snapshot(self):
+        """The current snapshot; hold on to it for the duration of a request"""
+        return self._snapshot
+
+    def get_matcher(self):
+        """CareerMatcher of the current snapshot"""
+        return self._snapshot.career_matcher
+
+    def add_listener(self, callback):
+        """Call callback(old_snapshot, new_snapshot) after every swap"""
+        self._listeners.append(callback)
+
+    # ---------- Reloading ----------
+
+    def reload(self, background=False):
+        """Rebuild the snapshot from the sources and swap it in
+
+        Returns the new snapshot, or the reload thread when background is set.
+        A reload that fails to build keeps the current snapshot and records the
+        error in last_error.
+        """
+        if background:
+            thread = threading.Thread(target=self.reload, name='catalog-reload', daemon=True)
+            thread.start()
+            return thread
+
+        with self._reload_lock:
+            old_snapshot = self._snapshot
+            try:
+                new_snapshot = self._build_snapshot(old_snapshot.generation + 1)
+            except Exception as e:  # Keep serving the old catalog on a bad reload
+                self.last_error = e
+                return old_snapshot
+
+            self.last_error = None
+            self._snapshot = new_snapshot
+
+        for callback in self._listeners:
+            callback(old_snapshot, new_snapshot)
+        return new_snapshot
+
+    def reload_if_changed(self):
+        """Reload when a source file's size or modification time changed"""
+        if self._source_stamps() != self._snapshot.source_stamps:
+            return self.reload()
+        return None
+
+    def start_watching(self, interval=None):
+        """Poll the sources for changes in a daemon thread"""
+        interval = interval if interval is not None else Config.CATALOG_WATCH_INTERVAL
+        if not interval or self._watcher is not None:
+            return
+
+        def watch():
+            while not self._stop_watching.wait(interval):
+                self.reload_if_changed()
+
+        self._stop_watching.clear()
+        self._watcher = threading.Thread(target=watch, name='catalog-watcher', daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        self._stop_watching.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+    def install_signal_handler(self, signum=signal.SIGHUP):
+        """Reload in the background on a signal; returns whether it was installed
+
+        Python only installs signal handlers from the main thread, so call this
+        from a process entry point that owns it. Servers that run app code on
+        other threads, such as Streamlit, should use start_watching or reload.
+        """
+        try:
+            signal.signal(signum, lambda received, frame: self.reload(background=True))
+        except ValueError:
+            return False
+        return True
+
+    # ---------- Internals ----------
+
+    def _build_snapshot(self, generation):
+        source_stamps = self._source_stamps()
+        career_db = CareerDatabase(self.catalog_source or '', self.snapshot_path or '')
+        personality_traits = PersonalityTraits(self.trait_mappings_source or '')
+        career_matcher = CareerMatcher(
+            use_trait_index=self.use_trait_index,
+            career_db=career_db,
+            personality_traits=personality_traits
+        )
+        return CatalogSnapshot(generation, career_matcher, ResultsDisplay(career_db), source_stamps)
+
+    def _source_stamps(self):
+        """Size and modification time of every file the catalog is built from"""
+        stamps = {}
+        for source in (self.catalog_source, self.trait_mappings_source):
+            if not source:
+                continue
+            path = sqlite_path_from_url(source) if source.startswith('sqlite:') else source
+            try:
+                stat = os.stat(path)
+                stamps[path] = (stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                stamps[path] = None
+        return stamps
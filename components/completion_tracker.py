@@ -0,0 +1,96 @@
+# components/completion_tracker.py
+from typing import Dict, Any
+
+
+class CompletionTracker:
+    """Keeps assessment completion counts up to date one answer at a time
+
+    Recording or removing an answer adjusts the answered count of its category
+    and a running sum of valid confidence scores, so a status poll costs the
+    same however large the question bank is. get_status returns the same dict
+    as QuestionnaireManager.get_assessment_completion_status.
+    """
+
+    MIN_COMPLETION_THRESHOLD = 0.8  # 80% minimum completion
+    CATEGORY_MIN_THRESHOLD = 0.6  # 60% minimum per category
+
+    def __init__(self, questionnaire_manager, user_responses=None):
+        self.questionnaire_manager = questionnaire_manager
+        self.total_questions = questionnaire_manager.get_total_questions()
+        self.question_category = {
+            question['id']: question['category'] for question in questionnaire_manager.questions
+        }
+        self.category_totals = {
+            category: len(questionnaire_manager.questions_by_category.get(category, ()))
+            for category in questionnaire_manager.question_categories
+        }
+
+        self.responses = {}
+        self._confidence = {}  # question_id -> confidence score of a valid answer
+        self.category_answered = dict.fromkeys(self.category_totals, 0)
+        self.confidence_sum = 0.0
+
+        for question_id, response in (user_responses or {}).items():
+            self.record_answer(question_id, response)
+
+    def record_answer(self, question_id, response):
+        """Record (or replace) the answer to one question"""
+        validation = self.questionnaire_manager.validate_response(question_id, response)
+        self.remove_answer(question_id)
+
+        self.responses[question_id] = response
+        category = self.question_category[question_id]
+        self.category_answered[category] = self.category_answered.get(category, 0) + 1
+        if validation['is_valid']:
+            self._confidence[question_id] = validation['confidence_score']
+            self.confidence_sum += validation['confidence_score']
+        return validation
+
+    def remove_answer(self, question_id):
+        """Forget the answer to one question, if any"""
+        if question_id not in self.responses:
+            return
+        del self.responses[question_id]
+        category = self.question_category[question_id]
+        self.category_answered[category] -= 1
+        confidence = self._confidence.pop(question_id, None)
+        if confidence is not None:
+            self.confidence_sum -= confidence
+        if not self._confidence:
+            self.confidence_sum = 0.0  # Drop rounding residue once nothing is left
+
+    def get_status(self) -> Dict[str, Any]:
+        """Detailed completion status of the assessment"""
+        answered_questions = len(self.responses)
+
+        category_completion = {}
+        for category, info in self.questionnaire_manager.question_categories.items():
+            total = self.category_totals[category]
+            category_completion[category] = {
+                'answered': self.category_answered[category],
+                'total': total,
+                'percentage': (self.category_answered[category] / total) * 100,
+                'name': info['name']
+            }
+
+        valid_answers = len(self._confidence)
+        avg_confidence = self.confidence_sum / valid_answers if valid_answers else 0
+
+        # Determine if assessment is complete enough for results
+        is_complete_enough = (answered_questions / self.total_questions) >= self.MIN_COMPLETION_THRESHOLD
+
+        # Check if all categories have minimum representation
+        all_categories_represented = all(
+            comp['percentage'] >= self.CATEGORY_MIN_THRESHOLD * 100
+            for comp in category_completion.values()
+        )
+
+        return {
+            'total_questions': self.total_questions,
+            'answered_questions': answered_questions,
+            'completion_percentage': (answered_questions / self.total_questions) * 100,
+            'category_completion': category_completion,
+            'average_confidence': avg_confidence,
+            'is_complete_enough': is_complete_enough and all_categories_represented,
+            'all_categories_represented': all_categories_represented
+        }
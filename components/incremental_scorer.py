@@ -0,0 +1,207 @@
+# components/incremental_scorer.py
+import numpy as np
+
+
+class IncrementalScorer:
+    """Keeps per-question contributions so editing one answer only rescores what it affects
+
+    The scorer holds the answers and each answer's skill scores. Skill scores
+    start from processed_data['skills'], as in a full rescore. When an answer
+    changes, trait scores are recomputed from the answers (a small weighted
+    sum), the personality match is rerun only for careers weighting a trait
+    whose score changed, only the skills that answer touches are recomputed
+    from the answers, and only careers whose personality match or
+    skill-dependent terms actually changed are rescored.
+    """
+
+    def __init__(self, career_matcher, processed_data=None):
+        processed_data = processed_data or {}
+        self.matcher = career_matcher
+        self.engine = career_matcher.matching_engine
+        self.personality_traits = career_matcher.personality_traits
+        self.skills_mapping = career_matcher.skills_mapping
+        self.all_careers = career_matcher.career_db.get_all_careers()
+
+        self.interests = processed_data.get('interests', [])
+        self.values = processed_data.get('values', [])
+        self.work_style = processed_data.get('work_style', {})
+        self.user_bitsets = career_matcher.match_bitsets.encode_user(
+            self.interests, self.values, self.work_style
+        )
+
+        self._index_career_skills()
+
+        # Catalog rows whose personality match depends on each trait column
+        self.careers_by_trait = [
+            np.flatnonzero(self.engine.trait_weights[:, column]) for column in range(len(self.engine.traits))
+        ]
+
+        self.responses = {}
+        self.skill_contributions = {}
+        self.raw_trait_scores = np.zeros(len(self.engine.traits))
+        self.skill_scores = dict(processed_data.get('skills', {}))
+        self._skill_matches = {}
+
+        for question_id, response in processed_data.get('responses', {}).items():
+            self._apply_answer(question_id, response, refresh=False)
+        self._refresh_trait_scores()
+        self.personality_matches = self.engine.personality_matches(self.personality_scores)
+        self._skill_matches = self.matcher.skill_index.best_matches(self.skill_scores)
+        self.match_scores = np.array([
+            self._score_career(index) for index in range(len(self.engine.career_ids))
+        ])
+
+    def _index_career_skills(self):
+        """Map required skill ids and bonus skill keys back to the careers that use them"""
+        self.careers_by_required_skill = {}
+        self.careers_by_bonus_key = {}
+        for index, career_id in enumerate(self.engine.career_ids):
+            for required_id in self.matcher.skill_matrix.required_ids(index):
+                self.careers_by_required_skill.setdefault(required_id, set()).add(index)
+            for skill_key in self.matcher.career_bonuses[career_id]['high_demand_skill_keys']:
+                self.careers_by_bonus_key.setdefault(skill_key, set()).add(index)
+
+    # ---------- Public API ----------
+
+    def update_answer(self, question_id, response):
+        """Apply one changed answer and return the ids of careers whose match score changed"""
+        old_skill_scores = self.skill_scores
+        self._apply_answer(question_id, response)
+        affected = self._refresh_personality_matches()
+
+        changed_skills = {
+            skill for skill in set(old_skill_scores) | set(self.skill_scores)
+            if old_skill_scores.get(skill) != self.skill_scores.get(skill)
+        }
+        if changed_skills:
+            self._skill_matches = self.matcher.skill_index.best_matches(self.skill_scores)
+            affected |= self._careers_affected_by_skills(changed_skills)
+
+        changed = []
+        for index in sorted(affected):
+            match_score = self._score_career(index)
+            if match_score != self.match_scores[index]:
+                self.match_scores[index] = match_score
+                changed.append(self.engine.career_ids[index])
+        return changed
+
+    def get_personality_profile(self):
+        """Personality profile for the current answers"""
+        return self.personality_traits.get_personality_profile(self.personality_scores)
+
+    def get_match_scores(self):
+        """Current match score of every catalog career"""
+        return {
+            career_id: float(self.match_scores[index])
+            for index, career_id in enumerate(self.engine.career_ids)
+        }
+
+    def get_processed_data(self):
+        """Processed data equivalent to the current answers, for a full rescore"""
+        return {
+            'responses': dict(self.responses),
+            'skills': dict(self.skill_scores),
+            'interests': self.interests,
+            'values': self.values,
+            'work_style': self.work_style
+        }
+
+    def get_career_matches(self):
+        """Match records above the threshold, as calculate_career_matches returns them"""
+        personality_profile = self.get_personality_profile()
+        career_matches = {}
+        for index, career_id in enumerate(self.engine.career_ids):
+            match_score = float(self.match_scores[index])
+            if match_score > self.matcher.min_match_score:
+                career_matches[career_id] = self.matcher._build_match_entry(
+                    career_id, match_score, personality_profile,
+                    self.skill_scores, self.interests, self.values, self.work_style
+                )
+        return career_matches
+
+    # ---------- Internals ----------
+
+    def _apply_answer(self, question_id, response, refresh=True):
+        """Swap one answer's stored contributions for the new response's
+
+        Answers are keyed by the question id as a string, so 2 and '2' are the
+        same question. With refresh off only the contributions are stored; the
+        caller recomputes skills.
+        """
+        question_key = str(question_id)
+        self.responses[question_key] = response
+
+        old_skills = self.skill_contributions.get(question_key, {})
+        new_skills = self.skills_mapping.map_response_to_skills(
+            self.skills_mapping._get_question_type(question_id), response
+        )
+        self.skill_contributions[question_key] = new_skills
+
+        if refresh:
+            self._recompute_skills(set(old_skills) | set(new_skills))
+
+    def _recompute_skills(self, skills):
+        """Recompute max-over-answers skill scores for the given skills only"""
+        skill_scores = dict(self.skill_scores)
+        for skill in skills:
+            scores = [
+                contributions[skill] for contributions in self.skill_contributions.values()
+                if skill in contributions
+            ]
+            if scores:
+                skill_scores[skill] = max(scores)
+            else:
+                skill_scores.pop(skill, None)
+        self.skill_scores = skill_scores
+
+    def _refresh_trait_scores(self):
+        # Recomputed from the answers in answer order rather than patched with deltas:
+        # adding and subtracting deltas would drift by float rounding and could move
+        # a score across a tolerance band edge, while this matches a full rescore
+        question_traits = self.personality_traits.raw_trait_scores(
+            *self.personality_traits.encode_responses(self.responses)
+        )
+        self.raw_trait_scores[:len(question_traits)] = question_traits
+        raw_scores = dict(zip(self.engine.traits, self.raw_trait_scores.tolist()))
+        self.personality_scores = self.personality_traits.normalize_trait_scores(raw_scores)
+
+    def _refresh_personality_matches(self):
+        """Refresh trait scores and rerun the personality kernel only for careers weighting a changed trait
+
+        Returns the rows whose personality match changed. Each rerun row is
+        scored over all its traits, so it equals the whole-catalog kernel.
+        """
+        old_scores = self.personality_scores
+        self._refresh_trait_scores()
+        changed_rows = [
+            self.careers_by_trait[column] for column, trait in enumerate(self.engine.traits)
+            if self.personality_scores.get(trait) != old_scores.get(trait)
+        ]
+        if not changed_rows:
+            return set()
+
+        rows = np.unique(np.concatenate(changed_rows))
+        matches = self.engine.personality_matches(self.personality_scores, rows)
+        changed = matches != self.personality_matches[rows]
+        self.personality_matches[rows] = matches
+        return set(rows[changed].tolist())
+
+    def _careers_affected_by_skills(self, changed_skills):
+        """Careers whose skills match or high-demand bonus can depend on the changed skills"""
+        skill_index = self.matcher.skill_index
+        affected = set()
+        for skill in changed_skills:
+            for required_id, _ in skill_index.related_required_skills(skill):
+                affected |= self.careers_by_required_skill.get(required_id, set())
+            affected |= self.careers_by_bonus_key.get(skill, set())
+        return affected
+
+    def _score_career(self, index):
+        career_id = self.engine.career_ids[index]
+        return self.matcher._calculate_individual_match(
+            career_id, self.all_careers[career_id], {'scores': self.personality_scores},
+            self.skill_scores, self.interests, self.values, self.work_style,
+            personality_match=float(self.personality_matches[index]),
+            skill_matches=self._skill_matches,
+            user_bitsets=self.user_bitsets
+        )
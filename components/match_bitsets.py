@@ -0,0 +1,215 @@
+# components/match_bitsets.py
+import numpy as np
+
+
+class MatchBitsets:
+    """Integer bitmask encodings for interests, values and work style matching
+
+    Every career interest, value and work style factor gets a bit in a vocabulary
+    that grows as careers are encoded. User terms are only looked up: a term no
+    career uses maps to 0, since it can never match, and is not remembered, so
+    arbitrary user input cannot grow the vocabulary or the memos. Interest
+    categories and value relations are expanded into masks once per career
+    term, so each match component reduces to ANDs and popcounts over small
+    integers.
+    """
+
+    def __init__(self, interest_categories, value_weights, value_relations, style_factors):
+        self.interest_categories = interest_categories
+        self.value_weights = value_weights
+        self.value_relations = value_relations
+        self.style_factors = style_factors
+
+        self.interest_bits = {}
+        self.interest_category_masks = {}
+        self.value_bits = {}
+        self.related_value_masks = {}
+        self.style_bits = {factor: 1 << i for i, factor in enumerate(style_factors)}
+
+    # ---------- Vocabulary ----------
+
+    def _bit(self, vocabulary, term):
+        bit = vocabulary.get(term)
+        if bit is None:
+            bit = 1 << len(vocabulary)
+            vocabulary[term] = bit
+        return bit
+
+    def _interest_category_mask(self, interest, remember=True):
+        """Categories whose keywords appear in an interest (memoized per career interest)"""
+        mask = self.interest_category_masks.get(interest)
+        if mask is None:
+            mask = 0
+            for i, keywords in enumerate(self.interest_categories.values()):
+                if any(keyword in interest for keyword in keywords):
+                    mask |= 1 << i
+            if remember:
+                self.interest_category_masks[interest] = mask
+        return mask
+
+    def related_value_mask(self, value):
+        """Mask of the user values that count as related to a career value"""
+        mask = self.related_value_masks.get(value)
+        if mask is None:
+            mask = 0
+            for related in self.value_relations.get(value, []):
+                mask |= self._bit(self.value_bits, related)
+            self.related_value_masks[value] = mask
+        return mask
+
+    # ---------- Encoding ----------
+
+    def encode_interests(self, interests):
+        """Encode career interests as (interest mask, category mask, list length)"""
+        interest_mask = 0
+        category_mask = 0
+        for interest in interests:
+            interest_mask |= self._bit(self.interest_bits, interest)
+            category_mask |= self._interest_category_mask(interest)
+        return interest_mask, category_mask, len(interests)
+
+    def encode_user_interests(self, interests):
+        """Encode user interests like encode_interests, without adding unknown terms"""
+        interest_mask = 0
+        category_mask = 0
+        for interest in interests:
+            interest_mask |= self.interest_bits.get(interest, 0)
+            category_mask |= self._interest_category_mask(interest, remember=False)
+        return interest_mask, category_mask, len(interests)
+
+    def encode_user_values(self, values):
+        """Encode a user's values as a single mask; values no career uses map to 0"""
+        mask = 0
+        for value in values:
+            mask |= self.value_bits.get(value, 0)
+        return mask
+
+    def encode_career_values(self, values):
+        """Encode a career's values as (value bit, related mask, weight) per value"""
+        return tuple(
+            (self._bit(self.value_bits, value),
+             self.related_value_mask(value),
+             self.value_weights.get(value, 1.0))
+            for value in values
+        )
+
+    def encode_work_style(self, work_style):
+        """Encode work style factors (list or level map keys) as a mask"""
+        mask = 0
+        for factor in work_style:
+            mask |= self.style_bits.get(factor, 0)
+        return mask
+
+    def encode_career(self, career_info):
+        """Encode the interests, values and work style of a career"""
+        return (
+            self.encode_interests(career_info.interests),
+            self.encode_career_values(career_info.values),
+            self.encode_work_style(career_info.work_style),
+            bool(career_info.work_style)
+        )
+
+    def encode_user(self, interests, values, work_style):
+        """Encode the interests, values and work style of a user"""
+        return (
+            self.encode_user_interests(interests),
+            self.encode_user_values(values),
+            self.encode_work_style(work_style),
+            bool(work_style)
+        )
+
+    # ---------- Matching ----------
+
+    def interests_match(self, career_interests, user_interests):
+        career_mask, career_categories, career_count = career_interests
+        user_mask, user_categories, user_count = user_interests
+        if not career_count or not user_count:
+            return 0.5
+
+        direct_matches = bin(career_mask & user_mask).count('1')
+        related_matches = 0.5 * bin(career_categories & user_categories).count('1')
+
+        return min(1.0, (direct_matches + related_matches) / career_count)
+
+    def values_match(self, career_values, user_values):
+        if not career_values or not user_values:
+            return 0.5
+
+        total_match = 0
+        total_weight = 0
+        for value_bit, related_mask, weight in career_values:
+            if value_bit & user_values:
+                total_match += 1.0 * weight
+            elif related_mask & user_values:
+                total_match += 0.7 * weight
+            total_weight += weight
+
+        return total_match / total_weight if total_weight > 0 else 0.5
+
+    def work_style_match(self, career_style, career_has_style, user_style, user_has_style):
+        if not career_has_style or not user_has_style:
+            return 0.5
+
+        # Both levels of a shared factor are read from the user's map, so every
+        # shared factor is a perfect match and only whether any is shared matters
+        return 1.0 if career_style & user_style else 0.5
+
+    # ---------- Catalog-wide bounds ----------
+
+    def compile_bound_columns(self, career_bitsets):
+        """Per-career columns from which match_bounds bounds a whole catalog in array operations"""
+        interests = [career[0] for career in career_bitsets]
+        values = [career[1] for career in career_bitsets]
+        value_bits = [0] * len(values)
+        related_value_bits = [0] * len(values)
+        for i, career_values in enumerate(values):
+            for value_bit, related_mask, _ in career_values:
+                value_bits[i] |= value_bit
+                related_value_bits[i] |= related_mask
+
+        return {
+            'interest_count': np.array([count for _, _, count in interests], dtype=float),
+            'distinct_interests': np.array([bin(mask).count('1') for mask, _, _ in interests], dtype=float),
+            'interest_categories': np.array([categories for _, categories, _ in interests], dtype=np.int64),
+            # Value masks grow with the vocabulary, so they stay Python ints
+            'value_bits': np.array(value_bits, dtype=object),
+            'related_value_bits': np.array(related_value_bits, dtype=object),
+            'value_weight': np.array(
+                [sum(weight for _, _, weight in career_values) for career_values in values], dtype=float
+            ),
+            'work_style': np.array([career[2] for career in career_bitsets], dtype=np.int64),
+            'has_work_style': np.array([career[3] for career in career_bitsets], dtype=bool)
+        }
+
+    def match_bounds(self, columns, user_interests, user_values, user_style, user_has_style, rows):
+        """Upper bounds on the interests, values and work style matches of the given career rows
+
+        Work style is exact. Interests count every user interest the career
+        could share as a direct match; values count as fully matched when any
+        user value is one of the career's, or 0.7 when only related.
+        """
+        user_mask, user_categories, user_count = user_interests
+        interest_count = columns['interest_count'][rows]
+        shared_categories = columns['interest_categories'][rows] & user_categories
+        related_matches = np.zeros(len(rows))
+        for category in range(len(self.interest_categories)):
+            related_matches += 0.5 * ((shared_categories >> category) & 1)
+        direct_matches = np.minimum(columns['distinct_interests'][rows], bin(user_mask).count('1'))
+        interests_bound = np.where(
+            (interest_count == 0) | (user_count == 0), 0.5,
+            np.minimum(1.0, (direct_matches + related_matches) / np.maximum(interest_count, 1))
+        )
+
+        value_weight = columns['value_weight'][rows]
+        direct_values = (columns['value_bits'][rows] & user_values) != 0
+        related_values = (columns['related_value_bits'][rows] & user_values) != 0
+        values_bound = np.where(direct_values, 1.0, np.where(related_values, 0.7, 0.0))
+        values_bound = np.where((value_weight <= 0) | (user_values == 0), 0.5, values_bound)
+
+        career_style = columns['work_style'][rows]
+        work_style_match = np.where((career_style & user_style) != 0, 1.0, 0.5)
+        if not user_has_style:
+            work_style_match = np.full(len(rows), 0.5)
+        work_style_match = np.where(columns['has_work_style'][rows], work_style_match, 0.5)
+
+        return np.column_stack([interests_bound, values_bound, work_style_match])
@@ -0,0 +1,174 @@
+# components/matching_engine.py
+import hashlib
+import json
+
+import numpy as np
+
+from data.records import record_to_json
+
+
+class MatchingEngine:
+    """Compiles the career catalog into arrays so matching runs as array operations"""
+
+    # Upper bound on user x career x trait cells materialized per kernel call
+    max_kernel_cells = 1 << 21
+
+    def __init__(self, career_db, personality_traits, match_bitsets):
+        all_careers = career_db.get_all_careers()
+        self.career_ids = list(all_careers.keys())
+        self.career_index = {career_id: i for i, career_id in enumerate(self.career_ids)}
+        self.trait_importance = self._initialize_trait_importance()
+        self.traits = self._collect_traits(personality_traits)
+        self.trait_index = {trait: i for i, trait in enumerate(self.traits)}
+        self.trait_key = self._compute_trait_key(personality_traits.career_trait_mappings)
+
+        # A compiled catalog file already holds the matrices; reuse its shared pages
+        compiled = getattr(all_careers, 'compiled_catalog', None)
+        if compiled is not None and compiled.trait_key == self.trait_key:
+            self.catalog_version = compiled.catalog_version
+            (self.required_levels,
+             self.trait_weights,
+             self.total_trait_weights,
+             self.has_trait_profile) = compiled.trait_arrays()
+        else:
+            self.catalog_version = self._compute_catalog_version(
+                all_careers, personality_traits.career_trait_mappings
+            )
+            (self.required_levels,
+             self.trait_weights,
+             self.total_trait_weights,
+             self.has_trait_profile) = self._compile_trait_matrix(
+                [personality_traits.career_trait_mappings.get(career_id, {})
+                 for career_id in self.career_ids]
+            )
+
+        # Interests, values and work style encoded once per catalog career
+        self.career_bitsets = [
+            match_bitsets.encode_career(all_careers[career_id]) for career_id in self.career_ids
+        ]
+        # The same encodings as columns, for bounding the whole catalog at once
+        self.career_bound_columns = match_bitsets.compile_bound_columns(self.career_bitsets)
+
+    def _compute_catalog_version(self, all_careers, career_trait_mappings):
+        """Content digest of the catalog; changes whenever careers or trait mappings change"""
+        canonical = json.dumps(
+            {'careers': dict(all_careers), 'trait_mappings': career_trait_mappings},
+            sort_keys=True, separators=(',', ':'), default=record_to_json
+        )
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+    def _compute_trait_key(self, career_trait_mappings):
+        """Digest of everything the trait matrices are compiled from, besides the career ids"""
+        canonical = json.dumps(
+            {'career_ids': self.career_ids, 'traits': self.traits,
+             'importance': self.trait_importance, 'trait_mappings': career_trait_mappings},
+            sort_keys=True, separators=(',', ':')
+        )
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+    def _initialize_trait_importance(self):
+        """Initialize relative importance of each trait in personality matching"""
+        return {
+            'conscientiousness': 1.2,
+            'openness': 1.1,
+            'extraversion': 1.0,
+            'agreeableness': 1.0,
+            'neuroticism': 0.9
+        }
+
+    def _collect_traits(self, personality_traits):
+        """Fix the trait column order: defined traits first, then any extras from mappings"""
+        traits = list(personality_traits.trait_definitions.keys())
+        for career_traits in personality_traits.career_trait_mappings.values():
+            for trait in career_traits:
+                if trait not in traits:
+                    traits.append(trait)
+        return traits
+
+    def _compile_trait_matrix(self, trait_profiles):
+        """Compile career trait profiles into careers x traits level and weight matrices"""
+        required = np.zeros((len(trait_profiles), len(self.traits)))
+        weights = np.zeros((len(trait_profiles), len(self.traits)))
+
+        for row, career_traits in enumerate(trait_profiles):
+            for trait, required_level in career_traits.items():
+                column = self.trait_index[trait]
+                required[row, column] = required_level
+                weights[row, column] = self.trait_importance.get(trait, 1.0)
+
+        total_weights = weights.sum(axis=1)
+        has_profile = total_weights > 0
+        return required, weights, total_weights, has_profile
+
+    # ---------- Personality Kernel ----------
+
+    def encode_personality(self, user_personality):
+        """Encode a trait score dict as a vector in the engine's trait order"""
+        return np.array([user_personality.get(trait, 0.5) for trait in self.traits], dtype=float)
+
+    def personality_match_matrix(self, user_matrix, rows=None):
+        """Score N encoded personalities against every career (or the given career rows)"""
+        user_matrix = np.atleast_2d(np.asarray(user_matrix, dtype=float))
+        required, weights = self.required_levels, self.trait_weights
+        total_weights, has_profile = self.total_trait_weights, self.has_trait_profile
+        if rows is not None:
+            required, weights = required[rows], weights[rows]
+            total_weights, has_profile = total_weights[rows], has_profile[rows]
+
+        cells_per_user = max(1, len(required) * len(self.traits))
+        chunk_size = max(1, self.max_kernel_cells // cells_per_user)
+
+        scores = np.empty((user_matrix.shape[0], len(required)))
+        for start in range(0, user_matrix.shape[0], chunk_size):
+            scores[start:start + chunk_size] = self._personality_kernel(
+                user_matrix[start:start + chunk_size], required,
+                weights, total_weights, has_profile
+            )
+        return scores
+
+    def personality_matches(self, user_personality, rows=None):
+        """Score one personality against every career (or the given career rows)"""
+        return self.personality_match_matrix(self.encode_personality(user_personality), rows)[0]
+
+    def score_trait_profile(self, career_traits, user_personality):
+        """Score one personality against an arbitrary trait profile (not necessarily in the catalog)"""
+        required, weights, total_weights, has_profile = self._compile_trait_matrix([career_traits])
+        user_matrix = self.encode_personality(user_personality)[np.newaxis, :]
+        return float(self._personality_kernel(
+            user_matrix, required, weights, total_weights, has_profile
+        )[0, 0])
+
+    def _personality_kernel(self, user_matrix, required, weights, total_weights, has_profile):
+        """Tolerance-banded, importance-weighted trait match for every user/career pair"""
+        difference = np.abs(user_matrix[:, np.newaxis, :] - required[np.newaxis, :, :])
+
+        # Same tolerance bands as the per-trait loop: 0.1 / 0.2 / 0.4, then linear falloff
+        trait_match = np.where(
+            difference <= 0.1, 1.0,
+            np.where(
+                difference <= 0.2, 0.8,
+                np.where(difference <= 0.4, 0.6, np.maximum(0.2, 1 - difference))
+            )
+        )
+
+        total_match = (trait_match * weights[np.newaxis, :, :]).sum(axis=2)
+        safe_totals = np.where(has_profile, total_weights, 1.0)
+        # Careers without trait data get a neutral match
+        return np.where(has_profile[np.newaxis, :], total_match / safe_totals[np.newaxis, :], 0.5)
+
+    # ---------- Selection ----------
+
+    def top_k_indices(self, scores, k, threshold=None):
+        """Indices of the k highest scores above threshold, best first, ties in catalog order"""
+        scores = np.asarray(scores)
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        candidates = np.arange(len(scores)) if threshold is None else np.flatnonzero(scores > threshold)
+
+        if len(candidates) > k:
+            # argpartition-style cut at the k-th largest value, keeping boundary ties
+            kth_value = np.partition(scores[candidates], len(candidates) - k)[len(candidates) - k]
+            candidates = candidates[scores[candidates] >= kth_value]
+
+        order = np.lexsort((candidates, -scores[candidates]))[:k]
+        return candidates[order]
@@ -1,14 +1,126 @@
 # components/questionnaire.py
+import bisect
 import random
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional
+from components.adaptive_logic import AdaptiveQuestionLogic
+from components.completion_tracker import CompletionTracker
+from data.records import Question, QuestionOption
+
+# Immutable option lists shared by every question of their kind instead of rebuilt per question
+LIKERT_OPTIONS = (
+    QuestionOption(value='strongly_disagree', text='Strongly Disagree'),
+    QuestionOption(value='disagree', text='Disagree'),
+    QuestionOption(value='neutral', text='Neutral'),
+    QuestionOption(value='agree', text='Agree'),
+    QuestionOption(value='strongly_agree', text='Strongly Agree')
+)
+
+SKILL_LEVEL_OPTIONS = (
+    QuestionOption(value='none', text='No experience'),
+    QuestionOption(value='beginner', text='Beginner - Basic knowledge'),
+    QuestionOption(value='intermediate', text='Intermediate - Some experience'),
+    QuestionOption(value='advanced', text='Advanced - Extensive experience'),
+    QuestionOption(value='expert', text='Expert - Could teach others')
+)
+
+QUESTION_INSTRUCTIONS = {
+    'likert': "Please indicate how much you agree with this statement:",
+    'ranking': "Drag and drop to rank these items in order of preference:",
+    'multiple_select': "Select all options that apply to you:",
+    'self_assessment': "Honestly assess your current ability level:"
+}
+
+class QuestionValidator:
+    """Response check for one question, compiled once from its options
+    
+    Choice questions test membership in a frozenset of option values, and
+    rankings compare the sorted response with the sorted option values. Error
+    messages are formatted at compile time.
+    """
+    
+    __slots__ = ('question_type', 'valid_values', 'sorted_values', 'choice_error')
+    
+    def __init__(self, question):
+        values = [option['value'] for option in question.get('options', ())]
+        self.question_type = question['type']
+        self.valid_values = frozenset(values)
+        self.sorted_values = tuple(sorted(values))
+        self.choice_error = f"Response must be one of: {', '.join(values)}"
+    
+    def validate(self, response: Any) -> Dict[str, Any]:
+        """Validate a response with detailed feedback"""
+        validation_result = {
+            'is_valid': False,
+            'error_message': '',
+            'processed_response': None,
+            'confidence_score': 1.0
+        }
+        
+        question_type = self.question_type
+        
+        if question_type in ('likert', 'multiple_choice', 'self_assessment'):
+            if self._is_option(response):
+                validation_result['is_valid'] = True
+                validation_result['processed_response'] = response
+                # Lower confidence for neutral Likert responses
+                if question_type == 'likert' and response == 'neutral':
+                    validation_result['confidence_score'] = 0.7
+            else:
+                validation_result['error_message'] = self.choice_error
+        
+        elif question_type == 'multiple_select':
+            if isinstance(response, list):
+                if all(self._is_option(r) for r in response):
+                    validation_result['is_valid'] = True
+                    validation_result['processed_response'] = response
+                    # Higher confidence for multiple selections
+                    validation_result['confidence_score'] = min(1.0, 0.8 + len(response) * 0.1)
+                else:
+                    validation_result['error_message'] = "All selected options must be valid"
+            else:
+                validation_result['error_message'] = "Response must be a list of values"
+        
+        elif question_type == 'ranking':
+            if isinstance(response, list):
+                if self._is_permutation(response):
+                    validation_result['is_valid'] = True
+                    validation_result['processed_response'] = response
+                    validation_result['confidence_score'] = 0.95  # High confidence for complete rankings
+                else:
+                    validation_result['error_message'] = "Must rank all provided options exactly once"
+            else:
+                validation_result['error_message'] = "Response must be a ranked list of all options"
+        
+        return validation_result
+    
+    def _is_option(self, value):
+        try:
+            return value in self.valid_values
+        except TypeError:  # Unhashable values are never options
+            return False
+    
+    def _is_permutation(self, response):
+        if len(response) != len(self.sorted_values):
+            return False
+        try:
+            return tuple(sorted(response)) == self.sorted_values
+        except TypeError:  # Unorderable (mixed-type) items cannot be the option values
+            return False
 
 class QuestionnaireManager:
     """Manages comprehensive career assessment questionnaire with advanced question logic"""
     
     def __init__(self):
-        self.questions = self._initialize_questions()
+        # Immutable slotted records; they still read like the original dicts
+        self.questions = self._freeze_questions(self._initialize_questions())
         self.question_categories = self._initialize_categories()
+        self.questions_by_category = self._group_questions_by_category()
+        # Read-only display views of every question, keyed by id and built once at load
+        self.question_bank = self._build_question_bank()
+        self.validators = {question['id']: QuestionValidator(question) for question in self.questions}
         self.adaptive_logic = AdaptiveQuestionLogic()
+        self.adaptive_logic.initialize(len(self.questions))
         
     def _initialize_categories(self):
         """Initialize question categories with weights and descriptions"""
@@ -567,63 +679,76 @@ class QuestionnaireManager:
     
     def _get_likert_options(self):
         """Standard 5-point Likert scale options"""
-        return [
-            {'value': 'strongly_disagree', 'text': 'Strongly Disagree'},
-            {'value': 'disagree', 'text': 'Disagree'},
-            {'value': 'neutral', 'text': 'Neutral'},
-            {'value': 'agree', 'text': 'Agree'},
-            {'value': 'strongly_agree', 'text': 'Strongly Agree'}
-        ]
+        return LIKERT_OPTIONS
     
     def _get_skill_level_options(self):
         """Skill proficiency level options"""
-        return [
-            {'value': 'none', 'text': 'No experience'},
-            {'value': 'beginner', 'text': 'Beginner - Basic knowledge'},
-            {'value': 'intermediate', 'text': 'Intermediate - Some experience'},
-            {'value': 'advanced', 'text': 'Advanced - Extensive experience'},
-            {'value': 'expert', 'text': 'Expert - Could teach others'}
-        ]
+        return SKILL_LEVEL_OPTIONS
+    
+    def _freeze_questions(self, questions):
+        """Turn question dicts into records; questions sharing an option list share its records"""
+        shared_options = {}
+        frozen = []
+        for question in questions:
+            options = question.get('options')
+            if options is not None and not isinstance(options, tuple):  # Built option tuples are kept
+                if id(options) not in shared_options:
+                    shared_options[id(options)] = tuple(QuestionOption.from_dict(option) for option in options)
+                question = dict(question, options=shared_options[id(options)])
+            frozen.append(Question.from_dict(question))
+        return frozen
     
-    def get_question(self, question_id: int) -> Dict[str, Any]:
-        """Get specific question by ID with enhanced metadata"""
+    def _group_questions_by_category(self):
+        """Questions of each category in question order"""
+        questions_by_category = {category: [] for category in self.question_categories}
         for question in self.questions:
-            if question['id'] == question_id:
-                # Add dynamic metadata
-                enhanced_question = question.copy()
-                enhanced_question['category_info'] = self.question_categories[question['category']]
-                enhanced_question['progress_info'] = self._calculate_progress_info(question_id)
-                
-                # Add contextual hints for better user experience
-                if question['type'] == 'likert':
-                    enhanced_question['instruction'] = "Please indicate how much you agree with this statement:"
-                elif question['type'] == 'ranking':
-                    enhanced_question['instruction'] = "Drag and drop to rank these items in order of preference:"
-                elif question['type'] == 'multiple_select':
-                    enhanced_question['instruction'] = "Select all options that apply to you:"
-                elif question['type'] == 'self_assessment':
-                    enhanced_question['instruction'] = "Honestly assess your current ability level:"
-                
-                return enhanced_question
-        
-        raise ValueError(f"Question with ID {question_id} not found")
+            questions_by_category.setdefault(question['category'], []).append(question)
+        return {category: tuple(questions) for category, questions in questions_by_category.items()}
     
-    def _calculate_progress_info(self, question_id: int) -> Dict[str, Any]:
-        """Calculate progress information for the question"""
-        total_questions = len(self.questions)
-        current_category = self.questions[question_id]['category']
+    def _build_question_bank(self):
+        """Precompute the enhanced, read-only view get_question returns for every question
         
-        # Calculate category progress
-        category_questions = [q for q in self.questions if q['category'] == current_category]
-        category_position = len([q for q in category_questions if q['id'] <= question_id])
-        
-        return {
-            'overall_progress': ((question_id + 1) / total_questions) * 100,
-            'category_progress': (category_position / len(category_questions)) * 100,
-            'questions_remaining': total_questions - question_id - 1,
-            'current_category': current_category,
-            'category_name': self.question_categories[current_category]['name']
+        The views, their category_info and progress_info are all read-only
+        mappings, so handing out the shared view is safe.
+        """
+        total_questions = len(self.questions)
+        category_ids = {
+            category: sorted(question['id'] for question in questions)
+            for category, questions in self.questions_by_category.items()
+        }
+        category_infos = {
+            category: MappingProxyType(dict(info)) for category, info in self.question_categories.items()
         }
+        
+        question_bank = {}
+        for question in self.questions:
+            question_id = question['id']
+            category = question['category']
+            # Number of questions of the category up to and including this one
+            category_position = bisect.bisect_right(category_ids[category], question_id)
+            progress_info = {
+                'overall_progress': ((question_id + 1) / total_questions) * 100,
+                'category_progress': (category_position / len(category_ids[category])) * 100,
+                'questions_remaining': total_questions - question_id - 1,
+                'current_category': category,
+                'category_name': self.question_categories[category]['name']
+            }
+            
+            enhanced_question = dict(question)
+            enhanced_question['category_info'] = category_infos[category]
+            enhanced_question['progress_info'] = MappingProxyType(progress_info)
+            # Add contextual hints for better user experience
+            if question['type'] in QUESTION_INSTRUCTIONS:
+                enhanced_question['instruction'] = QUESTION_INSTRUCTIONS[question['type']]
+            question_bank[question_id] = MappingProxyType(enhanced_question)
+        return MappingProxyType(question_bank)
+    
+    def get_question(self, question_id: int) -> Mapping[str, Any]:
+        """Get specific question by ID with enhanced metadata (a shared read-only view)"""
+        try:
+            return self.question_bank[question_id]
+        except KeyError:
+            raise ValueError(f"Question with ID {question_id} not found") from None
     
     def get_total_questions(self) -> int:
         """Get total number of questions"""
@@ -631,118 +756,54 @@ class QuestionnaireManager:
     
     def get_questions_by_category(self, category: str) -> List[Dict[str, Any]]:
         """Get all questions in a specific category"""
-        return [q for q in self.questions if q['category'] == category]
+        return list(self.questions_by_category.get(category, ()))
     
     def get_category_info(self, category: str) -> Dict[str, Any]:
         """Get information about a specific category"""
-        return self.question_categories.get(category, {})
+        return dict(self.question_categories.get(category, {}))
     
     def validate_response(self, question_id: int, response: Any) -> Dict[str, Any]:
         """Validate user response for a question with detailed feedback"""
-        question = self.get_question(question_id)
-        validation_result = {
-            'is_valid': False,
-            'error_message': '',
-            'processed_response': None,
-            'confidence_score': 1.0
-        }
-        
-        question_type = question['type']
-        
-        if question_type == 'likert':
-            valid_values = [option['value'] for option in question['options']]
-            if response in valid_values:
-                validation_result['is_valid'] = True
-                validation_result['processed_response'] = response
-                # Lower confidence for neutral responses
-                if response == 'neutral':
-                    validation_result['confidence_score'] = 0.7
-            else:
-                validation_result['error_message'] = f"Response must be one of: {', '.join(valid_values)}"
-        
-        elif question_type in ['multiple_choice', 'self_assessment']:
-            valid_values = [option['value'] for option in question['options']]
-            if response in valid_values:
-                validation_result['is_valid'] = True
-                validation_result['processed_response'] = response
-            else:
-                validation_result['error_message'] = f"Response must be one of: {', '.join(valid_values)}"
-        
-        elif question_type == 'multiple_select':
-            if isinstance(response, list):
-                valid_values = [option['value'] for option in question['options']]
-                if all(r in valid_values for r in response):
-                    validation_result['is_valid'] = True
-                    validation_result['processed_response'] = response
-                    # Higher confidence for multiple selections
-                    validation_result['confidence_score'] = min(1.0, 0.8 + len(response) * 0.1)
-                else:
-                    validation_result['error_message'] = "All selected options must be valid"
-            else:
-                validation_result['error_message'] = "Response must be a list of values"
+        try:
+            validator = self.validators[question_id]
+        except KeyError:
+            raise ValueError(f"Question with ID {question_id} not found") from None
+        return validator.validate(response)
+    
+    def validate_responses(self, user_responses: Dict[int, Any]) -> Dict[str, Any]:
+        """Validate a whole answer sheet in one pass and collect every error
         
-        elif question_type == 'ranking':
-            if isinstance(response, list):
-                valid_values = [option['value'] for option in question['options']]
-                if (len(response) == len(valid_values) and 
-                    set(response) == set(valid_values)):
-                    validation_result['is_valid'] = True
-                    validation_result['processed_response'] = response
-                    validation_result['confidence_score'] = 0.95  # High confidence for complete rankings
-                else:
-                    validation_result['error_message'] = "Must rank all provided options exactly once"
-            else:
-                validation_result['error_message'] = "Response must be a ranked list of all options"
+        Unknown question IDs are reported as errors rather than raised.
+        """
+        results = {}
+        errors = {}
+        for question_id, response in user_responses.items():
+            validator = self.validators.get(question_id)
+            if validator is None:
+                errors[question_id] = f"Question with ID {question_id} not found"
+                continue
+            result = results[question_id] = validator.validate(response)
+            if not result['is_valid']:
+                errors[question_id] = result['error_message']
         
-        return validation_result
+        return {
+            'is_valid': not errors,
+            'errors': errors,
+            'results': results
+        }
     
     def get_next_question_id(self, current_id: int, user_responses: Dict[int, Any]) -> Optional[int]:
         """Get next question ID with adaptive logic"""
-        return self.adaptive_logic.get_next_question(current_id, user_responses, self.questions)
+        return self.adaptive_logic.get_next_question(current_id, user_responses)
+    
+    def create_completion_tracker(self, user_responses: Optional[Dict[int, Any]] = None) -> CompletionTracker:
+        """Get a tracker that keeps the completion status current as answers are recorded"""
+        return CompletionTracker(self, user_responses)
     
     def get_assessment_completion_status(self, user_responses: Dict[int, Any]) -> Dict[str, Any]:
-        """Get detailed completion status of the assessment"""
-        total_questions = len(self.questions)
-        answered_questions = len(user_responses)
-        
-        # Calculate category completion
-        category_completion = {}
-        for category, info in self.question_categories.items():
-            category_questions = [q['id'] for q in self.questions if q['category'] == category]
-            answered_in_category = len([qid for qid in category_questions if qid in user_responses])
-            category_completion[category] = {
-                'answered': answered_in_category,
-                'total': len(category_questions),
-                'percentage': (answered_in_category / len(category_questions)) * 100,
-                'name': info['name']
-            }
+        """Get detailed completion status of the assessment
         
-        # Calculate confidence score based on response quality
-        confidence_scores = []
-        for question_id, response in user_responses.items():
-            validation = self.validate_response(question_id, response)
-            if validation['is_valid']:
-                confidence_scores.append(validation['confidence_score'])
-        
-        avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0
-        
-        # Determine if assessment is complete enough for results
-        min_completion_threshold = 0.8  # 80% minimum completion
-        is_complete_enough = (answered_questions / total_questions) >= min_completion_threshold
-        
-        # Check if all categories have minimum representation
-        category_min_threshold = 0.6  # 60% minimum per category
-        all_categories_represented = all(
-            comp['percentage'] >= category_min_threshold * 100
-            for comp in category_completion.values()
-        )
-        
-        return {
-            'total_questions': total_questions,
-            'answered_questions': answered_questions,
-            'completion_percentage': (answered_questions / total_questions) * 100,
-            'category_completion': category_completion,
-            'average_confidence': avg_confidence,
-            'is_complete_enough': is_complete_enough and all_categories_represented,
-            'all_categories_represented': all_categories_represented
-        }
+        Callers that poll while answers come in should keep a tracker from
+        create_completion_tracker instead of passing every answer again.
+        """
+        return self.create_completion_tracker(user_responses).get_status()
@@ -1,13 +1,16 @@
 # components/results_display.py
+import heapq
 import json
 import statistics
 from datetime import datetime
 from typing import Dict, List, Any, Optional
+from data.career_database import CareerDatabase
 
 class ResultsDisplay:
     """Formats and displays comprehensive career assessment results with professional presentation"""
     
-    def __init__(self):
+    def __init__(self, career_db: Optional[CareerDatabase] = None):
+        self.career_db = career_db or CareerDatabase()
         self.display_templates = self._initialize_templates()
         self.formatting_rules = self._initialize_formatting_rules()
         self.visualization_configs = self._initialize_visualizations()
@@ -135,7 +138,7 @@ class ResultsDisplay:
             'key_findings': [
                 f"Your personality type shows strong {', '.join(primary_traits[:2])} characteristics",
                 f"Found {len(career_matches)} potential career matches with {len(top_matches)} excellent fits",
-                f"Top career recommendation: {list(top_matches.values())[0]['career_info']['title'] if top_matches else 'Multiple options'}",
+                f"Top career recommendation: {list(top_matches.values())[0]['career_info'].title if top_matches else 'Multiple options'}",
                 f"Average compatibility score: {int(avg_match_score * 100)}%"
             ],
             'personality_highlight': self._create_personality_highlight(personality_profile),
@@ -156,7 +159,7 @@ class ResultsDisplay:
         if not top_matches:
             return "Career Assessment Complete - Multiple Pathways Identified"
         
-        top_career = list(top_matches.values())[0]['career_info']['title']
+        top_career = list(top_matches.values())[0]['career_info'].title
         match_score = int(list(top_matches.values())[0]['match_score'] * 100)
         
         trait_descriptor = ""
@@ -228,9 +231,9 @@ class ResultsDisplay:
             # Format individual career
             formatted_career = {
                 'id': career_id,
-                'title': career_info['title'],
-                'category': career_info['category'],
-                'description': career_info['description'],
+                'title': career_info.title,
+                'category': career_info.category,
+                'description': career_info.description,
                 'match_analysis': self._format_match_analysis(match_data),
                 'career_details': self._format_career_details(career_info),
                 'financial_outlook': self._format_financial_outlook(career_info),
@@ -244,7 +247,7 @@ class ResultsDisplay:
             formatted_careers.append(formatted_career)
             
             # Update category analysis
-            category = career_info['category']
+            category = career_info.category
             if category not in category_analysis:
                 category_analysis[category] = {
                     'careers': [],
@@ -253,7 +256,7 @@ class ResultsDisplay:
                 }
             
             category_analysis[category]['careers'].append({
-                'title': career_info['title'],
+                'title': career_info.title,
                 'match_score': match_data['match_score']
             })
             category_analysis[category]['total_careers'] += 1
@@ -306,7 +309,7 @@ class ResultsDisplay:
     
     def _format_financial_outlook(self, career_info: Dict) -> Dict[str, Any]:
         """Format financial and compensation information"""
-        salary_range = career_info.get('salary_range', {})
+        salary_range = career_info.salary_range
         
         financial_data = {
             'salary_ranges': self._format_salary_ranges(salary_range),
@@ -322,7 +325,7 @@ class ResultsDisplay:
     def _format_growth_prospects(self, career_info: Dict) -> Dict[str, Any]:
         """Format career growth and future prospects"""
         return {
-            'job_outlook': career_info.get('growth_outlook', 'Unknown'),
+            'job_outlook': career_info.growth_outlook,
             'growth_factors': self._identify_growth_factors(career_info),
             'future_trends': self._predict_future_trends(career_info),
             'automation_impact': self._assess_automation_impact(career_info),
@@ -333,7 +336,7 @@ class ResultsDisplay:
     
     def _format_skill_requirements(self, career_info: Dict) -> Dict[str, Any]:
         """Format skill requirements with detailed breakdown"""
-        required_skills = career_info.get('skills_required', [])
+        required_skills = career_info.skills_required
         
         # Categorize skills
         skill_categories = {
@@ -417,6 +420,7 @@ class ResultsDisplay:
         all_careers = list(career_matches.values())
         
         return {
+            'growth_rates': self._collect_growth_rates(career_matches),
             'industry_overview': self._analyze_industry_trends(all_careers),
             'salary_analysis': self._perform_salary_analysis(all_careers),
             'job_market_conditions': self._assess_job_market_conditions(all_careers),
@@ -427,6 +431,22 @@ class ResultsDisplay:
             'market_risks': self._identify_market_risks(all_careers)
         }
     
+    def _collect_growth_rates(self, career_matches: Dict) -> Dict[str, Any]:
+        """Projected growth percentages of the matched careers, parsed at catalog load"""
+        rates = {}
+        for career_id, match in career_matches.items():
+            rate = self.career_db.get_growth_percentage(career_id)
+            if rate is None:
+                rate = CareerDatabase.parse_growth_percentage(match['career_info'].growth_outlook)
+            if rate is not None:
+                rates[career_id] = rate
+        
+        return {
+            'by_career': rates,
+            'average': statistics.mean(rates.values()) if rates else None,
+            'fastest_growing': max(rates, key=rates.get) if rates else None
+        }
+    
     def _generate_action_plan(self, career_matches: Dict) -> Dict[str, Any]:
         """Generate specific, actionable career plan"""
         
@@ -439,7 +459,7 @@ class ResultsDisplay:
         return {
             'immediate_actions': {
                 'this_week': [
-                    f"Research {career_info['title']} job market in your area",
+                    f"Research {career_info.title} job market in your area",
                     "Update LinkedIn profile with relevant keywords",
                     "Identify 3 professionals in the field for informational interviews"
                 ],
@@ -574,16 +594,41 @@ class ResultsDisplay:
             'match_breakdown': self._prepare_match_breakdown_data(career_matches)
         }
     
+    def _prepare_salary_comparison_data(self, career_matches: Dict) -> Dict[str, Any]:
+        """Salary bands of the matched careers with their standing in the whole catalog"""
+        salary_index = self.career_db.get_salary_index()
+
+        careers = {}
+        for career_id, match in career_matches.items():
+            salary_range = match['career_info'].salary_range
+            careers[career_id] = {
+                'title': match['career_info'].title,
+                'bands': {
+                    level: {
+                        'low': low,
+                        'high': high,
+                        # Share of catalog careers whose band at this level starts lower
+                        'percentile': salary_index.percentile(level, low)
+                    }
+                    for level, (low, high) in salary_range.items()
+                }
+            }
+
+        return {
+            'careers': careers,
+            'levels': list(salary_index.levels)
+        }
+
     # Helper methods for formatting and analysis
-    
+
     def _get_top_matches(self, career_matches: Dict, limit: int) -> Dict:
         """Get top N career matches"""
-        sorted_matches = sorted(
+        top_matches = heapq.nlargest(
+            limit,
             career_matches.items(),
-            key=lambda x: x[1]['match_score'],
-            reverse=True
+            key=lambda x: x[1]['match_score']
         )
-        return dict(sorted_matches[:limit])
+        return dict(top_matches)
     
     def _get_trait_level(self, score: float) -> str:
         """Convert trait score to descriptive level"""
@@ -679,7 +724,7 @@ class ResultsDisplay:
 
     def _determine_compensation_structure(self, career_info: Dict) -> str:
         """Guess compensation structure based on career type"""
-        category = career_info.get('category', '').lower()
+        category = career_info.category.lower()
         if 'freelance' in category or 'creative' in category:
             return "Project-based / Freelance opportunities"
         elif 'sales' in category or 'business' in category:
@@ -689,7 +734,7 @@ class ResultsDisplay:
 
     def _assess_earning_potential(self, career_info: Dict) -> str:
         """Provide high-level statement on earning potential"""
-        salary = career_info.get('salary_range', {})
+        salary = career_info.salary_range
         if not salary:
             return "Unknown earning potential"
         senior_max = salary.get('senior', (0, 0))[1]
@@ -719,7 +764,7 @@ class ResultsDisplay:
 
     def _compare_industry_salaries(self, career_info: Dict) -> str:
         """Placeholder industry comparison"""
-        category = career_info.get('category', '').lower()
+        category = career_info.category.lower()
         if 'technology' in category:
             return "Technology careers generally pay above average compared to other fields."
         elif 'healthcare' in category:
@@ -0,0 +1,132 @@
+# components/sharded_matcher.py
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+
+import numpy as np
+
+from components.career_matcher import CareerMatcher
+from config.settings import Config
+from data.career_database import CareerDatabase
+from data.personality_traits import PersonalityTraits
+
+# Per-process state of a shard worker, set once by _init_shard_worker
+_worker_matcher = None
+
+
+def _init_shard_worker(catalog_source, snapshot_path, trait_mappings_source, rows):
+    """Build the matcher once per worker process over its own shard of catalog rows only"""
+    global _worker_matcher
+    _worker_matcher = CareerMatcher(
+        career_db=CareerDatabase(catalog_source, snapshot_path, rows=rows),
+        personality_traits=PersonalityTraits(trait_mappings_source)
+    )
+
+
+def _score_shard(personality_profiles, processed_profiles, top_k):
+    """Score a batch against the worker's shard"""
+    result = _worker_matcher.calculate_batch_matches(personality_profiles, processed_profiles, top_k)
+    result['catalog_version'] = _worker_matcher.matching_engine.catalog_version
+    return result
+
+
+class ShardedMatcher:
+    """Batch career matching split across worker processes by catalog shard
+
+    The catalog is cut into contiguous row ranges, one per worker. Each worker is
+    a single-process pool whose initializer loads only its rows from the same
+    catalog source as career_matcher and builds a matcher over them, so the
+    shard is loaded once and reused for every batch. Shards return their
+    own top-k, which are merged by score with ties in catalog order. Catalogs too
+    small to fill more than one shard are scored in-process.
+    """
+
+    def __init__(self, career_matcher=None, max_workers=None, min_shard_size=None):
+        self.career_matcher = career_matcher or CareerMatcher()
+        self.max_workers = max_workers if max_workers is not None else Config.MATCHING_WORKERS
+        self.min_shard_size = min_shard_size if min_shard_size is not None else Config.MATCHING_MIN_SHARD_SIZE
+
+        engine = self.career_matcher.matching_engine
+        shard_count = min(self.max_workers, len(engine.career_ids) // max(self.min_shard_size, 1))
+        self.shards = (
+            np.array_split(np.arange(len(engine.career_ids)), shard_count)
+            if shard_count > 1 else []
+        )
+        # Catalog version each worker must report, to catch a source that changed under it
+        all_careers = self.career_matcher.career_db.get_all_careers()
+        trait_mappings = self.career_matcher.personality_traits.career_trait_mappings
+        self.shard_versions = [
+            engine._compute_catalog_version(
+                {engine.career_ids[row]: all_careers[engine.career_ids[row]] for row in rows}, trait_mappings
+            )
+            for rows in self.shards
+        ]
+        self._executors = None
+
+    @property
+    def is_sharded(self):
+        """Whether batches are scored in worker processes"""
+        return bool(self.shards)
+
+    def _get_executors(self):
+        if self._executors is None:
+            career_db = self.career_matcher.career_db
+            trait_mappings_source = self.career_matcher.personality_traits.career_mappings_source
+            self._executors = [
+                ProcessPoolExecutor(
+                    max_workers=1, initializer=_init_shard_worker,
+                    initargs=(career_db.source, career_db.snapshot_path, trait_mappings_source, rows.tolist())
+                )
+                for rows in self.shards
+            ]
+        return self._executors
+
+    def calculate_batch_matches(self, personality_profiles, processed_profiles, top_k=10):
+        """Same result as CareerMatcher.calculate_batch_matches, computed shard by shard"""
+        if not self.is_sharded:
+            return self.career_matcher.calculate_batch_matches(
+                personality_profiles, processed_profiles, top_k
+            )
+
+        futures = [
+            executor.submit(_score_shard, personality_profiles, processed_profiles, top_k)
+            for executor in self._get_executors()
+        ]
+        results = [future.result() for future in futures]
+
+        engine = self.career_matcher.matching_engine
+        for result, shard_version in zip(results, self.shard_versions):
+            if result['catalog_version'] != shard_version:
+                raise RuntimeError("Shard worker loaded a different career catalog")
+
+        scores = np.hstack([result['scores'] for result in results])
+        career_index = engine.career_index
+        top_matches = [
+            [
+                (career_id, score)
+                for score, _, career_id in heapq.nlargest(
+                    top_k,
+                    ((score, -career_index[career_id], career_id)
+                     for result in results for career_id, score in result['top_matches'][row])
+                )
+            ]
+            for row in range(len(processed_profiles))
+        ]
+
+        return {
+            'career_ids': list(engine.career_ids),
+            'scores': scores,
+            'top_matches': top_matches
+        }
+
+    def close(self):
+        """Shut down the worker processes"""
+        if self._executors is not None:
+            for executor in self._executors:
+                executor.shutdown()
+            self._executors = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
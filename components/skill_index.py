@@ -0,0 +1,187 @@
+# components/skill_index.py
+import numpy as np
+from scipy.sparse import csr_matrix
+
+
+class SkillIndex:
+    """Canonical skill vocabulary with a precomputed sparse skill similarity table
+
+    Required skills (from the career catalog) and user skills (from skill scores)
+    share one vocabulary of canonical ids. For every user skill the index stores
+    the sparse list of related required skills and their similarity tier
+    (1.0 exact, 0.8 substring, 0.6 related), so skills matching is a lookup
+    instead of a nested scan over string pairs. Skills outside the vocabulary
+    (arbitrary user input) are scored without being added, so lookups never
+    grow the index.
+    """
+
+    def __init__(self, required_skills, user_skills, skill_relations):
+        self.skill_relations = skill_relations
+        self.skill_ids = {}
+        self.skills = []
+        self.required_skill_ids = []
+        self.required_skill_set = set()
+        self.related_required = {}
+
+        for skill in required_skills:
+            self.add_required_skill(skill)
+        for skill in user_skills:
+            self._related_required_for(self.skill_id(skill))
+
+    # ---------- Vocabulary ----------
+
+    def canonical(self, skill):
+        """Canonical form used for every skill comparison"""
+        return skill.lower()
+
+    def skill_id(self, skill):
+        """Get (or assign) the canonical id of a skill"""
+        canonical = self.canonical(skill)
+        skill_id = self.skill_ids.get(canonical)
+        if skill_id is None:
+            skill_id = len(self.skills)
+            self.skill_ids[canonical] = skill_id
+            self.skills.append(canonical)
+        return skill_id
+
+    def add_required_skill(self, skill):
+        """Register a skill that careers can require, extending already-built similarity rows"""
+        skill_id = self.skill_id(skill)
+        if skill_id in self.required_skill_set:
+            return skill_id
+
+        self.required_skill_ids.append(skill_id)
+        self.required_skill_set.add(skill_id)
+        for user_id, related in self.related_required.items():
+            similarity = self.similarity(self.skills[user_id], self.skills[skill_id])
+            if similarity:
+                self.related_required[user_id] = related + ((skill_id, similarity),)
+        return skill_id
+
+    def required_ids(self, skills):
+        """Canonical ids for a career's required skills, in the order given"""
+        return tuple(self.add_required_skill(skill) for skill in skills)
+
+    # ---------- Similarity ----------
+
+    def similarity(self, skill1, skill2):
+        """Similarity tier between two canonical skills, 0.0 if unrelated"""
+        if skill1 == skill2:
+            return 1.0
+        if skill1 in skill2 or skill2 in skill1:
+            return 0.8
+
+        for base_skill, related in self.skill_relations.items():
+            if base_skill in skill1 and any(rel in skill2 for rel in related):
+                return 0.6
+            if base_skill in skill2 and any(rel in skill1 for rel in related):
+                return 0.6
+
+        return 0.0
+
+    def _related_required_for(self, user_id):
+        """Sparse similarity row of a vocabulary skill against every required skill (memoized)"""
+        related = self.related_required.get(user_id)
+        if related is None:
+            related = self._similarity_row(self.skills[user_id])
+            self.related_required[user_id] = related
+        return related
+
+    def _similarity_row(self, user_skill):
+        row = []
+        for required_id in self.required_skill_ids:
+            similarity = self.similarity(self.skills[required_id], user_skill)
+            if similarity:
+                row.append((required_id, similarity))
+        return tuple(row)
+
+    def related_required_skills(self, skill):
+        """Sparse (required id, similarity) row of any skill, without adding it to the vocabulary"""
+        canonical = self.canonical(skill)
+        skill_id = self.skill_ids.get(canonical)
+        if skill_id is None:
+            return self._similarity_row(canonical)
+        return self._related_required_for(skill_id)
+
+    # ---------- Matching ----------
+
+    def best_matches(self, user_skills):
+        """Best proficiency-weighted match for every required skill the user relates to"""
+        best = {}
+        for user_skill, proficiency in user_skills.items():
+            for required_id, similarity in self.related_required_skills(user_skill):
+                weighted_match = similarity * proficiency
+                if weighted_match > best.get(required_id, 0):
+                    best[required_id] = weighted_match
+        return best
+
+    def skills_match(self, required_ids, best_matches):
+        """Skills compatibility for one career given the user's best matches"""
+        if not required_ids:
+            return 0.5
+
+        total_match = 0
+        matched_skills = 0
+        for required_id in required_ids:
+            best_match = best_matches.get(required_id, 0)
+            total_match += best_match
+            if best_match > 0.3:
+                matched_skills += 1
+
+        base_score = total_match / len(required_ids)
+        coverage_bonus = matched_skills / len(required_ids) * 0.2
+
+        return min(1.0, base_score + coverage_bonus)
+
+
+class CareerSkillMatrix:
+    """Sparse careers x skills matrix for scoring skills match across the whole catalog
+
+    Row c holds a 1 for every skill career c requires, in the skill index's
+    canonical ids. Given the user's best match per required skill as a dense
+    vector, one sparse mat-vec yields every career's summed match and a second
+    one its count of well-matched skills, reproducing SkillIndex.skills_match
+    for all careers at once.
+    """
+
+    def __init__(self, skill_index, career_required_ids):
+        indptr = [0]
+        indices = []
+        for required_ids in career_required_ids:
+            indices.extend(required_ids)
+            indptr.append(len(indices))
+
+        self.n_skills = len(skill_index.skills)
+        # Entries keep the career's own skill order so sums accumulate as in skills_match
+        self.matrix = csr_matrix(
+            (np.ones(len(indices)), np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+            shape=(len(career_required_ids), self.n_skills)
+        )
+        self.required_counts = np.diff(indptr)
+
+    def required_ids(self, row):
+        """Skill ids required by one career row, in the career's own order"""
+        start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+        return self.matrix.indices[start:end].tolist()
+
+    def user_vector(self, best_matches):
+        """Dense vector of the user's best match per skill id"""
+        vector = np.zeros(self.n_skills)
+        for skill_id, best_match in best_matches.items():
+            if skill_id < self.n_skills:
+                vector[skill_id] = best_match
+        return vector
+
+    def skills_matches(self, best_matches, rows=None):
+        """Skills compatibility of every career (or the given career rows) for one user"""
+        matrix, counts = self.matrix, self.required_counts
+        if rows is not None:
+            matrix, counts = matrix[rows], counts[rows]
+
+        proficiency = self.user_vector(best_matches)
+        total_match = matrix @ proficiency
+        matched_skills = matrix @ (proficiency > 0.3).astype(float)
+
+        required = np.maximum(counts, 1)
+        scores = np.minimum(1.0, total_match / required + matched_skills / required * 0.2)
+        return np.where(counts > 0, scores, 0.5)
@@ -40,13 +40,25 @@ class Config:
     # Recommendation Settings
     MAX_RECOMMENDATIONS = 10
     MIN_MATCH_THRESHOLD = 0.60
+    MATCHING_WORKERS = int(os.environ.get('MATCHING_WORKERS') or os.cpu_count() or 1)
+    MATCHING_MIN_SHARD_SIZE = 500  # Smaller catalogs are scored in-process
     
     # Database Configuration (if using database)
     DATABASE_URL = os.environ.get('DATABASE_URL') or 'sqlite:///career_consultant.db'
+    # Career catalog: a JSON file, a SQLite file or a sqlite:/// URL (e.g. DATABASE_URL); unset uses the built-in careers
+    CAREER_CATALOG_SOURCE = os.environ.get('CAREER_CATALOG_SOURCE')
+    CAREER_CATALOG_SNAPSHOT = os.environ.get('CAREER_CATALOG_SNAPSHOT')  # Fast-start snapshot of a JSON catalog
+    CAREER_CATALOG_SNAPSHOT_SECRET = os.environ.get('CAREER_CATALOG_SNAPSHOT_SECRET')  # Signs the snapshot; required with it
+    CAREER_TRAIT_MAPPINGS_SOURCE = os.environ.get('CAREER_TRAIT_MAPPINGS_SOURCE')  # JSON file; unset uses the built-in mappings
+    CATALOG_WATCH_INTERVAL = float(os.environ.get('CATALOG_WATCH_INTERVAL') or 0)  # Seconds between change checks; 0 disables
     
     # API Configuration
     EXTERNAL_API_KEY = os.environ.get('EXTERNAL_API_KEY')
     CACHE_TIMEOUT = 3600  # 1 hour
+    RESULT_CACHE_SIZE = 2048  # Max cached assessment results per process
+    RESULT_CACHE_PATH = os.environ.get('RESULT_CACHE_PATH')  # Optional on-disk persistence
+    RESULT_CACHE_SECRET = os.environ.get('RESULT_CACHE_SECRET')  # Signs the persisted cache; required with RESULT_CACHE_PATH
+    RESULT_CACHE_SAVE_INTERVAL = 5.0  # Seconds new results are batched before the cache file is rewritten
     
     # UI Configuration
     ITEMS_PER_PAGE = 20
@@ -0,0 +1,110 @@
+# data/autocomplete.py
+from bisect import bisect_left
+import heapq
+
+from data.search_index import tokenize
+
+
+class AutocompleteIndex:
+    """Sorted-array prefix index over career titles, aliases and required skills
+
+    Every suggestion is indexed under its full normalized text and under each
+    word suffix ("software engineer" and "engineer"), so typing any word of a
+    title finds it. Keys live in one sorted list; a prefix is a bisect to a
+    contiguous key range. Suggestions are ranked once by popularity at build
+    time, so a lookup only compares integer ranks. Short prefixes cover huge
+    ranges, so their top suggestions are precomputed and served as-is.
+
+    Each career weighs one plus its entry in the popularity mapping
+    (career_id -> weight, e.g. how often it is viewed or recommended). A
+    suggestion is as popular as the careers behind it, so without external
+    data widely required skills come first.
+    """
+
+    def __init__(self, careers, popularity=None, max_limit=10, cached_prefix_length=2):
+        popularity = popularity or {}
+        self.max_limit = max_limit
+        self.cached_prefix_length = cached_prefix_length
+
+        suggestions = {}  # (kind, normalized text) -> suggestion
+        for career_id, career in careers.items():
+            weight = 1 + popularity.get(career_id, 0)
+            title = career.get('title', career_id)
+            self._add(suggestions, 'career', title, career_id, weight)
+            for alias in career.get('aliases', ()):
+                self._add(suggestions, 'alias', alias, career_id, weight)
+            for skill in career.get('skills_required', ()):
+                self._add(suggestions, 'skill', skill, None, weight)
+
+        for suggestion in suggestions.values():
+            suggestion['career_ids'] = tuple(suggestion['career_ids'])
+
+        # Rank 0 is the most popular suggestion; ties go alphabetically
+        self.suggestions = sorted(
+            suggestions.values(), key=lambda suggestion: (-suggestion['popularity'], suggestion['text'])
+        )
+
+        keyed = []
+        for rank, suggestion in enumerate(self.suggestions):
+            words = tokenize(suggestion['text'])
+            for start in range(len(words)):
+                keyed.append((' '.join(words[start:]), rank))
+        keyed.sort()
+        self.keys = [key for key, _ in keyed]
+        self.ranks = [rank for _, rank in keyed]
+
+        self.cached = self._precompute_short_prefixes()
+
+    @staticmethod
+    def _add(suggestions, kind, text, career_id, weight):
+        normalized = ' '.join(tokenize(text))
+        if not normalized:
+            return
+        suggestion = suggestions.get((kind, normalized))
+        if suggestion is None:
+            suggestion = suggestions[(kind, normalized)] = {
+                'text': text,
+                'kind': kind,
+                'career_ids': [],
+                'popularity': 0
+            }
+        if career_id is not None:
+            suggestion['career_ids'].append(career_id)
+        suggestion['popularity'] += weight
+
+    def _precompute_short_prefixes(self):
+        """Top ranks for every prefix up to cached_prefix_length characters"""
+        cached = {}
+        for length in range(1, self.cached_prefix_length + 1):
+            for prefix in {key[:length] for key in self.keys if len(key) >= length}:
+                cached[prefix] = self._top_ranks(prefix, self.max_limit)
+        return cached
+
+    def _prefix_ranks(self, prefix):
+        """Distinct suggestion ranks of every key starting with prefix"""
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, prefix + '\uffff', start)
+        return set(self.ranks[start:end])
+
+    def _top_ranks(self, prefix, limit):
+        return heapq.nsmallest(limit, self._prefix_ranks(prefix))
+
+    def complete(self, prefix, limit=10, kinds=None):
+        """Most popular suggestions whose text (or one of its words) starts with prefix
+
+        kinds restricts the result to some of 'career', 'alias' and 'skill'.
+        Suggestions are returned as copies, so callers cannot change the index.
+        """
+        prefix = ' '.join(tokenize(prefix))
+        if not prefix or limit <= 0:
+            return []
+
+        if kinds is None and limit <= self.max_limit and prefix in self.cached:
+            ranks = self.cached[prefix][:limit]
+        else:
+            candidates = self._prefix_ranks(prefix)
+            if kinds is not None:
+                candidates = {rank for rank in candidates if self.suggestions[rank]['kind'] in kinds}
+            ranks = heapq.nsmallest(limit, candidates)
+
+        return [dict(self.suggestions[rank]) for rank in ranks]
@@ -1,10 +1,41 @@
 
 # data/career_database.py
+from itertools import islice
+import re
+
+from config.settings import Config
+from data.autocomplete import AutocompleteIndex
+from data.catalog_loader import load_catalog, select_rows
+from data.records import Career
+from data.salary_index import SalaryIndex
+from data.search_index import CareerSearchIndex
+
+
 class CareerDatabase:
     """Central database of career information and requirements"""
     
-    def __init__(self):
-        self.careers = self._initialize_careers()
+    def __init__(self, source=None, snapshot_path=None, rows=None):
+        source = source if source is not None else Config.CAREER_CATALOG_SOURCE
+        snapshot_path = snapshot_path if snapshot_path is not None else Config.CAREER_CATALOG_SNAPSHOT
+        self.source = source
+        self.snapshot_path = snapshot_path
+        # External catalogs (JSON file or SQLite) replace the built-in careers;
+        # rows keeps only those catalog positions (one shard of the catalog)
+        if source:
+            careers = load_catalog(source, snapshot_path, rows)
+        else:
+            careers = self._initialize_careers()
+            if rows is not None:
+                careers = select_rows(careers, rows)
+        if type(careers) is dict:  # Compiled catalogs decode their own records on demand
+            careers = self._freeze_careers(careers)
+        self.careers = careers
+        self.growth_percentages = self._compile_growth_percentages()
+        # Built once on first use; the catalog never changes after load
+        self._search_index = None
+        self._salary_index = None
+        self._autocomplete_index = None
+        self._autocomplete_index_popularity = None
     
     def _initialize_careers(self):
         """Initialize comprehensive career database"""
@@ -194,34 +225,123 @@ class CareerDatabase:
             }
         }
     
+    def _freeze_careers(self, careers):
+        """Store careers as immutable slotted records; they still read like dicts"""
+        return {career_id: Career.from_dict(career) for career_id, career in careers.items()}
+    
+    def _compile_growth_percentages(self):
+        """Parse the numeric growth rate out of every career's outlook once, at load"""
+        return {
+            career_id: self.parse_growth_percentage(career.get('growth_outlook', ''))
+            for career_id, career in self.careers.items()
+        }
+
+    @staticmethod
+    def parse_growth_percentage(growth_outlook):
+        """Extract the percentage from an outlook like 'Excellent (22% growth expected)'"""
+        match = re.search(r'(-?\d+(?:\.\d+)?)\s*%', growth_outlook or '')
+        return float(match.group(1)) if match else None
+
+    def get_growth_percentage(self, career_id):
+        """Get the projected growth percentage of a career, or None if not stated"""
+        return self.growth_percentages.get(career_id)
+
     def get_career(self, career_id):
         """Get specific career information"""
         return self.careers.get(career_id)
     
+    def get_career_category(self, career_id):
+        """Get a career's category without decoding its record where the store allows"""
+        category = getattr(self.careers, 'category', None)
+        if category is not None:
+            return category(career_id)
+        return self.careers[career_id]['category']
+    
     def get_all_careers(self):
         """Get all careers in database"""
         return self.careers
     
-    def search_careers(self, category=None, keywords=None):
-        """Search careers by category or keywords"""
+    def get_careers_page(self, offset=0, limit=None):
+        """Get one page of the loaded careers in catalog order"""
+        limit = limit if limit is not None else Config.ITEMS_PER_PAGE
+        return dict(islice(self.careers.items(), offset, offset + limit))
+    
+    def get_search_index(self):
+        """Inverted index over the catalog, built on first use"""
+        if self._search_index is None:
+            self._search_index = CareerSearchIndex(self.careers)
+        return self._search_index
+    
+    def get_salary_index(self):
+        """Sorted per-level salary columns of the catalog, built on first use"""
+        if self._salary_index is None:
+            self._salary_index = SalaryIndex(self.careers)
+        return self._salary_index
+    
+    def get_autocomplete_index(self, popularity=None, popularity_version=None):
+        """Prefix index over titles, aliases and skills, rebuilt only when popularity changes
+        
+        With popularity_version set, the index is kept while the version stays
+        the same. Otherwise it is kept while popularity holds the same weights
+        as the copy taken when the index was built, so a mapping updated in
+        place is still noticed.
+        """
+        if popularity_version is not None:
+            popularity_key = ('version', popularity_version)
+        else:
+            popularity_key = ('weights', popularity or {})
+        if self._autocomplete_index is None or self._autocomplete_index_popularity != popularity_key:
+            self._autocomplete_index = AutocompleteIndex(self.careers, popularity)
+            if popularity_version is None:
+                # A copy, never the caller's mapping, so edits made to it in place count as changes
+                popularity_key = ('weights', dict(popularity_key[1]))
+            self._autocomplete_index_popularity = popularity_key
+        return self._autocomplete_index
+    
+    def autocomplete(self, prefix, limit=10, kinds=None, popularity=None, popularity_version=None):
+        """Popularity-ranked career title, alias and skill suggestions for a typed prefix"""
+        return self.get_autocomplete_index(popularity, popularity_version).complete(prefix, limit, kinds)
+    
+    def get_careers_by_salary(self, level='mid', min_salary=None, max_salary=None):
+        """Get careers whose salary band at level overlaps [min_salary, max_salary]"""
+        return {
+            career_id: self.careers[career_id]
+            for career_id in self.get_salary_index().overlapping(level, min_salary, max_salary)
+        }
+    
+    def search_careers(self, category=None, keywords=None, match_all=False, prefix=True,
+                       salary_level=None, salary_min=None, salary_max=None):
+        """Search careers by category, keywords or salary band
+        
+        Keywords match title, description and skill tokens (by prefix unless
+        prefix is False) and results are ordered by BM25 relevance. Keywords are
+        OR-ed, or AND-ed with match_all. Without keywords, catalog order is kept.
+        With salary_level, only careers whose band at that level overlaps
+        [salary_min, salary_max] are kept.
+        """
+        salary_matches = None
+        if salary_level is not None:
+            salary_matches = self.get_salary_index().overlapping(salary_level, salary_min, salary_max)
+        
+        if keywords:
+            candidates = [
+                career_id for career_id, _ in self.get_search_index().search(keywords, match_all, prefix)
+            ]
+            if salary_matches is not None:
+                salary_matches = set(salary_matches)
+                candidates = [career_id for career_id in candidates if career_id in salary_matches]
+        elif salary_matches is not None:
+            candidates = salary_matches
+        else:
+            candidates = self.careers
+        
         results = {}
-        for career_id, career in self.careers.items():
-            if category and career['category'].lower() != category.lower():
+        for career_id in candidates:
+            if category and self.get_career_category(career_id).lower() != category.lower():
                 continue
-            if keywords:
-                career_text = f"{career['title']} {career['description']} {' '.join(career['skills_required'])}".lower()
-                if not any(keyword.lower() in career_text for keyword in keywords):
-                    continue
-            results[career_id] = career
+            results[career_id] = self.careers[career_id]
         return results
     
     def get_careers_by_skills(self, skills):
-        """Get careers matching specific skills"""
-        matching_careers = {}
-        for career_id, career in self.careers.items():
-            skill_matches = len(set(skills) & set([skill.lower() for skill in career['skills_required']]))
-            if skill_matches > 0:
-                career_copy = career.copy()
-                career_copy['skill_match_count'] = skill_matches
-                matching_careers[career_id] = career_copy
-        return matching_careers
+        """Get (career_id, matching skill count) pairs for careers requiring any of the skills"""
+        return self.get_search_index().careers_by_skills(skills)
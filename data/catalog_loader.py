@@ -0,0 +1,323 @@
+# data/catalog_loader.py
+import hashlib
+import hmac
+import json
+import os
+import pickle
+import sqlite3
+import tempfile
+
+from config.settings import Config
+from data.compiled_catalog import CompiledCatalog
+from data.records import record_to_json
+
+SNAPSHOT_FORMAT = 1
+
+CAREER_SCHEMA = {
+    # field: (expected type, required)
+    'title': (str, True),
+    'category': (str, True),
+    'description': (str, True),
+    'skills_required': (list, True),
+    'salary_range': (dict, True),
+    'growth_outlook': (str, True),
+    'requirements': (dict, False),
+    'work_environment': (str, False),
+    'personality_match': (list, False),
+    'interests': (list, False),
+    'values': (list, False),
+    'work_style': (list, False),
+    'aliases': (list, False)
+}
+
+STRING_LIST_FIELDS = ['skills_required', 'personality_match', 'interests', 'values', 'work_style', 'aliases']
+
+
+class CatalogValidationError(ValueError):
+    """Raised when career records do not match the catalog schema"""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(f"Invalid career catalog: {'; '.join(errors)}")
+
+
+def validate_career(career_id, career):
+    """Check one career record against the schema and return a normalized copy
+
+    JSON has no tuples, so salary ranges are normalized to (low, high) tuples
+    like the built-in catalog uses. Raises CatalogValidationError listing every
+    problem found in the record.
+    """
+    errors = []
+    if not isinstance(career_id, str) or not career_id:
+        errors.append(f"career id {career_id!r} must be a non-empty string")
+    if not isinstance(career, dict):
+        raise CatalogValidationError(errors + [f"{career_id}: record must be an object"])
+
+    for field, (expected_type, required) in CAREER_SCHEMA.items():
+        if field not in career:
+            if required:
+                errors.append(f"{career_id}: missing required field '{field}'")
+        elif not isinstance(career[field], expected_type):
+            errors.append(f"{career_id}: '{field}' must be of type {expected_type.__name__}")
+
+    for field in STRING_LIST_FIELDS:
+        if isinstance(career.get(field), list) and not all(isinstance(item, str) for item in career[field]):
+            errors.append(f"{career_id}: '{field}' must only contain strings")
+
+    salary_range = {}
+    if isinstance(career.get('salary_range'), dict):
+        for level, bounds in career['salary_range'].items():
+            if (not isinstance(bounds, (list, tuple)) or len(bounds) != 2
+                    or not all(isinstance(bound, (int, float)) for bound in bounds)
+                    or bounds[0] > bounds[1]):
+                errors.append(f"{career_id}: salary_range '{level}' must be a [low, high] pair")
+            else:
+                salary_range[level] = tuple(bounds)
+
+    if errors:
+        raise CatalogValidationError(errors)
+
+    normalized = dict(career)
+    normalized['salary_range'] = salary_range
+    return normalized
+
+
+def validate_catalog(careers):
+    """Validate every career, collecting the errors of all records before raising"""
+    validated = {}
+    errors = []
+    for career_id, career in careers.items():
+        try:
+            validated[career_id] = validate_career(career_id, career)
+        except CatalogValidationError as e:
+            errors.extend(e.errors)
+    if errors:
+        raise CatalogValidationError(errors)
+    return validated
+
+
+def select_rows(careers, rows):
+    """The careers at the given catalog positions, in that order"""
+    career_ids = list(careers)
+    return {career_ids[row]: careers[career_ids[row]] for row in rows}
+
+
+def sqlite_path_from_url(database_url):
+    """File path of a sqlite:/// URL such as Config.DATABASE_URL"""
+    prefix = 'sqlite:///'
+    if not database_url.startswith(prefix):
+        raise ValueError(f"Unsupported catalog database URL: {database_url}")
+    return database_url[len(prefix):]
+
+
+# ---------- JSON ----------
+
+def load_catalog_json(path, rows=None):
+    """Load and validate a JSON catalog of {career_id: career}, or only the given rows of it
+
+    JSON cannot be read in part, so the whole file is always parsed; with rows
+    set only the records at those positions are validated and kept.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        careers = json.load(f)
+    if not isinstance(careers, dict):
+        raise CatalogValidationError([f"{path}: top level must be an object of careers"])
+    if rows is not None:
+        careers = select_rows(careers, rows)
+    return validate_catalog(careers)
+
+
+def load_trait_mappings_json(path):
+    """Load and validate career trait mappings of {career_id: {trait: required level in [0, 1]}}"""
+    with open(path, 'r', encoding='utf-8') as f:
+        mappings = json.load(f)
+    if not isinstance(mappings, dict):
+        raise CatalogValidationError([f"{path}: top level must be an object of trait mappings"])
+
+    errors = []
+    for career_id, traits in mappings.items():
+        if not isinstance(traits, dict):
+            errors.append(f"{career_id}: trait mapping must be an object")
+            continue
+        for trait, level in traits.items():
+            if not isinstance(level, (int, float)) or not 0 <= level <= 1:
+                errors.append(f"{career_id}: level of '{trait}' must be a number between 0 and 1")
+    if errors:
+        raise CatalogValidationError(errors)
+    return mappings
+
+
+def save_catalog_json(path, careers):
+    """Write a catalog to JSON, e.g. to export the built-in careers"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(dict(careers), f, indent=2, default=record_to_json)
+
+
+# ---------- SQLite ----------
+
+def save_catalog_sqlite(path, careers):
+    """Write a catalog into the careers table of a SQLite database"""
+    connection = sqlite3.connect(path)
+    try:
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS careers ("
+                "career_id TEXT PRIMARY KEY, position INTEGER NOT NULL, data TEXT NOT NULL)"
+            )
+            connection.execute("DELETE FROM careers")
+            connection.executemany(
+                "INSERT INTO careers (career_id, position, data) VALUES (?, ?, ?)",
+                [(career_id, position, json.dumps(career, default=record_to_json))
+                 for position, (career_id, career) in enumerate(careers.items())]
+            )
+    finally:
+        connection.close()
+
+
+def load_catalog_sqlite(path, rows=None):
+    """Load and validate every career of a SQLite careers table, in catalog order
+
+    The whole table is read and validated once at load, so schema errors
+    surface when the catalog is loaded rather than on first access. With rows
+    set, the query itself selects the records at those catalog positions, so
+    only they are read, parsed and validated.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Career catalog database not found: {path}")
+    connection = sqlite3.connect(path)
+    try:
+        if rows is None:
+            records = connection.execute("SELECT career_id, data FROM careers ORDER BY position").fetchall()
+        else:
+            # Catalog positions are row numbers in position order, numbered without
+            # reading any record data; the wanted ones are passed as one JSON array,
+            # which has no bound-parameter limit
+            selected = {
+                row: (career_id, data)
+                for row, career_id, data in connection.execute(
+                    "SELECT numbered.row, careers.career_id, careers.data FROM careers JOIN ("
+                    "SELECT rowid AS id, ROW_NUMBER() OVER (ORDER BY position) - 1 AS row FROM careers"
+                    ") AS numbered ON careers.rowid = numbered.id "
+                    "WHERE numbered.row IN (SELECT value FROM json_each(?))",
+                    (json.dumps(list(rows)),)
+                )
+            }
+            records = [selected[row] for row in rows]
+    finally:
+        connection.close()
+
+    careers = {}
+    errors = []
+    for career_id, data in records:
+        try:
+            careers[career_id] = json.loads(data)
+        except json.JSONDecodeError:
+            errors.append(f"{career_id}: record is not valid JSON")
+    try:
+        careers = validate_catalog(careers)
+    except CatalogValidationError as e:
+        errors.extend(e.errors)
+    if errors:
+        raise CatalogValidationError(errors)
+    return careers
+
+
+# ---------- Snapshots ----------
+
+def _source_fingerprint(path):
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_size, stat.st_mtime_ns
+
+
+def _sign_snapshot(secret, payload):
+    return hmac.new(secret.encode('utf-8'), payload, hashlib.sha256).digest()
+
+
+def save_snapshot(snapshot_path, source_path, careers, secret):
+    """Write validated careers as a signed pickle tagged with the source file's fingerprint
+
+    Each writer goes through its own temporary file, so workers starting
+    together can all write the snapshot; the last replace wins.
+    """
+    payload = pickle.dumps(
+        {'format': SNAPSHOT_FORMAT, 'source': _source_fingerprint(source_path), 'careers': careers},
+        protocol=pickle.HIGHEST_PROTOCOL
+    )
+    directory = os.path.dirname(os.path.abspath(snapshot_path))
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=directory, prefix='.catalog-snapshot-', delete=False) as f:
+        f.write(_sign_snapshot(secret, payload) + payload)
+    try:
+        os.replace(f.name, snapshot_path)
+    except OSError:
+        os.unlink(f.name)
+        raise
+
+
+def load_snapshot(snapshot_path, source_path, secret):
+    """Validated careers from a snapshot, or None if it is missing, stale or not signed with secret
+
+    The file is only unpickled when its signature matches.
+    """
+    try:
+        with open(snapshot_path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    digest_size = hashlib.sha256().digest_size
+    signature, payload = data[:digest_size], data[digest_size:]
+    if len(signature) != digest_size or not hmac.compare_digest(signature, _sign_snapshot(secret, payload)):
+        return None
+    try:
+        snapshot = pickle.loads(payload)
+    except (pickle.UnpicklingError, EOFError):
+        return None
+
+    if (not isinstance(snapshot, dict) or snapshot.get('format') != SNAPSHOT_FORMAT
+            or snapshot.get('source') != _source_fingerprint(source_path)):
+        return None
+    return snapshot['careers']
+
+
+# ---------- Entry point ----------
+
+def load_catalog(source, snapshot_path=None, rows=None, snapshot_secret=None):
+    """Load a career catalog from a JSON file, a SQLite file, a sqlite:/// URL or a compiled catalog
+
+    JSON and SQLite catalogs are read and validated in full. With
+    snapshot_path set, the validated careers are written to a snapshot that
+    later loads reuse without parsing or validating until the source file
+    changes; the snapshot is signed with snapshot_secret (default
+    Config.CAREER_CATALOG_SNAPSHOT_SECRET), which is required with it.
+    Compiled catalogs (.catalog) are opened over a shared memory map.
+    With rows set only the careers at those catalog positions are kept (one
+    shard); an existing snapshot is used, but none is written.
+    """
+    if source.endswith('.catalog'):
+        return CompiledCatalog(source, rows).careers
+    if source.startswith('sqlite:'):
+        source = sqlite_path_from_url(source)
+        load = load_catalog_sqlite
+    elif source.endswith(('.db', '.sqlite', '.sqlite3')):
+        load = load_catalog_sqlite
+    elif source.endswith('.json'):
+        load = load_catalog_json
+    else:
+        raise ValueError(f"Unsupported career catalog source: {source}")
+
+    if snapshot_path:
+        snapshot_secret = snapshot_secret if snapshot_secret is not None else Config.CAREER_CATALOG_SNAPSHOT_SECRET
+        if not snapshot_secret:
+            raise ValueError("A catalog snapshot needs a secret (set CAREER_CATALOG_SNAPSHOT_SECRET) to sign it")
+        careers = load_snapshot(snapshot_path, source, snapshot_secret)
+        if careers is not None:
+            return careers if rows is None else select_rows(careers, rows)
+
+    if rows is not None:
+        return load(source, rows)
+    careers = load(source)
+    if snapshot_path:
+        save_snapshot(snapshot_path, source, careers, snapshot_secret)
+    return careers
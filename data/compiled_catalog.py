@@ -0,0 +1,210 @@
+# data/compiled_catalog.py
+from collections import OrderedDict
+from collections.abc import Mapping
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+
+import numpy as np
+
+from data.records import Career, record_to_json
+
+MAGIC = b'CCATALOG'
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+HEADER_PREFIX = struct.Struct('<8sII')  # magic, format version, header length
+
+
+class StringTable:
+    """Interns strings at compile time; each unique string is stored once"""
+
+    def __init__(self):
+        self.ids = {}
+        self.strings = []
+
+    def intern(self, string):
+        string_id = self.ids.get(string)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.ids[string] = string_id
+            self.strings.append(string)
+        return string_id
+
+    def to_arrays(self):
+        """UTF-8 blob plus offsets: string i is data[offsets[i]:offsets[i + 1]]"""
+        encoded = [string.encode('utf-8') for string in self.strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(data) for data in encoded])
+        return offsets, np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+
+def write_compiled_catalog(path, career_db, matching_engine):
+    """Write the catalog and its compiled trait matrices into one memory-mappable file
+
+    Numeric matrices are stored as raw arrays and every string (career ids,
+    titles, categories and the JSON-encoded records) goes into one interned
+    string table. The file is written atomically through a temporary file of
+    its own, so concurrent writers cannot collide.
+    """
+    all_careers = career_db.get_all_careers()
+    strings = StringTable()
+    career_ids = matching_engine.career_ids
+
+    arrays = {
+        'career_ids': np.array([strings.intern(career_id) for career_id in career_ids], dtype=np.int32),
+        'titles': np.array(
+            [strings.intern(all_careers[career_id].get('title', '')) for career_id in career_ids],
+            dtype=np.int32
+        ),
+        'categories': np.array(
+            [strings.intern(all_careers[career_id].get('category', '')) for career_id in career_ids],
+            dtype=np.int32
+        ),
+        'records': np.array(
+            [strings.intern(json.dumps(all_careers[career_id], default=record_to_json)) for career_id in career_ids],
+            dtype=np.int32
+        ),
+        'required_levels': matching_engine.required_levels,
+        'trait_weights': matching_engine.trait_weights,
+        'total_trait_weights': matching_engine.total_trait_weights,
+        'has_trait_profile': matching_engine.has_trait_profile
+    }
+    arrays['string_offsets'], arrays['string_data'] = strings.to_arrays()
+
+    header = {
+        'catalog_version': matching_engine.catalog_version,
+        'trait_key': matching_engine.trait_key,
+        'traits': matching_engine.traits,
+        'arrays': {}
+    }
+    # Array offsets are relative to the aligned start of the data section
+    offset = 0
+    for name, array in arrays.items():
+        offset = -(-offset // ALIGNMENT) * ALIGNMENT
+        header['arrays'][name] = {
+            'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset
+        }
+        offset += array.nbytes
+    header_bytes = json.dumps(header).encode('utf-8')
+    data_start = -(-(HEADER_PREFIX.size + len(header_bytes)) // ALIGNMENT) * ALIGNMENT
+
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile(dir=directory, prefix='.compiled-catalog-', delete=False) as f:
+        f.write(HEADER_PREFIX.pack(MAGIC, FORMAT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for name, array in arrays.items():
+            f.seek(data_start + header['arrays'][name]['offset'])
+            f.write(np.ascontiguousarray(array).tobytes())
+    try:
+        os.replace(f.name, path)
+    except OSError:
+        os.unlink(f.name)
+        raise
+
+
+class CompiledCatalog:
+    """Read-only view of a compiled catalog file through a memory map
+
+    The trait matrices are views into the map, so processes that open the same
+    file share one copy of them in the page cache, and the catalog version is
+    read rather than recomputed. Career records stay in the map's string table
+    and are decoded when read (see CompiledCareerStore); the other
+    per-catalog indexes (skill index, bitsets, skill matrix, bonuses, search
+    index) are still built per process.
+    """
+
+    def __init__(self, path, rows=None, cache_size=None):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, format_version, header_length = HEADER_PREFIX.unpack_from(self._map, 0)
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a compiled career catalog (format {FORMAT_VERSION})")
+        header = json.loads(self._map[HEADER_PREFIX.size:HEADER_PREFIX.size + header_length])
+        data_start = -(-(HEADER_PREFIX.size + header_length) // ALIGNMENT) * ALIGNMENT
+
+        self.catalog_version = header['catalog_version']
+        self.trait_key = header['trait_key']
+        self.traits = header['traits']
+        self.arrays = {}
+        for name, spec in header['arrays'].items():
+            dtype = np.dtype(spec['dtype'])
+            count = int(np.prod(spec['shape'], dtype=np.int64))
+            self.arrays[name] = np.frombuffer(
+                self._map, dtype=dtype, count=count, offset=data_start + spec['offset']
+            ).reshape(spec['shape'])
+
+        self.career_ids = [self.string(string_id) for string_id in self.arrays['career_ids']]
+        self.careers = CompiledCareerStore(self, rows, cache_size)
+
+    def string(self, string_id):
+        """Decode one string from the interned table"""
+        offsets = self.arrays['string_offsets']
+        start, end = offsets[string_id], offsets[string_id + 1]
+        return self.arrays['string_data'][start:end].tobytes().decode('utf-8')
+
+    def trait_arrays(self):
+        """Required levels, weights, total weights and profile mask, as compiled"""
+        return (self.arrays['required_levels'], self.arrays['trait_weights'],
+                self.arrays['total_trait_weights'], self.arrays['has_trait_profile'])
+
+
+class CompiledCareerStore(Mapping):
+    """Career records of a compiled catalog, decoded from the mapped string table when read
+
+    Only the cache_size most recently read records are kept decoded, so a
+    process's memory does not grow with the catalog: the records themselves
+    stay in the page cache shared by every process that maps the file.
+    Titles and categories can be read from their interned columns without
+    decoding a record. With rows set only those catalog rows are visible, and
+    there is no link back to the compiled catalog since its matrices cover
+    the whole catalog.
+    """
+
+    DEFAULT_CACHE_SIZE = 256
+
+    def __init__(self, compiled_catalog, rows=None, cache_size=None):
+        career_ids = compiled_catalog.career_ids
+        self._catalog = compiled_catalog
+        self._rows = {career_ids[row]: row for row in (range(len(career_ids)) if rows is None else rows)}
+        self.cache_size = cache_size if cache_size is not None else self.DEFAULT_CACHE_SIZE
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        # MatchingEngine looks for this attribute to reuse the compiled matrices
+        self.compiled_catalog = compiled_catalog if rows is None else None
+
+    def __getitem__(self, career_id):
+        with self._lock:
+            record = self._cache.get(career_id)
+            if record is not None:
+                self._cache.move_to_end(career_id)
+                return record
+
+        row = self._rows[career_id]  # KeyError for unknown careers, like a dict
+        record = Career.from_dict(json.loads(self._catalog.string(self._catalog.arrays['records'][row])))
+        with self._lock:
+            self._cache[career_id] = record
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return record
+
+    def __contains__(self, career_id):
+        return career_id in self._rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def title(self, career_id):
+        """Title of a career, read from the title column"""
+        return self._catalog.string(self._catalog.arrays['titles'][self._rows[career_id]])
+
+    def category(self, career_id):
+        """Category of a career, read from the category column"""
+        return self._catalog.string(self._catalog.arrays['categories'][self._rows[career_id]])
@@ -1,10 +1,33 @@
 # data/personality_traits.py
+import numpy as np
+
+from config.settings import Config
+from data.catalog_loader import load_trait_mappings_json
+
+
 class PersonalityTraits:
     """Defines personality traits and their mappings to careers"""
     
-    def __init__(self):
+    def __init__(self, career_mappings_source=None, questions=None):
+        source = career_mappings_source if career_mappings_source is not None else Config.CAREER_TRAIT_MAPPINGS_SOURCE
+        self.career_mappings_source = source
         self.trait_definitions = self._initialize_traits()
-        self.career_trait_mappings = self._initialize_career_mappings()
+        # An external JSON file of trait mappings replaces the built-in ones
+        self.career_trait_mappings = load_trait_mappings_json(source) if source else self._initialize_career_mappings()
+        # Questionnaire questions carrying a 'trait' field replace the built-in question weights
+        self.question_trait_mapping = (
+            self.question_trait_mapping_from_questions(questions) if questions is not None
+            else self._initialize_question_trait_mapping()
+        )
+        self.response_values = self._initialize_response_values()
+        
+        # Compiled once: responses become integer codes and trait scores a weighted sum of them
+        self.traits = list(self.trait_definitions.keys())
+        self.trait_index = {trait: column for column, trait in enumerate(self.traits)}
+        self.question_ids = list(self.question_trait_mapping.keys())
+        self.question_index = {question_id: row for row, question_id in enumerate(self.question_ids)}
+        self.question_weights = self._compile_question_weights()
+        self.response_codes = {response: value - 3 for response, value in self.response_values.items()}
     
     def _initialize_traits(self):
         """Initialize personality trait definitions"""
@@ -196,18 +219,9 @@ class PersonalityTraits:
             }
         }
     
-    def calculate_personality_scores(self, responses):
-        """Calculate Big Five personality scores from responses"""
-        trait_scores = {
-            'openness': 0,
-            'conscientiousness': 0,
-            'extraversion': 0,
-            'agreeableness': 0,
-            'neuroticism': 0
-        }
-        
-        # Question mappings to traits - expanded version
-        question_trait_mapping = {
+    def _initialize_question_trait_mapping(self):
+        """Initialize question mappings to traits - expanded version"""
+        return {
             '0': {'openness': 0.3, 'conscientiousness': 0.2},  # Technology interest
             '1': {'conscientiousness': 0.4, 'openness': 0.3},  # Data analysis
             '2': {'openness': 0.6, 'extraversion': 0.1},      # Creative activities
@@ -229,35 +243,122 @@ class PersonalityTraits:
             '18': {'agreeableness': 0.5, 'extraversion': 0.2}, # Conflict resolution
             '19': {'conscientiousness': 0.4, 'openness': 0.2}  # Detail orientation
         }
+    
+    @staticmethod
+    def question_trait_mapping_from_questions(questions):
+        """Derive question -> {trait: weight} from questionnaire questions with a 'trait' field
+        
+        Reverse-scored questions get a negative weight.
+        """
+        mapping = {}
+        for question in questions:
+            trait = question.get('trait')
+            if not trait:
+                continue
+            weight = question.get('weight', 1.0)
+            if question.get('reverse_scored'):
+                weight = -weight
+            traits = mapping.setdefault(str(question['id']), {})
+            traits[trait] = traits.get(trait, 0) + weight
+        return mapping
+    
+    def _compile_question_weights(self):
+        """Compile the question mapping into a dense questions x traits weight array
         
-        response_values = {
+        The extra last row is all zeros; it pads batches of different lengths.
+        """
+        weights = np.zeros((len(self.question_ids) + 1, len(self.traits)))
+        for row, question_id in enumerate(self.question_ids):
+            for trait, weight in self.question_trait_mapping[question_id].items():
+                if trait not in self.trait_index:
+                    raise ValueError(
+                        f"Question {question_id} maps to unknown trait '{trait}'; "
+                        f"expected one of: {', '.join(self.traits)}"
+                    )
+                weights[row, self.trait_index[trait]] = weight
+        return weights
+    
+    def _initialize_response_values(self):
+        """Initialize Likert response values on a 1-5 scale"""
+        return {
             'strongly_disagree': 1,
             'disagree': 2,
             'neutral': 3,
             'agree': 4,
             'strongly_agree': 5
         }
+    
+    def get_response_contributions(self, question_id, response):
+        """Get the raw trait score contributions of a single response"""
+        traits = self.question_trait_mapping.get(str(question_id))
+        if not traits:
+            return {}
         
-        for question_id, response in responses.items():
-            if str(question_id) in question_trait_mapping:
-                response_value = response_values.get(response, 3)
-                traits = question_trait_mapping[str(question_id)]
-                
-                for trait, weight in traits.items():
-                    # Convert 1-5 scale to -2 to +2, then apply weight
-                    normalized_response = (response_value - 3) * weight
-                    trait_scores[trait] += normalized_response
+        response_value = self.response_values.get(response, 3)
+        # Convert 1-5 scale to -2 to +2, then apply weight
+        return {trait: (response_value - 3) * weight for trait, weight in traits.items()}
+    
+    def encode_responses(self, responses):
+        """Encode responses as (question rows, Likert codes in -2..2), in the order answers were given
+        
+        Answers to questions without trait weights are left out; unknown
+        responses encode as 0 (neutral). A list of response dicts gives 2-D
+        arrays padded with the all-zero weight row.
+        """
+        if isinstance(responses, dict):
+            rows = []
+            codes = []
+            for question_id, response in responses.items():
+                row = self.question_index.get(str(question_id))
+                if row is not None:
+                    rows.append(row)
+                    codes.append(self.response_codes.get(response, 0))
+            return np.array(rows, dtype=np.intp), np.array(codes, dtype=np.int8)
+        
+        encoded = [self.encode_responses(respondent) for respondent in responses]
+        width = max((len(rows) for rows, _ in encoded), default=0)
+        rows = np.full((len(encoded), width), len(self.question_ids), dtype=np.intp)
+        codes = np.zeros((len(encoded), width), dtype=np.int8)
+        for i, (respondent_rows, respondent_codes) in enumerate(encoded):
+            rows[i, :len(respondent_rows)] = respondent_rows
+            codes[i, :len(respondent_codes)] = respondent_codes
+        return rows, codes
+    
+    def raw_trait_scores(self, rows, codes):
+        """Accumulated trait scores of encoded answers: (answers,) -> (traits,), or batched
         
-        # Normalize scores to 0-1 range
+        The weighted answers are added one at a time in the order they were
+        given, like the former per-response loop, so the rounding (and any score
+        sitting on a tolerance band edge) does not depend on the encoding.
+        """
+        contributions = np.asarray(codes)[..., np.newaxis] * self.question_weights[rows]
+        if contributions.shape[-2] == 0:
+            return np.zeros(contributions.shape[:-2] + (len(self.traits),))
+        # Summing over a non-innermost axis runs row by row, never pairwise
+        return np.add.reduce(contributions, axis=-2)
+    
+    def calculate_personality_scores(self, responses):
+        """Calculate Big Five personality scores from responses"""
+        raw_scores = self.raw_trait_scores(*self.encode_responses(responses))
+        return self.normalize_trait_scores(dict(zip(self.traits, raw_scores.tolist())))
+    
+    def calculate_personality_scores_batch(self, rows, codes):
+        """Big Five scores for encoded answers; (respondents, answers) arrays give (respondents, traits)"""
+        # Normalize from [-2, 2] to [0, 1]
+        return np.clip((self.raw_trait_scores(rows, codes) + 2.0) / 4.0, 0, 1)
+    
+    def normalize_trait_scores(self, trait_scores):
+        """Normalize accumulated trait scores to the 0-1 range"""
         max_possible_score = 2.0  # Maximum possible accumulated score
         min_possible_score = -2.0  # Minimum possible accumulated score
         
-        for trait in trait_scores:
+        normalized_scores = {}
+        for trait, score in trait_scores.items():
             # Normalize from [-2, 2] to [0, 1]
-            normalized_score = (trait_scores[trait] - min_possible_score) / (max_possible_score - min_possible_score)
-            trait_scores[trait] = max(0, min(1, normalized_score))
+            normalized_score = (score - min_possible_score) / (max_possible_score - min_possible_score)
+            normalized_scores[trait] = max(0, min(1, normalized_score))
         
-        return trait_scores
+        return normalized_scores
     
     def get_personality_profile(self, trait_scores):
         """Get personality profile description"""
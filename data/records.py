@@ -0,0 +1,151 @@
+# data/records.py
+from collections.abc import Mapping
+
+_UNSET_SETS = {}  # one shared frozenset per distinct combination of unset fields
+
+
+class FrozenRecord(Mapping):
+    """Immutable record whose fields live in __slots__ and that reads like a dict
+
+    Subclasses declare their fields in __slots__. Unset fields are absent from
+    the mapping view but still read as their _field_defaults entry (None if
+    none) through attributes, so attribute reads never raise. Unknown keys
+    given to from_dict are kept in a small extras dict so records built from
+    external data lose nothing. Existing callers keep using record['field']
+    and record.get('field'), while the matching code can read plain attributes.
+    """
+
+    __slots__ = ('_extra', '_unset')
+    _nested = {}  # field -> record class for nested mappings
+    _field_defaults = {}  # field -> attribute value when the field is unset
+    _field_names = ()
+    _field_set = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_names = cls.__slots__
+        cls._field_set = frozenset(cls.__slots__)
+
+    def __init__(self, **fields):
+        extra = {}
+        for name, value in fields.items():
+            if name in self._field_set:
+                object.__setattr__(self, name, value)
+            else:
+                extra[name] = value
+        unset = self._field_set.difference(fields)
+        for name in unset:
+            object.__setattr__(self, name, self._field_defaults.get(name))
+        object.__setattr__(self, '_extra', extra or None)
+        object.__setattr__(self, '_unset', _UNSET_SETS.setdefault(unset, unset))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a plain dict, freezing lists into tuples"""
+        fields = {}
+        for name, value in data.items():
+            record_type = cls._nested.get(name)
+            if record_type is not None and isinstance(value, Mapping):
+                value = record_type.from_dict(value)
+            elif isinstance(value, list):
+                value = tuple(value)
+            fields[name] = value
+        return cls(**fields)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            if key not in self._unset:
+                return getattr(self, key)
+        elif self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        # Mapping.get goes through __getitem__ and a KeyError; read the slot directly
+        if key in self._field_set:
+            return default if key in self._unset else getattr(self, key)
+        if self._extra:
+            return self._extra.get(key, default)
+        return default
+
+    def __iter__(self):
+        unset = self._unset
+        for name in self._field_names:
+            if name not in unset:
+                yield name
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def __reduce__(self):
+        return (type(self)._from_fields, (dict(self),))
+
+    @classmethod
+    def _from_fields(cls, fields):
+        return cls(**fields)
+
+
+def record_to_json(obj):
+    """json.dumps default hook: records serialize as the dicts they stand in for"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+class SalaryRange(FrozenRecord):
+    """(low, high) salary bounds per career level"""
+
+    __slots__ = ('entry', 'mid', 'senior')
+
+
+class CareerRequirements(FrozenRecord):
+    """Education, experience and core skills expected for a career"""
+
+    __slots__ = ('education', 'experience', 'skills')
+
+
+class Career(FrozenRecord):
+    """One career of the catalog"""
+
+    __slots__ = ('title', 'category', 'description', 'requirements', 'salary_range',
+                 'growth_outlook', 'work_environment', 'personality_match',
+                 'skills_required', 'interests', 'values', 'work_style', 'aliases')
+    _nested = {'requirements': CareerRequirements, 'salary_range': SalaryRange}
+    _field_defaults = dict.fromkeys(
+        ('personality_match', 'skills_required', 'interests', 'values', 'work_style', 'aliases'), ()
+    )
+    _field_defaults['growth_outlook'] = ''
+
+
+class QuestionOption(FrozenRecord):
+    """One selectable answer of a question"""
+
+    __slots__ = ('value', 'text')
+
+
+class Question(FrozenRecord):
+    """One questionnaire question"""
+
+    __slots__ = ('id', 'category', 'type', 'question', 'options', 'weight', 'trait',
+                 'reverse_scored', 'skill_type', 'interest_area', 'style_type', 'value_type')
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        options = data.get('options')
+        # An option tuple that is already built is kept, so questions can share it
+        if options is not None and not (
+                isinstance(options, tuple) and all(isinstance(option, QuestionOption) for option in options)):
+            data['options'] = tuple(QuestionOption.from_dict(option) for option in options)
+        return super().from_dict(data)
@@ -0,0 +1,55 @@
+# data/salary_index.py
+import numpy as np
+
+
+class SalaryIndex:
+    """Columnar salary bands per career level, sorted for bisect range queries
+
+    For every level (entry, mid, senior, ...) the index keeps the catalog rows
+    that state that level, sorted by band low, with the band highs alongside.
+    A band overlaps [min_salary, max_salary] when low <= max_salary and
+    high >= min_salary: the first condition is a bisect on the sorted lows and
+    the second a vectorized filter over that prefix only.
+    """
+
+    def __init__(self, careers):
+        self.career_ids = list(careers)
+        self.row_index = {career_id: row for row, career_id in enumerate(self.career_ids)}
+
+        columns = {}
+        for row, career_id in enumerate(self.career_ids):
+            for level, (low, high) in careers[career_id].get('salary_range', {}).items():
+                rows, lows, highs = columns.setdefault(level, ([], [], []))
+                rows.append(row)
+                lows.append(low)
+                highs.append(high)
+
+        self.levels = {}
+        for level, (rows, lows, highs) in columns.items():
+            rows, lows, highs = np.array(rows), np.array(lows, dtype=float), np.array(highs, dtype=float)
+            order = np.argsort(lows, kind='stable')
+            self.levels[level] = (rows[order], lows[order], highs[order], np.sort(highs))
+
+    def overlapping_rows(self, level, min_salary=None, max_salary=None):
+        """Catalog rows whose band at level overlaps [min_salary, max_salary], in catalog order"""
+        if level not in self.levels:
+            return np.array([], dtype=int)
+
+        rows, lows, highs, _ = self.levels[level]
+        end = len(lows) if max_salary is None else np.searchsorted(lows, max_salary, side='right')
+        rows, highs = rows[:end], highs[:end]
+        if min_salary is not None:
+            rows = rows[highs >= min_salary]
+        return np.sort(rows)
+
+    def overlapping(self, level, min_salary=None, max_salary=None):
+        """Career ids whose band at level overlaps [min_salary, max_salary], in catalog order"""
+        return [self.career_ids[row] for row in self.overlapping_rows(level, min_salary, max_salary)]
+
+    def percentile(self, level, salary, bound='low'):
+        """Share of careers (0-100) whose band low (or high) at level is below salary"""
+        if level not in self.levels:
+            return None
+        _, lows, _, sorted_highs = self.levels[level]
+        values = lows if bound == 'low' else sorted_highs
+        return 100.0 * np.searchsorted(values, salary, side='left') / len(values)
@@ -0,0 +1,134 @@
+# data/search_index.py
+from bisect import bisect_left
+from collections import Counter
+import math
+import re
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text):
+    """Lowercase alphanumeric tokens of a text"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class CareerSearchIndex:
+    """Token inverted index over career titles, descriptions and skills with BM25 ranking
+
+    Each career is one document. Postings map a token to {document: term count},
+    and the sorted vocabulary lets a query token match every indexed token it is
+    a prefix of, so partially typed words already find careers. Whole required
+    skills get their own posting lists for skill overlap queries.
+    """
+
+    def __init__(self, careers, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.career_ids = []
+        self.document_lengths = []
+        self.postings = {}
+        self.skill_postings = {}
+
+        for career_id, career in careers.items():
+            document = len(self.career_ids)
+            self.career_ids.append(career_id)
+            tokens = tokenize(' '.join([
+                career.get('title', ''),
+                career.get('description', ''),
+                ' '.join(career.get('skills_required', []))
+            ]))
+            self.document_lengths.append(len(tokens))
+            for skill in {skill.lower() for skill in career.get('skills_required', [])}:
+                self.skill_postings.setdefault(skill, []).append(document)
+            for token, count in Counter(tokens).items():
+                self.postings.setdefault(token, {})[document] = count
+
+        self.vocabulary = sorted(self.postings)
+        # An empty catalog or all-empty documents fall back to 1 so length norms never divide by zero
+        self.average_length = (
+            sum(self.document_lengths) / len(self.document_lengths) if self.document_lengths else 0.0
+        ) or 1.0
+        document_count = len(self.career_ids)
+        self.idf = {
+            token: math.log(1 + (document_count - len(posting) + 0.5) / (len(posting) + 0.5))
+            for token, posting in self.postings.items()
+        }
+
+    def expand(self, token, prefix=True):
+        """Indexed tokens a query token matches: itself, or every token it prefixes"""
+        if not prefix:
+            return [token] if token in self.postings else []
+
+        start = bisect_left(self.vocabulary, token)
+        end = start
+        while end < len(self.vocabulary) and self.vocabulary[end].startswith(token):
+            end += 1
+        return self.vocabulary[start:end]
+
+    def _term_scores(self, token, prefix):
+        """BM25 score per document for one query token (best of its expansions)"""
+        scores = {}
+        for indexed_token in self.expand(token, prefix):
+            idf = self.idf[indexed_token]
+            for document, count in self.postings[indexed_token].items():
+                length_norm = 1 - self.b + self.b * self.document_lengths[document] / self.average_length
+                score = idf * count * (self.k1 + 1) / (count + self.k1 * length_norm)
+                if score > scores.get(document, 0.0):
+                    scores[document] = score
+        return scores
+
+    def search(self, keywords, match_all=False, prefix=True, limit=None):
+        """Rank careers for a list of keywords, best first, as (career_id, score) pairs
+
+        The tokens of one keyword must all match (a multi-word keyword acts as
+        a phrase filter). Keywords are combined with OR, or with AND when
+        match_all is set. Ties keep catalog order.
+        """
+        if isinstance(keywords, str):
+            keywords = [keywords]
+
+        totals = {}
+        matched_keywords = Counter()
+        for keyword in keywords:
+            tokens = tokenize(keyword)
+            if not tokens:
+                continue
+
+            keyword_scores = None
+            for token in tokens:
+                term_scores = self._term_scores(token, prefix)
+                if keyword_scores is None:
+                    keyword_scores = term_scores
+                else:
+                    keyword_scores = {
+                        document: score + term_scores[document]
+                        for document, score in keyword_scores.items() if document in term_scores
+                    }
+
+            for document, score in keyword_scores.items():
+                totals[document] = totals.get(document, 0.0) + score
+                matched_keywords[document] += 1
+
+        if match_all:
+            required = sum(1 for keyword in keywords if tokenize(keyword))
+            totals = {
+                document: score for document, score in totals.items()
+                if matched_keywords[document] == required
+            }
+
+        ranked = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(self.career_ids[document], score) for document, score in ranked]
+
+    def careers_by_skills(self, skills):
+        """(career_id, overlap count) for careers requiring any of the skills, most overlap first
+
+        Skills compare case-insensitively; ties keep catalog order.
+        """
+        overlaps = Counter()
+        for skill in {skill.lower() for skill in skills}:
+            overlaps.update(self.skill_postings.get(skill, ()))
+
+        ranked = sorted(overlaps.items(), key=lambda item: (-item[1], item[0]))
+        return [(self.career_ids[document], count) for document, count in ranked]
@@ -1,11 +1,17 @@
 
 # data/skills_mapping.py
+import numpy as np
+
+
 class SkillsMapping:
     """Maps user responses to skill categories and proficiency levels"""
     
     def __init__(self):
         self.skill_categories = self._initialize_skill_categories()
         self.skill_weights = self._initialize_skill_weights()
+        self.response_skill_mappings = self._initialize_response_skill_mappings()
+        self.question_types = self._initialize_question_types()
+        self._compile_skill_tables()
     
     def _initialize_skill_categories(self):
         """Initialize skill category mappings"""
@@ -46,9 +52,18 @@ class SkillsMapping:
             'technology': 0.8
         }
     
-    def map_response_to_skills(self, question_type, response):
-        """Map questionnaire response to skills"""
-        skill_mappings = {
+    def get_all_skill_names(self):
+        """Get every skill name this mapping can produce or refers to"""
+        names = list(self.skill_weights.keys())
+        for subcategories in self.skill_categories.values():
+            for subcategory, skills in subcategories.items():
+                names.append(subcategory)
+                names.extend(skills)
+        return names
+    
+    def _initialize_response_skill_mappings(self):
+        """Initialize the skills each Likert response to a question type points to"""
+        return {
             'enjoys_programming': {
                 'strongly_agree': {'programming': 0.9, 'analytical': 0.7},
                 'agree': {'programming': 0.7, 'analytical': 0.5},
@@ -92,28 +107,10 @@ class SkillsMapping:
                 'strongly_disagree': {}
             }
         }
-        
-        return skill_mappings.get(question_type, {}).get(response, {})
     
-    def calculate_skill_scores(self, all_responses):
-        """Calculate overall skill scores from all responses"""
-        skill_scores = {}
-        
-        for question_id, response in all_responses.items():
-            question_type = self._get_question_type(question_id)
-            skills = self.map_response_to_skills(question_type, response)
-            
-            for skill, score in skills.items():
-                if skill in skill_scores:
-                    skill_scores[skill] = max(skill_scores[skill], score)
-                else:
-                    skill_scores[skill] = score
-        
-        return skill_scores
-    
-    def _get_question_type(self, question_id):
-        """Map question ID to question type"""
-        question_type_mapping = {
+    def _initialize_question_types(self):
+        """Initialize question ID to question type mappings"""
+        return {
             '0': 'enjoys_programming',
             '1': 'likes_data_analysis',
             '2': 'creative_projects',
@@ -122,21 +119,122 @@ class SkillsMapping:
             '5': 'business_strategy',
             # Add more mappings as needed
         }
-        return question_type_mapping.get(str(question_id), 'general')
+    
+    def _compile_skill_tables(self):
+        """Compile the response mappings into (question type, response) x skill arrays
+        
+        The extra last question type and response code stand for anything
+        unmapped. Skills a response does not point to hold -inf so a max over
+        answers ignores them; positions keep each response's own skill order.
+        """
+        self.question_type_names = list(self.response_skill_mappings.keys())
+        self.question_type_index = {name: row for row, name in enumerate(self.question_type_names)}
+        self.response_levels = ['strongly_agree', 'agree', 'neutral', 'disagree', 'strongly_disagree']
+        self.response_index = {response: code for code, response in enumerate(self.response_levels)}
+        
+        self.skills = []
+        for responses in self.response_skill_mappings.values():
+            for skills in responses.values():
+                for skill in skills:
+                    if skill not in self.skills:
+                        self.skills.append(skill)
+        self.skill_column = {skill: column for column, skill in enumerate(self.skills)}
+        
+        shape = (len(self.question_type_names) + 1, len(self.response_levels) + 1, len(self.skills))
+        self.skill_table = np.full(shape, -np.inf)
+        self.skill_positions = np.zeros(shape, dtype=np.int16)
+        for question_type, responses in self.response_skill_mappings.items():
+            row = self.question_type_index[question_type]
+            for response, skills in responses.items():
+                code = self.response_index[response]
+                for position, (skill, score) in enumerate(skills.items()):
+                    self.skill_table[row, code, self.skill_column[skill]] = score
+                    self.skill_positions[row, code, self.skill_column[skill]] = position
+    
+    def map_response_to_skills(self, question_type, response):
+        """Map questionnaire response to skills (a copy; the mapping tables are shared)"""
+        return dict(self.response_skill_mappings.get(question_type, {}).get(response, {}))
+    
+    def encode_responses(self, all_responses):
+        """Encode responses as (question type rows, response codes), one entry per answer
+        
+        A list of response dicts gives 2-D arrays, padded with unmapped entries.
+        """
+        if isinstance(all_responses, dict):
+            rows = np.empty(len(all_responses), dtype=np.intp)
+            codes = np.empty(len(all_responses), dtype=np.intp)
+            unmapped_row = len(self.question_type_names)
+            unmapped_code = len(self.response_levels)
+            for i, (question_id, response) in enumerate(all_responses.items()):
+                question_type = self._get_question_type(question_id)
+                rows[i] = self.question_type_index.get(question_type, unmapped_row)
+                codes[i] = self.response_index.get(response, unmapped_code) if rows[i] != unmapped_row else unmapped_code
+            return rows, codes
+        
+        encoded = [self.encode_responses(responses) for responses in all_responses]
+        width = max((len(rows) for rows, _ in encoded), default=0)
+        rows = np.full((len(encoded), width), len(self.question_type_names), dtype=np.intp)
+        codes = np.full((len(encoded), width), len(self.response_levels), dtype=np.intp)
+        for i, (respondent_rows, respondent_codes) in enumerate(encoded):
+            rows[i, :len(respondent_rows)] = respondent_rows
+            codes[i, :len(respondent_codes)] = respondent_codes
+        return rows, codes
+    
+    def calculate_skill_scores(self, all_responses):
+        """Calculate overall skill scores from all responses"""
+        rows, codes = self.encode_responses(all_responses)
+        answer_scores = self.skill_table[rows, codes]
+        present = answer_scores > -np.inf
+        columns = np.flatnonzero(present.any(axis=0))
+        if not len(columns):
+            return {}
+        
+        # Each skill keeps the max over answers; the dict lists skills in the order
+        # answers first mention them, as the answers are given
+        scores = answer_scores[:, columns].max(axis=0)
+        first_answer = present[:, columns].argmax(axis=0)
+        positions = self.skill_positions[rows[first_answer], codes[first_answer], columns]
+        order = np.lexsort((positions, first_answer))
+        return {self.skills[columns[i]]: scores[i].item() for i in order}
+    
+    def calculate_skill_scores_batch(self, rows, codes):
+        """Skill scores of encoded respondents as a (respondents, skills) array; unscored skills are 0"""
+        answer_scores = self.skill_table[rows, codes]
+        if answer_scores.shape[-2] == 0:
+            # No answers at all (or no respondents): every skill is unscored
+            return np.zeros(answer_scores.shape[:-2] + (len(self.skills),))
+        scores = answer_scores.max(axis=-2)
+        return np.where(scores > -np.inf, scores, 0.0)
+    
+    def _get_question_type(self, question_id):
+        """Map question ID to question type"""
+        return self.question_types.get(str(question_id), 'general')
     
     def get_top_skills(self, skill_scores, top_n=10):
         """Get top N skills based on scores"""
-        sorted_skills = sorted(skill_scores.items(), key=lambda x: x[1], reverse=True)
-        return sorted_skills[:top_n]
+        names = list(skill_scores.keys())
+        values = np.fromiter(skill_scores.values(), dtype=float, count=len(names))
+        if 0 < top_n < len(names):
+            # Partition around the n-th best score; ties at that score go in dict order
+            kth_score = values[np.argpartition(-values, top_n - 1)[top_n - 1]]
+            above = np.flatnonzero(values > kth_score)
+            ties = np.flatnonzero(values == kth_score)[:top_n - len(above)]
+            candidates = np.sort(np.concatenate([above, ties]))
+        else:
+            candidates = np.arange(len(names))
+        
+        ranked = candidates[np.argsort(-values[candidates], kind='stable')]
+        return [(names[i], skill_scores[names[i]]) for i in ranked][:top_n]
     
     def normalize_skill_scores(self, skill_scores):
         """Normalize skill scores to 0-1 range"""
         if not skill_scores:
             return {}
         
-        max_score = max(skill_scores.values())
+        values = np.fromiter(skill_scores.values(), dtype=float, count=len(skill_scores))
+        max_score = values.max()
         if max_score == 0:
             return skill_scores
         
-        return {skill: score / max_score for skill, score in skill_scores.items()}
+        return dict(zip(skill_scores.keys(), (values / max_score).tolist()))
 
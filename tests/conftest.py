@@ -0,0 +1,54 @@
+import json
+import os
+import random
+import sys
+
+import pytest
+
+# Tests import the app packages (components, data, utils) from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.career_matcher import CareerMatcher
+from data.career_database import CareerDatabase
+from data.personality_traits import PersonalityTraits
+
+
+@pytest.fixture(scope='session')
+def synthetic_matcher(tmp_path_factory):
+    """CareerMatcher over 1000 distinct careers recombined from the built-in catalog's fields"""
+    builtin_careers = CareerDatabase(source='').get_all_careers()
+    pools = {
+        field: sorted({item for career in builtin_careers.values() for item in career[field]})
+        for field in ('skills_required', 'interests', 'values', 'work_style')
+    }
+    categories = sorted({career['category'] for career in builtin_careers.values()})
+    outlooks = sorted({career['growth_outlook'] for career in builtin_careers.values()})
+    traits = PersonalityTraits('').traits
+
+    rng = random.Random(1000)
+    careers, trait_mappings = {}, {}
+    for i in range(1000):
+        career_id = f'career_{i}'
+        low = rng.randrange(30000, 120000, 5000)
+        careers[career_id] = {
+            'title': f'Career {i}',
+            'category': rng.choice(categories),
+            'description': f'Synthetic career {i}.',
+            'skills_required': rng.sample(pools['skills_required'], rng.randint(1, 6)),
+            'salary_range': {'entry': [low, low + 20000], 'mid': [low + 20000, low + 60000],
+                             'senior': [low + 60000, low + rng.randrange(60000, 140000, 5000)]},
+            'growth_outlook': rng.choice(outlooks),
+            'interests': rng.sample(pools['interests'], rng.randint(0, 4)),
+            'values': rng.sample(pools['values'], rng.randint(0, 4)),
+            'work_style': rng.sample(pools['work_style'], rng.randint(0, 3))
+        }
+        trait_mappings[career_id] = {trait: round(rng.random(), 2) for trait in rng.sample(traits, rng.randint(2, 5))}
+
+    directory = tmp_path_factory.mktemp('synthetic')
+    catalog_path, mappings_path = str(directory / 'careers.json'), str(directory / 'traits.json')
+    with open(catalog_path, 'w', encoding='utf-8') as f:
+        json.dump(careers, f)
+    with open(mappings_path, 'w', encoding='utf-8') as f:
+        json.dump(trait_mappings, f)
+    return CareerMatcher(career_db=CareerDatabase(catalog_path, ''),
+                         personality_traits=PersonalityTraits(mappings_path))
@@ -0,0 +1,69 @@
+import pytest
+
+from data.autocomplete import AutocompleteIndex
+from data.career_database import CareerDatabase
+
+CAREERS = {
+    'a': {'title': 'Data Engineer', 'aliases': ['Pipeline Engineer'], 'skills_required': ['Python', 'SQL']},
+    'b': {'title': 'Data Analyst', 'skills_required': ['SQL', 'Excel']},
+    'c': {'title': 'Software Engineer', 'skills_required': ['Python']}
+}
+
+
+def texts(suggestions):
+    return [suggestion['text'] for suggestion in suggestions]
+
+
+def test_suggestions_are_ranked_by_popularity_then_text():
+    index = AutocompleteIndex(CAREERS)
+    # Skills shared by two careers outrank single careers; ties go alphabetically
+    assert texts(index.complete('s')) == ['SQL', 'Software Engineer']
+    assert texts(index.complete('eng')) == ['Data Engineer', 'Pipeline Engineer', 'Software Engineer']
+    assert texts(AutocompleteIndex(CAREERS, {'c': 5}).complete('eng'))[0] == 'Software Engineer'
+
+
+def test_kinds_and_limit_filter_suggestions():
+    index = AutocompleteIndex(CAREERS)
+    assert texts(index.complete('eng', kinds={'alias'})) == ['Pipeline Engineer']
+    assert texts(index.complete('data', limit=1)) == ['Data Analyst']
+    assert index.complete('') == [] and index.complete('data', limit=0) == []
+
+
+def test_cached_short_prefixes_match_a_full_lookup():
+    index = AutocompleteIndex(CAREERS, max_limit=2)
+    for prefix in index.cached:
+        assert index.complete(prefix) == [index.suggestions[rank] for rank in
+                                          sorted(index._prefix_ranks(prefix))[:10]]
+
+
+def test_returned_suggestions_are_copies():
+    index = AutocompleteIndex(CAREERS)
+    suggestion = index.complete('sql')[0]
+    suggestion['text'] = 'Changed'
+    suggestion['popularity'] = 0
+    assert index.complete('sql')[0] == {'text': 'SQL', 'kind': 'skill', 'career_ids': (), 'popularity': 2}
+
+
+@pytest.fixture
+def db():
+    return CareerDatabase(source='')
+
+
+def test_index_is_rebuilt_when_popularity_changes_in_place(db):
+    popularity = {}
+    index = db.get_autocomplete_index(popularity)
+    assert db.get_autocomplete_index(popularity) is index
+    assert db.get_autocomplete_index({}) is index
+
+    popularity['nurse'] = 100
+    rebuilt = db.get_autocomplete_index(popularity)
+    assert rebuilt is not index
+    assert texts(db.autocomplete('n', popularity=popularity))[0] == 'Registered Nurse'
+
+
+def test_index_is_kept_while_the_popularity_version_is_unchanged(db):
+    popularity = {'nurse': 100}
+    index = db.get_autocomplete_index(popularity, popularity_version=1)
+    popularity['teacher'] = 500
+    assert db.get_autocomplete_index(popularity, popularity_version=1) is index
+    assert db.get_autocomplete_index(popularity, popularity_version=2) is not index
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from components.career_index import CareerTraitIndex
+from test_match_equivalence import random_profiles
+
+
+@pytest.fixture
+def indexed_matcher(synthetic_matcher):
+    synthetic_matcher.trait_index = CareerTraitIndex(synthetic_matcher.matching_engine)
+    yield synthetic_matcher
+    synthetic_matcher.trait_index = None
+
+
+@pytest.mark.parametrize('top_k', [1, 10, 40])
+def test_indexed_top_k_equals_exact_top_k(indexed_matcher, top_k):
+    profiles = random_profiles(indexed_matcher, 20, seed=top_k)
+    index = indexed_matcher.trait_index
+    for personality_profile, processed_data in profiles:
+        indexed = indexed_matcher.calculate_career_matches(personality_profile, processed_data, top_k=top_k)
+        indexed_matcher.trait_index = None
+        exact = indexed_matcher.calculate_career_matches(personality_profile, processed_data, top_k=top_k)
+        indexed_matcher.trait_index = index
+
+        assert [(career_id, match['match_score']) for career_id, match in indexed.items()] == \
+            [(career_id, match['match_score']) for career_id, match in exact.items()]
+
+
+def test_candidates_complete_but_do_not_cover_the_catalog(indexed_matcher):
+    catalog_size = len(indexed_matcher.matching_engine.career_ids)
+    sizes = []
+    for personality_profile, processed_data in random_profiles(indexed_matcher, 20, seed=8):
+        skill_scores = processed_data['skills']
+        candidates = indexed_matcher._trait_index_candidates(
+            10, personality_profile['scores'], indexed_matcher.skill_index.best_matches(skill_scores),
+            indexed_matcher.match_bitsets.encode_user(
+                processed_data['interests'], processed_data['values'], processed_data['work_style']
+            ),
+            skill_scores
+        )
+        assert len(np.unique(candidates)) == len(candidates)
+        sizes.append(len(candidates))
+    assert np.mean(sizes) < catalog_size / 2
+
+
+def test_optimistic_bounds_never_undercut_scores(synthetic_matcher):
+    engine = synthetic_matcher.matching_engine
+    rows = np.arange(len(engine.career_ids))
+    for personality_profile, processed_data in random_profiles(synthetic_matcher, 20, seed=9):
+        skill_scores = processed_data['skills']
+        personality_matches = engine.personality_matches(personality_profile['scores'])
+        skills_matches = synthetic_matcher.skill_matrix.skills_matches(
+            synthetic_matcher.skill_index.best_matches(skill_scores)
+        )
+        user_bitsets = synthetic_matcher.match_bitsets.encode_user(
+            processed_data['interests'], processed_data['values'], processed_data['work_style']
+        )
+        bounds = synthetic_matcher._calculate_optimistic_bounds(
+            rows, personality_matches, skills_matches, user_bitsets, skill_scores
+        )
+        scores = synthetic_matcher._calculate_match_upper_bounds(
+            rows, personality_matches, skills_matches, user_bitsets, skill_scores
+        )
+        assert (bounds >= scores).all()
@@ -0,0 +1,49 @@
+import pickle
+import threading
+import time
+
+import pytest
+
+from components.career_match import CareerMatch
+
+
+def test_lazy_fields_load_once_on_first_read():
+    calls = []
+    match = CareerMatch({'match_score': 0.5}, {'detail': lambda: calls.append(1) or 'value'})
+    assert list(match) == ['match_score', 'detail']
+    assert not match.is_loaded('detail')
+    assert match['detail'] == 'value' and match['detail'] == 'value'
+    assert calls == [1]
+    assert match.is_loaded('detail')
+    with pytest.raises(KeyError):
+        match['unknown']
+
+
+def test_concurrent_first_reads_all_get_the_value():
+    def slow_loader():
+        time.sleep(0.05)
+        return object()
+
+    match = CareerMatch({}, {'detail': slow_loader})
+    results, errors = [], []
+
+    def read():
+        try:
+            results.append(match['detail'])
+        except KeyError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(results) == 8 and all(result is match['detail'] for result in results)
+
+
+def test_pickles_as_an_evaluated_record():
+    match = CareerMatch({'match_score': 0.5}, {'detail': lambda: 'value'}, keys=('detail', 'match_score'))
+    restored = pickle.loads(pickle.dumps(match))
+    assert list(restored.items()) == [('detail', 'value'), ('match_score', 0.5)]
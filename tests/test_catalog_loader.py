@@ -0,0 +1,145 @@
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from config.settings import Config
+from data.career_database import CareerDatabase
+from data.catalog_loader import (CatalogValidationError, load_catalog, load_snapshot,
+                                 save_catalog_json, save_catalog_sqlite, save_snapshot)
+from data.records import record_to_json
+
+
+@pytest.fixture(scope='module')
+def builtin_db():
+    return CareerDatabase(source='')
+
+
+@pytest.fixture(scope='module')
+def catalog_files(builtin_db, tmp_path_factory):
+    directory = tmp_path_factory.mktemp('catalogs')
+    careers = builtin_db.get_all_careers()
+    paths = {'json': str(directory / 'careers.json'), 'sqlite': str(directory / 'careers.db')}
+    save_catalog_json(paths['json'], careers)
+    save_catalog_sqlite(paths['sqlite'], careers)
+    return paths
+
+
+def as_json(careers):
+    return json.dumps(dict(careers), default=record_to_json, sort_keys=True)
+
+
+@pytest.mark.parametrize('kind', ['json', 'sqlite'])
+def test_round_trip_matches_builtin_catalog(builtin_db, catalog_files, kind):
+    careers = CareerDatabase(source=catalog_files[kind]).get_all_careers()
+    assert list(careers) == list(builtin_db.get_all_careers())
+    assert as_json(careers) == as_json(builtin_db.get_all_careers())
+
+
+@pytest.mark.parametrize('kind', ['json', 'sqlite'])
+def test_rows_select_catalog_positions_in_order(builtin_db, catalog_files, kind):
+    career_ids = list(builtin_db.get_all_careers())
+    rows = [3, 0, len(career_ids) - 1]
+    careers = load_catalog(catalog_files[kind], rows=rows)
+    assert list(careers) == [career_ids[row] for row in rows]
+    assert as_json(careers) == as_json({career_id: builtin_db.get_career(career_id) for career_id in careers})
+
+
+def test_sqlite_bad_record_fails_at_load(catalog_files, tmp_path):
+    path = str(tmp_path / 'broken.db')
+    with open(catalog_files['json'], encoding='utf-8') as f:
+        careers = json.load(f)
+    save_catalog_sqlite(path, careers)
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute("UPDATE careers SET data = ? WHERE position = 1",
+                           (json.dumps({'title': 'No fields'}),))
+        connection.execute("UPDATE careers SET data = ? WHERE position = 2", ('{not json',))
+    connection.close()
+
+    with pytest.raises(CatalogValidationError) as excinfo:
+        load_catalog(path)
+    career_ids = list(careers)
+    assert any(error.startswith(f"{career_ids[1]}: missing required field") for error in excinfo.value.errors)
+    assert f"{career_ids[2]}: record is not valid JSON" in excinfo.value.errors
+
+    # Rows outside the broken records still load
+    assert list(load_catalog(path, rows=[0, 3])) == [career_ids[0], career_ids[3]]
+
+
+def test_json_schema_errors_are_collected(tmp_path):
+    path = str(tmp_path / 'broken.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'a': {'title': 1}, 'b': []}, f)
+    with pytest.raises(CatalogValidationError) as excinfo:
+        load_catalog(path)
+    assert "a: 'title' must be of type str" in excinfo.value.errors
+    assert "b: record must be an object" in excinfo.value.errors
+
+
+def test_snapshot_is_reused_until_source_changes(catalog_files, tmp_path):
+    source = str(tmp_path / 'careers.json')
+    snapshot = str(tmp_path / 'careers.pickle')
+    with open(catalog_files['json'], encoding='utf-8') as f:
+        careers = json.load(f)
+    save_catalog_json(source, careers)
+
+    first = load_catalog(source, snapshot, snapshot_secret='secret')
+    assert load_snapshot(snapshot, source, 'secret') == first
+
+    career_id = next(iter(careers))
+    careers[career_id]['title'] = 'Renamed'
+    save_catalog_json(source, dict(list(careers.items())[:1]))
+    assert load_snapshot(snapshot, source, 'secret') is None
+    assert load_catalog(source, snapshot, snapshot_secret='secret')[career_id]['title'] == 'Renamed'
+
+
+def test_snapshot_signed_with_another_secret_or_tampered_is_ignored(catalog_files, tmp_path):
+    snapshot = tmp_path / 'careers.pickle'
+    careers = load_catalog(catalog_files['json'])
+    save_snapshot(str(snapshot), catalog_files['json'], careers, 'secret')
+    assert load_snapshot(str(snapshot), catalog_files['json'], 'other') is None
+
+    data = snapshot.read_bytes()
+    snapshot.write_bytes(data[:-1] + bytes([data[-1] ^ 1]))
+    assert load_snapshot(str(snapshot), catalog_files['json'], 'secret') is None
+
+
+def test_snapshot_requires_a_secret(catalog_files, tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'CAREER_CATALOG_SNAPSHOT_SECRET', None)
+    with pytest.raises(ValueError):
+        load_catalog(catalog_files['json'], str(tmp_path / 'careers.pickle'))
+
+
+def test_concurrent_snapshot_writers_all_succeed(catalog_files, tmp_path):
+    snapshot = str(tmp_path / 'careers.pickle')
+    careers = load_catalog(catalog_files['json'])
+    errors = []
+
+    def write():
+        try:
+            save_snapshot(snapshot, catalog_files['json'], careers, 'secret')
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert [entry.name for entry in tmp_path.iterdir()] == ['careers.pickle']
+    assert load_snapshot(snapshot, catalog_files['json'], 'secret') == careers
+
+
+def test_missing_sqlite_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_catalog(str(tmp_path / 'missing.db'))
+    assert not (tmp_path / 'missing.db').exists()
+
+
+def test_unsupported_source_raises():
+    with pytest.raises(ValueError):
+        load_catalog('careers.csv')
@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from components.catalog_manager import CatalogManager
+from data.career_database import CareerDatabase
+from data.catalog_loader import save_catalog_json
+from utils.result_cache import ResultCache
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    path = tmp_path / 'careers.json'
+    save_catalog_json(str(path), CareerDatabase(source='').get_all_careers())
+    return path
+
+
+@pytest.fixture
+def manager(catalog_path):
+    return CatalogManager(catalog_source=str(catalog_path), trait_mappings_source='', snapshot_path='')
+
+
+def rewrite(catalog_path, update):
+    careers = json.loads(catalog_path.read_text(encoding='utf-8'))
+    update(careers)
+    catalog_path.write_text(json.dumps(careers), encoding='utf-8')
+
+
+def test_reload_swaps_in_a_new_snapshot(manager, catalog_path):
+    old_snapshot = manager.snapshot
+    rewrite(catalog_path, lambda careers: careers['teacher'].update(title='Educator'))
+
+    new_snapshot = manager.reload_if_changed()
+    assert new_snapshot is manager.snapshot
+    assert new_snapshot.generation == old_snapshot.generation + 1
+    assert new_snapshot.version != old_snapshot.version
+    assert manager.get_matcher().career_db.get_career('teacher')['title'] == 'Educator'
+    assert manager.last_error is None
+    # The old snapshot still serves requests that started on it
+    assert old_snapshot.career_matcher.career_db.get_career('teacher')['title'] == 'Teacher'
+    assert manager.reload_if_changed() is None
+
+
+def test_failed_reload_keeps_the_old_snapshot(manager, catalog_path):
+    old_snapshot = manager.snapshot
+    swaps = []
+    manager.add_listener(lambda old, new: swaps.append(new))
+    rewrite(catalog_path, lambda careers: careers['teacher'].pop('title'))
+
+    assert manager.reload() is old_snapshot
+    assert manager.snapshot is old_snapshot
+    assert 'missing required field' in str(manager.last_error)
+    assert swaps == []
+
+    rewrite(catalog_path, lambda careers: careers['teacher'].update(title='Teacher'))
+    assert manager.reload() is manager.snapshot is not old_snapshot
+    assert manager.last_error is None
+
+
+def test_listeners_are_told_about_swaps_and_drop_stale_results(manager, catalog_path):
+    cache = ResultCache(max_entries=8, ttl=None)
+    swaps = []
+
+    def on_swap(old_snapshot, new_snapshot):
+        swaps.append((old_snapshot, new_snapshot))
+        if new_snapshot.version != old_snapshot.version:
+            cache.clear()
+
+    manager.add_listener(on_swap)
+    cache.set(ResultCache.make_key({'answers': 1}, manager.snapshot.version), 'result')
+
+    old_snapshot = manager.snapshot
+    manager.reload()  # Same sources, same version: cached results stay valid
+    assert swaps == [(old_snapshot, manager.snapshot)]
+    assert cache.get_stats()['size'] == 1
+
+    rewrite(catalog_path, lambda careers: careers.pop('nurse'))
+    manager.reload()
+    assert len(swaps) == 2 and swaps[1][1] is manager.snapshot
+    assert cache.get_stats()['size'] == 0
+
+
+def test_background_reload_swaps_when_done(manager, catalog_path):
+    rewrite(catalog_path, lambda careers: careers.pop('nurse'))
+    manager.reload(background=True).join()
+    assert 'nurse' not in manager.get_matcher().career_db.get_all_careers()
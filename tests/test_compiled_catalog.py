@@ -0,0 +1,122 @@
+import json
+import threading
+
+import pytest
+
+from components.career_matcher import CareerMatcher
+from data.career_database import CareerDatabase
+from data.catalog_loader import load_catalog
+from data.compiled_catalog import CompiledCareerStore, write_compiled_catalog
+from data.records import record_to_json
+from test_match_equivalence import random_profiles
+
+
+@pytest.fixture(scope='module')
+def builtin_db():
+    return CareerDatabase(source='')
+
+
+@pytest.fixture(scope='module')
+def compiled_path(builtin_db, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('catalogs') / 'careers.catalog')
+    write_compiled_catalog(path, builtin_db, CareerMatcher(career_db=builtin_db).matching_engine)
+    return path
+
+
+def as_json(careers):
+    return json.dumps(dict(careers), default=record_to_json, sort_keys=True)
+
+
+def test_compiled_catalog_matches_builtin_catalog(builtin_db, compiled_path):
+    careers = CareerDatabase(source=compiled_path).get_all_careers()
+    assert list(careers) == list(builtin_db.get_all_careers())
+    assert as_json(careers) == as_json(builtin_db.get_all_careers())
+
+
+def test_compiled_matrices_match_engine(builtin_db, compiled_path):
+    expected = CareerMatcher(career_db=builtin_db).matching_engine
+    engine = CareerMatcher(career_db=CareerDatabase(source=compiled_path)).matching_engine
+    assert engine.catalog_version == expected.catalog_version
+    assert (engine.trait_weights == expected.trait_weights).all()
+    assert (engine.required_levels == expected.required_levels).all()
+
+
+def test_rows_decode_only_selected_records(builtin_db, compiled_path):
+    career_ids = list(builtin_db.get_all_careers())
+    rows = [3, 0, len(career_ids) - 1]
+    careers = load_catalog(compiled_path, rows=rows)
+    assert list(careers) == [career_ids[row] for row in rows]
+    assert as_json(careers) == as_json({career_id: builtin_db.get_career(career_id) for career_id in careers})
+
+
+def test_store_links_compiled_catalog_only_when_whole(compiled_path):
+    careers = load_catalog(compiled_path)
+    assert isinstance(careers, CompiledCareerStore)
+    assert careers.compiled_catalog is not None
+    assert load_catalog(compiled_path, rows=[0, 1]).compiled_catalog is None
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / 'bogus.catalog'
+    path.write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError):
+        load_catalog(str(path))
+
+
+def test_records_are_decoded_on_demand_into_a_bounded_cache(builtin_db, compiled_path):
+    careers = CompiledCareerStore(load_catalog(compiled_path).compiled_catalog, cache_size=2)
+    assert not isinstance(careers, dict)
+    for career_id in careers:
+        assert as_json({career_id: careers[career_id]}) == as_json({career_id: builtin_db.get_career(career_id)})
+        assert len(careers._cache) <= 2
+    assert list(careers._cache) == list(builtin_db.get_all_careers())[-2:]
+
+
+def test_titles_and_categories_come_from_their_columns(builtin_db, compiled_path):
+    careers = load_catalog(compiled_path)
+    for career_id, career in builtin_db.get_all_careers().items():
+        assert careers.title(career_id) == career['title']
+        assert careers.category(career_id) == career['category']
+    assert len(careers._cache) == 0
+
+
+def test_search_by_category_decodes_only_the_results(builtin_db, compiled_path):
+    db = CareerDatabase(source=compiled_path)
+    db.careers._cache.clear()  # Building the database's own tables reads every record once
+    results = db.search_careers(category='technology')
+    assert list(results) == list(builtin_db.search_careers(category='technology'))
+    assert set(db.careers._cache) == set(results)
+
+
+def test_full_scan_matches_builtin_catalog(builtin_db, compiled_path):
+    expected = CareerMatcher(career_db=builtin_db)
+    matcher = CareerMatcher(career_db=CareerDatabase(source=compiled_path))
+    matcher.career_db.careers._cache.clear()
+    for personality, processed_data in random_profiles(expected, 5, seed=16):
+        scores = {career_id: match['match_score']
+                  for career_id, match in matcher.calculate_career_matches(personality, processed_data).items()}
+        assert scores == {career_id: match['match_score']
+                          for career_id, match in expected.calculate_career_matches(personality, processed_data).items()}
+    assert len(matcher.career_db.careers._cache) == 0
+
+
+def test_concurrent_writers_leave_one_complete_file(builtin_db, tmp_path):
+    path = str(tmp_path / 'careers.catalog')
+    engine = CareerMatcher(career_db=builtin_db).matching_engine
+    errors = []
+
+    def write():
+        try:
+            write_compiled_catalog(path, builtin_db, engine)
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert [entry.name for entry in tmp_path.iterdir()] == ['careers.catalog']
+    assert list(load_catalog(path)) == list(builtin_db.get_all_careers())
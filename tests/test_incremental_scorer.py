@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from components.career_matcher import CareerMatcher
+from components.incremental_scorer import IncrementalScorer
+
+RESPONSES = ['strongly_agree', 'agree', 'neutral', 'disagree', 'strongly_disagree', 5, 4, 3, 2, 1]
+QUESTION_IDS = [str(question_id) for question_id in range(20)]
+
+
+@pytest.fixture(scope='module')
+def matcher():
+    return CareerMatcher()
+
+
+def full_rescore(matcher, processed_data):
+    personality_profile = matcher.analyze_personality(processed_data)
+    return personality_profile, matcher.calculate_career_matches(personality_profile, processed_data)
+
+
+def test_updates_match_a_full_rescore(matcher):
+    rng = random.Random(1)
+    for trial in range(15):
+        question_ids = list(QUESTION_IDS)
+        rng.shuffle(question_ids)
+        responses = {question_id: rng.choice(RESPONSES) for question_id in question_ids}
+        processed_data = {
+            'responses': responses,
+            'skills': matcher.skills_mapping.calculate_skill_scores(responses),
+            'interests': rng.sample(['technology', 'data', 'art', 'business', 'helping people'], 2),
+            'values': ['innovation', 'stability'][:rng.randint(0, 2)],
+            'work_style': {'collaborative': 4} if trial % 2 else {}
+        }
+        scorer = IncrementalScorer(matcher, processed_data)
+
+        for _ in range(8):
+            before = scorer.get_match_scores()
+            question_id, response = rng.choice(QUESTION_IDS), rng.choice(RESPONSES)
+            changed = scorer.update_answer(question_id, response)
+            responses[question_id] = response
+
+            full = dict(processed_data, responses=dict(responses),
+                        skills=matcher.skills_mapping.calculate_skill_scores(responses))
+            personality_profile, expected = full_rescore(matcher, full)
+            scores = scorer.get_match_scores()
+
+            assert scorer.personality_scores == personality_profile['scores']
+            assert scorer.skill_scores == full['skills']
+            assert set(changed) == {career_id for career_id in scores if scores[career_id] != before[career_id]}
+            matches = scorer.get_career_matches()
+            assert list(matches) == list(expected)
+            for career_id, match in expected.items():
+                assert matches[career_id]['match_score'] == match['match_score']
+
+
+def test_initial_skills_come_from_processed_data(matcher):
+    processed_data = {'responses': {'0': 'agree'}, 'skills': {'python': 0.9}}
+    scorer = IncrementalScorer(matcher, processed_data)
+    assert scorer.skill_scores == {'python': 0.9}
+
+    _, expected = full_rescore(matcher, processed_data)
+    scores = scorer.get_match_scores()
+    for career_id, match in expected.items():
+        assert scores[career_id] == match['match_score']
+
+
+def test_int_and_str_question_ids_are_the_same_question(matcher):
+    rng = random.Random(2)
+    responses = {question_id: rng.choice(RESPONSES) for question_id in QUESTION_IDS}
+    processed_data = {'responses': dict(responses), 'skills': matcher.skills_mapping.calculate_skill_scores(responses)}
+    scorer = IncrementalScorer(matcher, processed_data)
+
+    for _ in range(10):
+        question_id, response = rng.choice(QUESTION_IDS), rng.choice(RESPONSES)
+        scorer.update_answer(int(question_id) if rng.random() < 0.5 else question_id, response)
+        responses[question_id] = response
+
+        full = dict(processed_data, responses=dict(responses),
+                    skills=matcher.skills_mapping.calculate_skill_scores(responses))
+        personality_profile, expected = full_rescore(matcher, full)
+        assert scorer.responses == responses
+        assert scorer.personality_scores == personality_profile['scores']
+        assert scorer.skill_scores == full['skills']
+        scores = scorer.get_match_scores()
+        for career_id, match in expected.items():
+            assert scores[career_id] == match['match_score']
@@ -0,0 +1,338 @@
+"""Compiled matching must score exactly like the original per-career loops"""
+import random
+
+import numpy as np
+import pytest
+
+from components.career_matcher import CareerMatcher
+
+RESPONSES = ['strongly_agree', 'agree', 'neutral', 'disagree', 'strongly_disagree', 5, 4, 3, 2, 1]
+INTERESTS = ['technology', 'data', 'art', 'business', 'helping people', 'programming', 'research', 'design']
+VALUES = ['innovation', 'stability', 'growth', 'learning', 'security', 'service', 'creativity']
+STYLES = ['independent', 'collaborative', 'structured', 'flexible', 'fast_paced']
+
+
+# ---------- Reference: the original per-career scoring ----------
+
+TRAIT_IMPORTANCE = {
+    'conscientiousness': 1.2, 'openness': 1.1, 'extraversion': 1.0, 'agreeableness': 1.0, 'neuroticism': 0.9
+}
+SKILL_RELATIONS = {
+    'python': ['programming', 'coding', 'software development'],
+    'javascript': ['web development', 'frontend', 'programming'],
+    'communication': ['presentation', 'writing', 'interpersonal'],
+    'leadership': ['management', 'team lead', 'supervision'],
+    'analytics': ['analysis', 'data analysis', 'statistics'],
+    'design': ['creative', 'visual design', 'ui/ux'],
+    'problem solving': ['critical thinking', 'analytical', 'troubleshooting']
+}
+INTEREST_CATEGORIES = {
+    'technology': ['programming', 'computers', 'software', 'digital'],
+    'creative': ['art', 'design', 'writing', 'music', 'innovation'],
+    'people': ['helping', 'teaching', 'healthcare', 'social'],
+    'business': ['finance', 'marketing', 'sales', 'entrepreneurship'],
+    'science': ['research', 'analysis', 'experiments', 'data']
+}
+VALUE_WEIGHTS = {
+    'helping_others': 1.2, 'stability': 1.1, 'growth': 1.1, 'creativity': 1.0,
+    'innovation': 1.0, 'flexibility': 0.9, 'achievement': 1.0, 'collaboration': 0.9
+}
+VALUE_RELATIONS = {
+    'helping_others': ['service', 'impact', 'social_good'],
+    'stability': ['security', 'predictability', 'steady_income'],
+    'growth': ['advancement', 'learning', 'development'],
+    'creativity': ['innovation', 'artistic', 'original'],
+    'flexibility': ['work_life_balance', 'autonomy', 'freedom']
+}
+STYLE_FACTORS = ['independent', 'collaborative', 'structured', 'flexible',
+                 'detail_oriented', 'big_picture', 'fast_paced', 'methodical']
+MATCHING_WEIGHTS = {'personality': 0.35, 'skills': 0.25, 'interests': 0.20, 'values': 0.15, 'work_style': 0.05}
+
+
+QUESTION_TRAITS = {
+    '0': {'openness': 0.3, 'conscientiousness': 0.2}, '1': {'conscientiousness': 0.4, 'openness': 0.3},
+    '2': {'openness': 0.6, 'extraversion': 0.1}, '3': {'extraversion': 0.5, 'agreeableness': 0.3},
+    '4': {'agreeableness': 0.5, 'conscientiousness': 0.2}, '5': {'extraversion': -0.4, 'conscientiousness': 0.2},
+    '6': {'openness': 0.2, 'extraversion': 0.1}, '7': {'conscientiousness': 0.3, 'neuroticism': 0.2},
+    '8': {'extraversion': 0.3, 'agreeableness': 0.2}, '9': {'extraversion': 0.6, 'agreeableness': 0.3},
+    '10': {'conscientiousness': 0.4, 'neuroticism': 0.2}, '11': {'openness': 0.5, 'conscientiousness': 0.2},
+    '12': {'agreeableness': 0.4, 'extraversion': 0.3}, '13': {'neuroticism': 0.4, 'conscientiousness': 0.2},
+    '14': {'openness': 0.4, 'extraversion': 0.2}, '15': {'conscientiousness': 0.5, 'neuroticism': 0.2},
+    '16': {'extraversion': 0.5, 'agreeableness': 0.2}, '17': {'openness': 0.3, 'conscientiousness': 0.4},
+    '18': {'agreeableness': 0.5, 'extraversion': 0.2}, '19': {'conscientiousness': 0.4, 'openness': 0.2}
+}
+RESPONSE_VALUES = {'strongly_disagree': 1, 'disagree': 2, 'neutral': 3, 'agree': 4, 'strongly_agree': 5}
+
+
+def reference_personality_scores(responses):
+    trait_scores = dict.fromkeys(['openness', 'conscientiousness', 'extraversion', 'agreeableness', 'neuroticism'], 0)
+    for question_id, response in responses.items():
+        for trait, weight in QUESTION_TRAITS.get(str(question_id), {}).items():
+            trait_scores[trait] += (RESPONSE_VALUES.get(response, 3) - 3) * weight
+    return {trait: max(0, min(1, (score + 2.0) / 4.0)) for trait, score in trait_scores.items()}
+
+
+def reference_personality_match(career_traits, user_personality):
+    if not career_traits:
+        return 0.5
+    total_match = total_weight = 0
+    for trait, required_level in career_traits.items():
+        difference = abs(user_personality.get(trait, 0.5) - required_level)
+        if difference <= 0.1:
+            trait_match = 1.0
+        elif difference <= 0.2:
+            trait_match = 0.8
+        elif difference <= 0.4:
+            trait_match = 0.6
+        else:
+            trait_match = max(0.2, 1 - difference)
+        weight = TRAIT_IMPORTANCE.get(trait, 1.0)
+        total_match += trait_match * weight
+        total_weight += weight
+    return total_match / total_weight if total_weight > 0 else 0.5
+
+
+def reference_skills_related(skill1, skill2):
+    if skill1 == skill2 or skill1 in skill2 or skill2 in skill1:
+        return True
+    for base_skill, related in SKILL_RELATIONS.items():
+        if base_skill in skill1 and any(rel in skill2 for rel in related):
+            return True
+        if base_skill in skill2 and any(rel in skill1 for rel in related):
+            return True
+    return False
+
+
+def reference_skills_match(required_skills, user_skills):
+    if not required_skills:
+        return 0.5
+    total_match = matched_skills = 0
+    for required_skill in required_skills:
+        best_match = 0
+        skill_lower = required_skill.lower()
+        for user_skill, proficiency in user_skills.items():
+            user_lower = user_skill.lower()
+            if reference_skills_related(skill_lower, user_lower):
+                if skill_lower == user_lower:
+                    similarity = 1.0
+                elif skill_lower in user_lower or user_lower in skill_lower:
+                    similarity = 0.8
+                else:
+                    similarity = 0.6
+                best_match = max(best_match, similarity * proficiency)
+        total_match += best_match
+        if best_match > 0.3:
+            matched_skills += 1
+    return min(1.0, total_match / len(required_skills) + matched_skills / len(required_skills) * 0.2)
+
+
+def reference_interests_match(career_interests, user_interests):
+    if not career_interests or not user_interests:
+        return 0.5
+    direct_matches = len(set(career_interests) & set(user_interests))
+    related_matches = 0
+    for keywords in INTEREST_CATEGORIES.values():
+        if (any(keyword in ' '.join(career_interests) for keyword in keywords)
+                and any(keyword in ' '.join(user_interests) for keyword in keywords)):
+            related_matches += 0.5
+    return min(1.0, (direct_matches + related_matches) / len(career_interests))
+
+
+def reference_values_match(career_values, user_values):
+    if not career_values or not user_values:
+        return 0.5
+    total_match = total_weight = 0
+    for career_value in career_values:
+        weight = VALUE_WEIGHTS.get(career_value, 1.0)
+        if career_value in user_values:
+            total_match += 1.0 * weight
+        elif any(user_value in VALUE_RELATIONS.get(career_value, []) for user_value in user_values):
+            total_match += 0.7 * weight
+        total_weight += weight
+    return total_match / total_weight
+
+
+def reference_work_style_match(career_work_style, user_work_style):
+    if not career_work_style or not user_work_style:
+        return 0.5
+    match_score = total_factors = 0
+    for factor in STYLE_FACTORS:
+        if factor in career_work_style and factor in user_work_style:
+            # Both levels were read from the user's map
+            match_score += 1 - abs(user_work_style.get(factor, 0.5) - user_work_style.get(factor, 0.5))
+            total_factors += 1
+    return match_score / total_factors if total_factors > 0 else 0.5
+
+
+def reference_match(career_id, career_info, career_traits, personality_scores, skill_scores,
+                    interests, values, work_style):
+    matches = {
+        'personality': reference_personality_match(career_traits, personality_scores),
+        'skills': reference_skills_match(career_info.get('skills_required', []), skill_scores),
+        'interests': reference_interests_match(career_info.get('interests', []), interests),
+        'values': reference_values_match(career_info.get('values', []), values),
+        'work_style': reference_work_style_match(career_info.get('work_style', []), work_style)
+    }
+    weights = dict(MATCHING_WEIGHTS)
+    if matches['personality'] > 0.8:
+        weights['personality'] += 0.1
+        weights['skills'] -= 0.05
+        weights['interests'] -= 0.05
+    if matches['skills'] > 0.8:
+        weights['skills'] += 0.1
+        weights['personality'] -= 0.05
+        weights['values'] -= 0.05
+    total_weight = sum(weights.values())
+    total = sum(matches[key] * weights[key] / total_weight for key in
+                ('personality', 'skills', 'interests', 'values', 'work_style'))
+
+    bonus = 0
+    growth_outlook = career_info.get('growth_outlook', '').lower()
+    if 'excellent' in growth_outlook:
+        bonus += 0.05
+    elif 'good' in growth_outlook:
+        bonus += 0.02
+    required_skills = [s.lower() for s in career_info.get('skills_required', [])]
+    for skill in ['python', 'machine learning', 'data analysis', 'digital marketing', 'project management']:
+        if any(skill in req for req in required_skills) and skill.replace(' ', '_') in skill_scores:
+            bonus += 0.02
+    salary_range = career_info.get('salary_range', {})
+    if salary_range and salary_range.get('senior', (0, 0))[1] > 150000:
+        bonus += 0.03
+    return min(1.0, max(0.0, total + bonus))
+
+
+# ---------- Tests ----------
+
+@pytest.fixture(scope='module')
+def matcher():
+    return CareerMatcher()
+
+
+def random_profiles(matcher, count, seed):
+    rng = random.Random(seed)
+    profiles = []
+    for _ in range(count):
+        responses = {str(q): rng.choice(RESPONSES) for q in rng.sample(range(30), 20)}
+        processed_data = {
+            'responses': responses,
+            'skills': matcher.skills_mapping.calculate_skill_scores(responses),
+            'interests': rng.sample(INTERESTS, rng.randint(0, 3)),
+            'values': rng.sample(VALUES, rng.randint(0, 3)),
+            'work_style': {style: rng.randint(1, 5) for style in rng.sample(STYLES, rng.randint(0, 2))}
+        }
+        profiles.append((matcher.analyze_personality(processed_data), processed_data))
+    return profiles
+
+
+def reference_scores(matcher, personality_profile, processed_data):
+    return {
+        career_id: reference_match(
+            career_id, career_info, matcher.personality_traits.career_trait_mappings.get(career_id, {}),
+            personality_profile['scores'], processed_data['skills'], processed_data['interests'],
+            processed_data['values'], processed_data['work_style']
+        )
+        for career_id, career_info in matcher.career_db.get_all_careers().items()
+    }
+
+
+def test_personality_scores_match_reference_exactly(matcher):
+    # Trait sums run in answer order, as the original loop adds them
+    for personality_profile, processed_data in random_profiles(matcher, 200, seed=4):
+        assert personality_profile['scores'] == reference_personality_scores(processed_data['responses'])
+
+
+def test_full_scan_matches_reference(matcher):
+    for personality_profile, processed_data in random_profiles(matcher, 60, seed=1):
+        expected = reference_scores(matcher, personality_profile, processed_data)
+        matches = matcher.calculate_career_matches(personality_profile, processed_data)
+
+        assert set(matches) == {career_id for career_id, score in expected.items()
+                                if score > matcher.min_match_score}
+        for career_id, match in matches.items():
+            assert match['match_score'] == pytest.approx(expected[career_id], abs=1e-12)
+
+
+def test_top_k_matches_reference_order(matcher):
+    for personality_profile, processed_data in random_profiles(matcher, 60, seed=2):
+        full = matcher.calculate_career_matches(personality_profile, processed_data)
+        ranked = sorted(full, key=lambda career_id: full[career_id]['match_score'], reverse=True)
+        top = matcher.calculate_career_matches(personality_profile, processed_data, top_k=3)
+
+        assert list(top) == ranked[:3]
+        for career_id in top:
+            assert top[career_id]['match_score'] == full[career_id]['match_score']
+
+
+def count_full_scores(matcher, monkeypatch):
+    calls = []
+    calculate = matcher._calculate_individual_match
+
+    def counting(*args, **kwargs):
+        calls.append(args[0])
+        return calculate(*args, **kwargs)
+
+    monkeypatch.setattr(matcher, '_calculate_individual_match', counting)
+    return calls
+
+
+@pytest.mark.parametrize('top_k', [1, 3])
+def test_top_k_fully_scores_only_the_selected_careers(matcher, monkeypatch, top_k):
+    profiles = random_profiles(matcher, 30, seed=5)
+    calls = count_full_scores(matcher, monkeypatch)
+    for personality_profile, processed_data in profiles:
+        del calls[:]
+        top = matcher.calculate_career_matches(personality_profile, processed_data, top_k=top_k)
+        assert sorted(calls) == sorted(top)
+
+
+def test_top_k_prunes_a_large_catalog(synthetic_matcher, monkeypatch):
+    profiles = random_profiles(synthetic_matcher, 10, seed=6)
+    rankings = []
+    for personality_profile, processed_data in profiles:
+        full = synthetic_matcher.calculate_career_matches(personality_profile, processed_data)
+        ranked = sorted(full, key=lambda career_id: full[career_id]['match_score'], reverse=True)
+        rankings.append([(career_id, full[career_id]['match_score']) for career_id in ranked[:10]])
+
+    calls = count_full_scores(synthetic_matcher, monkeypatch)
+    for (personality_profile, processed_data), expected in zip(profiles, rankings):
+        del calls[:]
+        top = synthetic_matcher.calculate_career_matches(personality_profile, processed_data, top_k=10)
+        assert [(career_id, match['match_score']) for career_id, match in top.items()] == expected
+        assert len(calls) < 20  # Out of 1000; only careers tied with the k-th best are scored beyond k
+
+
+def test_top_k_bounds_equal_full_scores(synthetic_matcher):
+    engine = synthetic_matcher.matching_engine
+    candidates = np.arange(len(engine.career_ids))
+    for personality_profile, processed_data in random_profiles(synthetic_matcher, 10, seed=7):
+        skill_scores = processed_data['skills']
+        bounds = synthetic_matcher._calculate_match_upper_bounds(
+            candidates,
+            engine.personality_matches(personality_profile['scores'], candidates),
+            synthetic_matcher.skill_matrix.skills_matches(
+                synthetic_matcher.skill_index.best_matches(skill_scores), candidates
+            ),
+            synthetic_matcher.match_bitsets.encode_user(
+                processed_data['interests'], processed_data['values'], processed_data['work_style']
+            ),
+            skill_scores
+        )
+        scores = [
+            synthetic_matcher._calculate_individual_match(
+                career_id, synthetic_matcher.career_db.get_career(career_id), personality_profile,
+                skill_scores, processed_data['interests'], processed_data['values'], processed_data['work_style']
+            )
+            for career_id in engine.career_ids
+        ]
+        assert bounds.tolist() == scores
+
+
+def test_batch_scores_match_per_respondent_scores(matcher):
+    profiles = random_profiles(matcher, 20, seed=3)
+    batch = matcher.calculate_batch_matches([p for p, _ in profiles], [d for _, d in profiles], top_k=3)
+
+    for row, (personality_profile, processed_data) in enumerate(profiles):
+        expected = reference_scores(matcher, personality_profile, processed_data)
+        for column, career_id in enumerate(batch['career_ids']):
+            assert batch['scores'][row, column] == pytest.approx(expected[career_id], abs=1e-12)
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from components.career_matcher import CareerMatcher
+
+
+@pytest.fixture(scope='module')
+def engine():
+    return CareerMatcher().matching_engine
+
+
+def test_top_k_indices_orders_best_first_with_ties_in_catalog_order(engine):
+    scores = np.array([0.2, 0.9, 0.5, 0.9, 0.7])
+    assert engine.top_k_indices(scores, 3).tolist() == [1, 3, 4]
+    assert engine.top_k_indices(scores, 10, threshold=0.5).tolist() == [1, 3, 4]
+
+
+@pytest.mark.parametrize('k', [0, -1, -5])
+def test_top_k_indices_returns_nothing_for_non_positive_k(engine, k):
+    result = engine.top_k_indices(np.array([0.2, 0.9, 0.5]), k)
+    assert result.shape == (0,)
+
+
+def test_top_k_career_matches_with_zero_k_are_empty():
+    matcher = CareerMatcher()
+    processed_data = {'responses': {'0': 'agree'}, 'skills': {}, 'interests': [], 'values': [], 'work_style': {}}
+    personality_profile = matcher.analyze_personality(processed_data)
+    assert matcher.calculate_career_matches(personality_profile, processed_data, top_k=0) == {}
+    batch = matcher.calculate_batch_matches([personality_profile], [processed_data], top_k=0)
+    assert batch['top_matches'] == [[]]
@@ -0,0 +1,77 @@
+import random
+
+import numpy as np
+import pytest
+
+from components.questionnaire import QuestionnaireManager
+from data.personality_traits import PersonalityTraits
+
+RESPONSES = ['strongly_agree', 'agree', 'neutral', 'disagree', 'strongly_disagree', 5, 3, 1, 'unknown']
+
+
+@pytest.fixture(scope='module')
+def traits():
+    return PersonalityTraits('')
+
+
+def random_responses(count, seed):
+    rng = random.Random(seed)
+    return [
+        {rng.choice([str(q), q]): rng.choice(RESPONSES) for q in rng.sample(range(25), rng.randint(0, 20))}
+        for _ in range(count)
+    ]
+
+
+def test_batch_scores_equal_single_scores(traits):
+    batch = random_responses(100, seed=21)
+    scores = traits.calculate_personality_scores_batch(*traits.encode_responses(batch))
+    assert scores.shape == (len(batch), len(traits.traits))
+    for responses, row in zip(batch, scores):
+        assert dict(zip(traits.traits, row.tolist())) == traits.calculate_personality_scores(responses)
+
+
+@pytest.mark.parametrize('batch', [[], [{}, {}], [{'99': 'agree'}]])
+def test_batch_without_mapped_answers_is_neutral(traits, batch):
+    scores = traits.calculate_personality_scores_batch(*traits.encode_responses(batch))
+    assert scores.shape == (len(batch), len(traits.traits))
+    assert np.all(scores == 0.5)
+
+
+def questions_for(mapping):
+    """Questionnaire-style questions, one per (question, trait), that encode a trait mapping"""
+    return [
+        {'id': int(question_id), 'trait': trait, 'weight': abs(weight), 'reverse_scored': weight < 0}
+        for question_id, weights in mapping.items() for trait, weight in weights.items()
+    ]
+
+
+def test_mapping_from_questions_matches_the_built_in_mapping(traits):
+    built_in = traits._initialize_question_trait_mapping()
+    assert PersonalityTraits.question_trait_mapping_from_questions(questions_for(built_in)) == built_in
+
+    derived = PersonalityTraits('', questions=questions_for(built_in))
+    for responses in random_responses(50, seed=22):
+        assert derived.calculate_personality_scores(responses) == traits.calculate_personality_scores(responses)
+
+
+def test_mapping_from_questions_skips_questions_without_a_trait():
+    questions = [
+        {'id': 0, 'trait': 'openness'},
+        {'id': 1, 'trait': 'neuroticism', 'weight': 0.5, 'reverse_scored': True},
+        {'id': 2, 'category': 'interests'}
+    ]
+    assert PersonalityTraits.question_trait_mapping_from_questions(questions) == {
+        '0': {'openness': 1.0}, '1': {'neuroticism': -0.5}
+    }
+
+
+def test_questionnaire_questions_build_a_valid_mapping():
+    questions = QuestionnaireManager().questions
+    mapping = PersonalityTraits.question_trait_mapping_from_questions(questions)
+    assert mapping == {
+        str(question['id']): {question['trait']: -question.get('weight', 1.0) if question.get('reverse_scored')
+                              else question.get('weight', 1.0)}
+        for question in questions if question.get('trait')
+    }
+    scores = PersonalityTraits('', questions=questions).calculate_personality_scores({'0': 'strongly_agree'})
+    assert set(scores) == set(PersonalityTraits('').traits)
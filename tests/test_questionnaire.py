@@ -0,0 +1,36 @@
+import pytest
+
+from components.questionnaire import QuestionnaireManager
+
+
+@pytest.fixture(scope='module')
+def manager():
+    return QuestionnaireManager()
+
+
+def test_get_question_returns_the_shared_read_only_view(manager):
+    question = manager.get_question(0)
+    assert manager.get_question(0) is question
+    with pytest.raises(TypeError):
+        question['question'] = 'Changed'
+    with pytest.raises(TypeError):
+        question['category_info']['name'] = 'Changed'
+    with pytest.raises(TypeError):
+        question['progress_info']['overall_progress'] = 0
+    with pytest.raises(TypeError):
+        manager.question_bank[0] = {}
+
+
+def test_get_question_keeps_its_metadata(manager):
+    total = manager.get_total_questions()
+    for question in manager.questions:
+        view = manager.get_question(question['id'])
+        assert {key: view[key] for key in question} == dict(question)
+        assert dict(view['category_info']) == manager.get_category_info(question['category'])
+        assert view['progress_info']['overall_progress'] == (question['id'] + 1) / total * 100
+        assert view['progress_info']['questions_remaining'] == total - question['id'] - 1
+
+
+def test_unknown_question_raises_value_error(manager):
+    with pytest.raises(ValueError):
+        manager.get_question(10_000)
@@ -0,0 +1,92 @@
+import threading
+
+import pytest
+
+from config.settings import Config
+from utils.result_cache import ResultCache
+
+
+def test_cached_none_is_a_hit():
+    cache = ResultCache(max_entries=4, ttl=None)
+    calls = []
+    assert cache.get_or_compute('key', lambda: calls.append(1)) is None
+    assert cache.get_or_compute('key', lambda: calls.append(1)) is None
+    assert calls == [1]
+    assert cache.get_stats()['hits'] == 1
+
+
+def test_values_are_copied_in_and_out():
+    cache = ResultCache(max_entries=4, ttl=None)
+    value = cache.get_or_compute('key', lambda: {'matches': [1]})
+    value['matches'].append(2)
+    cache.get('key')['matches'].append(3)
+    assert cache.get('key') == {'matches': [1]}
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResultCache(max_entries=2, ttl=None)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
+    assert cache.evictions == 1
+
+
+def test_expired_entries_are_misses():
+    cache = ResultCache(max_entries=4, ttl=0)
+    cache.set('key', 1)
+    cache._entries['key'] = (cache._entries['key'][0] - 1, 1)
+    assert cache.get('key', 'missing') == 'missing'
+    assert cache.expirations == 1
+
+
+def test_make_key_sorts_only_unordered_answers():
+    def key(seven, eight):
+        return ResultCache.make_key({'raw': {'7': seven, '8': eight}}, 'v1', unordered_keys=['7'])
+
+    assert key(['b', 'a'], ['b', 'a']) == key(['a', 'b'], ['b', 'a'])
+    assert key(['a', 'b'], ['b', 'a']) != key(['a', 'b'], ['a', 'b'])
+    assert ResultCache.make_key({'x': 1}, 'v1') != ResultCache.make_key({'x': 1}, 'v2')
+
+
+def test_persisted_file_round_trips_with_the_same_secret(tmp_path):
+    path = str(tmp_path / 'results.bin')
+    cache = ResultCache(persist_path=path, secret='secret', save_interval=60)
+    cache.get_or_compute('key', lambda: {'matches': [1]})
+    cache.flush()
+
+    assert ResultCache(persist_path=path, secret='secret').get('key') == {'matches': [1]}
+    assert ResultCache(persist_path=path, secret='other').get('key') is None
+
+
+def test_tampered_file_is_ignored(tmp_path):
+    path = tmp_path / 'results.bin'
+    cache = ResultCache(persist_path=str(path), secret='secret', save_interval=0)
+    cache.get_or_compute('key', lambda: 1)
+
+    data = path.read_bytes()
+    path.write_bytes(data[:-1] + bytes([data[-1] ^ 1]))
+    assert len(ResultCache(persist_path=str(path), secret='secret')._entries) == 0
+
+
+def test_concurrent_saves_leave_one_complete_file(tmp_path):
+    path = str(tmp_path / 'results.bin')
+    cache = ResultCache(persist_path=path, secret='secret', save_interval=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    threads = [threading.Thread(target=cache.save) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(ResultCache(persist_path=path, secret='secret')._entries) == 2
+    assert [entry.name for entry in tmp_path.iterdir()] == ['results.bin']
+
+
+def test_persistence_requires_a_secret(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'RESULT_CACHE_SECRET', None)
+    with pytest.raises(ValueError):
+        ResultCache(persist_path=str(tmp_path / 'results.bin'))
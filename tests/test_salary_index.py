@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from data.career_database import CareerDatabase
+from data.salary_index import SalaryIndex
+
+
+def random_careers(count, seed):
+    rng = random.Random(seed)
+    careers = {}
+    for i in range(count):
+        salary_range = {}
+        for level in rng.sample(['entry', 'mid', 'senior'], rng.randint(0, 3)):
+            low = rng.randrange(30000, 200000, 5000)
+            salary_range[level] = (low, low + rng.randrange(0, 80000, 5000))
+        careers[f'career_{i}'] = {'salary_range': salary_range}
+    return careers
+
+
+def brute_force_overlapping(careers, level, min_salary, max_salary):
+    result = []
+    for career_id, career in careers.items():
+        bounds = career['salary_range'].get(level)
+        if bounds is None:
+            continue
+        low, high = bounds
+        if (max_salary is None or low <= max_salary) and (min_salary is None or high >= min_salary):
+            result.append(career_id)
+    return result
+
+
+def test_overlapping_matches_brute_force():
+    careers = random_careers(300, seed=1)
+    index = SalaryIndex(careers)
+    rng = random.Random(2)
+    for _ in range(200):
+        level = rng.choice(['entry', 'mid', 'senior', 'executive'])
+        min_salary = rng.choice([None, rng.randrange(20000, 250000, 5000)])
+        max_salary = rng.choice([None, rng.randrange(20000, 250000, 5000)])
+        assert index.overlapping(level, min_salary, max_salary) == brute_force_overlapping(
+            careers, level, min_salary, max_salary
+        )
+
+
+def test_band_edges_count_as_overlapping():
+    index = SalaryIndex({'a': {'salary_range': {'mid': (50000, 80000)}}})
+    assert index.overlapping('mid', 80000, None) == ['a']
+    assert index.overlapping('mid', None, 50000) == ['a']
+    assert index.overlapping('mid', 80001, None) == []
+    assert index.overlapping('mid', None, 49999) == []
+
+
+def test_percentile_counts_bands_below_salary():
+    careers = random_careers(200, seed=3)
+    index = SalaryIndex(careers)
+    lows = [career['salary_range']['mid'][0] for career in careers.values() if 'mid' in career['salary_range']]
+    highs = [career['salary_range']['mid'][1] for career in careers.values() if 'mid' in career['salary_range']]
+    for salary in (0, 60000, 100000, 150000, 10 ** 7):
+        assert index.percentile('mid', salary) == pytest.approx(100.0 * sum(low < salary for low in lows) / len(lows))
+        assert index.percentile('mid', salary, bound='high') == pytest.approx(
+            100.0 * sum(high < salary for high in highs) / len(highs)
+        )
+    assert index.percentile('executive', 100000) is None
+
+
+def test_career_database_salary_queries_use_catalog_records():
+    db = CareerDatabase()
+    careers = db.get_all_careers()
+    expected = brute_force_overlapping(careers, 'mid', 90000, 120000)
+    assert list(db.get_careers_by_salary('mid', 90000, 120000)) == expected
+    assert db.get_salary_index() is db.get_salary_index()
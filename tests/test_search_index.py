@@ -0,0 +1,68 @@
+import math
+
+import pytest
+
+from data.career_database import CareerDatabase
+from data.search_index import CareerSearchIndex
+
+CAREERS = {
+    'a': {'title': 'Data Engineer', 'description': 'Builds data pipelines for data teams.',
+          'skills_required': ['Python', 'SQL']},
+    'b': {'title': 'Data Analyst', 'description': 'Reports on data.', 'skills_required': ['SQL', 'Excel']},
+    'c': {'title': 'Software Engineer', 'description': 'Writes software.', 'skills_required': ['Python', 'Algorithms']},
+    'd': {'title': 'Nurse', 'description': 'Cares for patients.', 'skills_required': ['Patient Care']}
+}
+
+
+@pytest.fixture(scope='module')
+def index():
+    return CareerSearchIndex(CAREERS)
+
+
+def bm25(index, token, career_id):
+    document = index.career_ids.index(career_id)
+    count = index.postings[token][document]
+    length_norm = 1 - index.b + index.b * index.document_lengths[document] / index.average_length
+    return index.idf[token] * count * (index.k1 + 1) / (count + index.k1 * length_norm)
+
+
+def test_results_are_ranked_by_bm25(index):
+    results = index.search('data', prefix=False)
+    assert [career_id for career_id, _ in results] == ['a', 'b']
+    for career_id, score in results:
+        assert math.isclose(score, bm25(index, 'data', career_id))
+
+
+def test_ties_keep_catalog_order():
+    careers = {career_id: {'title': 'Welder'} for career_id in ('z', 'y', 'x')}
+    assert [career_id for career_id, _ in CareerSearchIndex(careers).search('welder')] == ['z', 'y', 'x']
+
+
+def test_keywords_combine_with_or_unless_match_all(index):
+    assert {career_id for career_id, _ in index.search(['nurse', 'software'])} == {'c', 'd'}
+    assert index.search(['nurse', 'software'], match_all=True) == []
+    assert [career_id for career_id, _ in index.search(['python', 'sql'], match_all=True)] == ['a']
+    # The words of one keyword must all match, even without match_all
+    assert [career_id for career_id, _ in index.search('data engineer')] == ['a']
+
+
+def test_prefix_terms_match_longer_tokens(index):
+    # The shorter document ranks first for the same term
+    assert [career_id for career_id, _ in index.search('engin')] == ['c', 'a']
+    assert index.search('engin', prefix=False) == []
+    assert index.expand('soft') == ['software']
+    assert index.expand('soft', prefix=False) == []
+
+
+def test_careers_by_skills_counts_overlap(index):
+    assert index.careers_by_skills(['python', 'SQL']) == [('a', 2), ('b', 1), ('c', 1)]
+    assert index.careers_by_skills(['Juggling']) == []
+
+
+def test_database_builds_each_index_once():
+    db = CareerDatabase(source='')
+    assert db.get_search_index() is db.get_search_index()
+    assert db.get_salary_index() is db.get_salary_index()
+    assert db.get_careers_by_skills(['python', 'SQL']) == [
+        ('software_engineer', 2), ('data_scientist', 2), ('financial_analyst', 1)
+    ]
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from components.sharded_matcher import ShardedMatcher
+from test_match_equivalence import random_profiles
+
+
+@pytest.fixture(scope='module')
+def profiles(synthetic_matcher):
+    return random_profiles(synthetic_matcher, 6, seed=10)
+
+
+@pytest.fixture(scope='module')
+def sharded(synthetic_matcher):
+    with ShardedMatcher(synthetic_matcher, max_workers=3, min_shard_size=100) as sharded:
+        yield sharded
+
+
+def batch(matcher, profiles, top_k):
+    personality_profiles, processed_profiles = zip(*profiles)
+    return matcher.calculate_batch_matches(list(personality_profiles), list(processed_profiles), top_k)
+
+
+def test_catalog_is_split_into_contiguous_shards(synthetic_matcher, sharded):
+    assert sharded.is_sharded
+    assert len(sharded.shards) == 3
+    assert np.array_equal(np.concatenate(sharded.shards), np.arange(len(synthetic_matcher.matching_engine.career_ids)))
+
+
+@pytest.mark.parametrize('top_k', [1, 10])
+def test_sharded_batch_equals_in_process_batch(synthetic_matcher, sharded, profiles, top_k):
+    expected = batch(synthetic_matcher, profiles, top_k)
+    result = batch(sharded, profiles, top_k)
+    assert result['career_ids'] == expected['career_ids']
+    assert np.array_equal(result['scores'], expected['scores'])
+    assert result['top_matches'] == expected['top_matches']
+
+
+def test_sharded_batch_equals_per_respondent_matching(synthetic_matcher, sharded, profiles):
+    result = batch(sharded, profiles, 10)
+    for row, (personality_profile, processed_data) in enumerate(profiles):
+        matches = synthetic_matcher.calculate_career_matches(personality_profile, processed_data)
+        scores = dict(zip(result['career_ids'], result['scores'][row].tolist()))
+        assert {career_id: scores[career_id] for career_id in matches} == {
+            career_id: match['match_score'] for career_id, match in matches.items()
+        }
+        top = synthetic_matcher.calculate_career_matches(personality_profile, processed_data, top_k=10)
+        assert result['top_matches'][row] == [(career_id, match['match_score']) for career_id, match in top.items()]
+
+
+def test_small_catalogs_are_scored_in_process(synthetic_matcher, profiles):
+    sharded = ShardedMatcher(synthetic_matcher, max_workers=4, min_shard_size=600)
+    assert not sharded.is_sharded
+    expected = batch(synthetic_matcher, profiles, 5)
+    result = batch(sharded, profiles, 5)
+    assert sharded._executors is None
+    assert np.array_equal(result['scores'], expected['scores'])
+    assert result['top_matches'] == expected['top_matches']
@@ -0,0 +1,94 @@
+"""Compiled skill tables must score exactly like the original dict loops"""
+import random
+
+import numpy as np
+import pytest
+
+from data.skills_mapping import SkillsMapping
+
+RESPONSES = ['strongly_agree', 'agree', 'neutral', 'disagree', 'strongly_disagree', 5, 'unknown']
+
+
+# ---------- Reference: the original dict implementations ----------
+
+def reference_skill_scores(skills_mapping, all_responses):
+    skill_scores = {}
+    for question_id, response in all_responses.items():
+        question_type = skills_mapping._get_question_type(question_id)
+        skills = skills_mapping.response_skill_mappings.get(question_type, {}).get(response, {})
+        for skill, score in skills.items():
+            if skill in skill_scores:
+                skill_scores[skill] = max(skill_scores[skill], score)
+            else:
+                skill_scores[skill] = score
+    return skill_scores
+
+
+def reference_top_skills(skill_scores, top_n=10):
+    return sorted(skill_scores.items(), key=lambda x: x[1], reverse=True)[:top_n]
+
+
+def reference_normalized(skill_scores):
+    if not skill_scores:
+        return {}
+    max_score = max(skill_scores.values())
+    if max_score == 0:
+        return skill_scores
+    return {skill: score / max_score for skill, score in skill_scores.items()}
+
+
+# ---------- Tests ----------
+
+@pytest.fixture(scope='module')
+def skills_mapping():
+    return SkillsMapping()
+
+
+def random_responses(count, seed):
+    rng = random.Random(seed)
+    return [
+        {rng.choice([str(q), q]): rng.choice(RESPONSES) for q in rng.sample(range(10), rng.randint(0, 8))}
+        for _ in range(count)
+    ]
+
+
+def test_skill_scores_keep_reference_values_and_order(skills_mapping):
+    for responses in random_responses(300, seed=22):
+        scores = skills_mapping.calculate_skill_scores(responses)
+        expected = reference_skill_scores(skills_mapping, responses)
+        assert list(scores.items()) == list(expected.items())
+
+
+def test_top_skills_keep_reference_tie_order(skills_mapping):
+    tied = {'a': 0.5, 'b': 0.9, 'c': 0.5, 'd': 0.5, 'e': 0.9, 'f': 0.1}
+    for top_n in range(0, 8):
+        assert skills_mapping.get_top_skills(tied, top_n) == reference_top_skills(tied, top_n)
+    for responses in random_responses(100, seed=23):
+        scores = skills_mapping.calculate_skill_scores(responses)
+        for top_n in (1, 3, 10):
+            assert skills_mapping.get_top_skills(scores, top_n) == reference_top_skills(scores, top_n)
+
+
+def test_normalized_scores_match_reference(skills_mapping):
+    assert skills_mapping.normalize_skill_scores({}) == {}
+    assert skills_mapping.normalize_skill_scores({'a': 0.0, 'b': 0.0}) == {'a': 0.0, 'b': 0.0}
+    for responses in random_responses(100, seed=24):
+        scores = skills_mapping.calculate_skill_scores(responses)
+        normalized = skills_mapping.normalize_skill_scores(scores)
+        assert list(normalized.items()) == list(reference_normalized(scores).items())
+
+
+def test_batch_scores_match_single_scores(skills_mapping):
+    batch = random_responses(50, seed=25)
+    scores = skills_mapping.calculate_skill_scores_batch(*skills_mapping.encode_responses(batch))
+    for responses, row in zip(batch, scores):
+        expected = dict.fromkeys(skills_mapping.skills, 0.0)
+        expected.update(skills_mapping.calculate_skill_scores(responses))
+        assert dict(zip(skills_mapping.skills, row.tolist())) == expected
+
+
+@pytest.mark.parametrize('batch', [[], [{}, {}], [{'99': 'agree'}]])
+def test_batch_without_scored_answers_is_all_zero(skills_mapping, batch):
+    scores = skills_mapping.calculate_skill_scores_batch(*skills_mapping.encode_responses(batch))
+    assert scores.shape == (len(batch), len(skills_mapping.skills))
+    assert not np.any(scores)
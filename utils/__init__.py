@@ -4,10 +4,12 @@ Utility package for CareerConsultant.
 This package provides shared utilities such as:
 - Data processing
 - Recommendation engine logic
+- Result caching for the matching pipeline
 - Helper functions for cross-module use
 """
 
 from .data_processor import DataProcessor
 from .recommendation_engine import RecommendationEngine
+from .result_cache import ResultCache
 
-__all__ = ["DataProcessor", "RecommendationEngine"]
+__all__ = ["DataProcessor", "RecommendationEngine", "ResultCache"]
@@ -0,0 +1,220 @@
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Optional
+import atexit
+import copy
+import hashlib
+import hmac
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+
+from config.settings import Config
+
+_MISSING = object()
+
+
+def _canonicalize(value, unordered_keys, key=None):
+    """JSON-ready copy of value with string keys and the lists under unordered_keys sorted"""
+    if isinstance(value, Mapping):
+        return {str(k): _canonicalize(v, unordered_keys, str(k)) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        items = [_canonicalize(item, unordered_keys) for item in value]
+        if key in unordered_keys:
+            items.sort(key=lambda item: json.dumps(item, sort_keys=True, default=str))
+        return items
+    return value
+
+
+class ResultCache:
+    """Bounded LRU cache with TTL for assessment pipeline results
+
+    Values are copied on the way in and out, so callers may mutate what they
+    get without corrupting the cache. With persist_path set, new results are
+    written to disk in the background at most every save_interval seconds; the
+    file is signed with secret and ignored on load unless the signature matches.
+    """
+
+    def __init__(self, max_entries: int = None, ttl: float = None, persist_path: Optional[str] = None,
+                 secret: Optional[str] = None, save_interval: float = None):
+        self.max_entries = max_entries if max_entries is not None else Config.RESULT_CACHE_SIZE
+        self.ttl = ttl if ttl is not None else Config.CACHE_TIMEOUT
+        self.persist_path = persist_path
+        self.save_interval = save_interval if save_interval is not None else Config.RESULT_CACHE_SAVE_INTERVAL
+        self._entries = OrderedDict()  # key -> (stored_at, value)
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # held across a whole write so saves never interleave
+        self._save_timer = None
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        secret = secret if secret is not None else Config.RESULT_CACHE_SECRET
+        if persist_path and not secret:
+            raise ValueError("A persisted result cache needs a secret (set RESULT_CACHE_SECRET) to sign its file")
+        self._signing_key = secret.encode('utf-8') if secret else None
+
+        if persist_path:
+            if os.path.exists(persist_path):
+                self._load()
+            atexit.register(self.flush)
+
+    @staticmethod
+    def make_key(processed_data: Dict[str, Any], catalog_version: str, unordered_keys: Iterable[str] = ()) -> str:
+        """Canonical hash of processed answers plus the catalog they were scored against
+
+        Lists stored under any key in unordered_keys (e.g. multiple-select
+        answers, whose selection order does not change results) are sorted
+        first, so equivalent answers share a key. Other lists, such as
+        rankings, keep their order.
+        """
+        unordered_keys = {str(key) for key in unordered_keys}
+        canonical = json.dumps(
+            {'answers': _canonicalize(processed_data, unordered_keys), 'catalog_version': catalog_version},
+            sort_keys=True, separators=(',', ':'), default=str
+        )
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a copy of a cached value, or default if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry):
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a copy of value, evicting least recently used entries beyond max_entries"""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing and storing it on a miss"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.set(key, value)
+            if self.persist_path:
+                self._schedule_save()
+        return value
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._dirty = bool(self.persist_path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl': self.ttl
+        }
+
+    # ---------- Persistence ----------
+
+    def save(self) -> None:
+        """Write unexpired entries to persist_path atomically, signed with the cache secret"""
+        if not self.persist_path:
+            return
+        with self._save_lock:
+            with self._lock:
+                entries = [(key, entry) for key, entry in self._entries.items() if not self._is_expired(entry)]
+                self._dirty = False
+                payload = pickle.dumps(entries, protocol=pickle.HIGHEST_PROTOCOL)
+
+            directory = os.path.dirname(os.path.abspath(self.persist_path))
+            os.makedirs(directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=directory, prefix='.result-cache-', delete=False) as f:
+                f.write(self._sign(payload) + payload)
+            try:
+                os.replace(f.name, self.persist_path)
+            except OSError:
+                os.unlink(f.name)
+                raise
+
+    def flush(self) -> None:
+        """Write pending results now instead of waiting for the scheduled save"""
+        with self._lock:
+            timer, self._save_timer = self._save_timer, None
+            dirty = self._dirty
+        if timer is not None:
+            timer.cancel()
+        if dirty:
+            self.save()
+
+    def _schedule_save(self) -> None:
+        """Mark the cache dirty and make sure one save is pending"""
+        if self.save_interval <= 0:
+            self.save()
+            return
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                return
+            timer = self._save_timer = threading.Timer(self.save_interval, self._run_scheduled_save)
+            timer.daemon = True
+        timer.start()
+
+    def _run_scheduled_save(self) -> None:
+        with self._lock:
+            self._save_timer = None
+        self.save()
+
+    def _sign(self, payload: bytes) -> bytes:
+        return hmac.new(self._signing_key, payload, hashlib.sha256).digest()
+
+    def _load(self) -> None:
+        """Load persisted entries, skipping any that have expired since they were saved
+
+        The file is only unpickled when its signature matches the cache secret;
+        an unsigned, tampered or unreadable file is ignored.
+        """
+        try:
+            with open(self.persist_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return
+
+        digest_size = hashlib.sha256().digest_size
+        signature, payload = data[:digest_size], data[digest_size:]
+        if len(signature) != digest_size or not hmac.compare_digest(signature, self._sign(payload)):
+            return
+        try:
+            entries = pickle.loads(payload)
+        except (pickle.UnpicklingError, EOFError):
+            return
+
+        for key, entry in entries[-self.max_entries:]:
+            if not self._is_expired(entry):
+                self._entries[key] = entry
+
+    def _is_expired(self, entry) -> bool:
+        return self.ttl is not None and time.time() - entry[0] > self.ttl